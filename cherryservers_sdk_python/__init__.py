@@ -7,21 +7,57 @@ from cherryservers_sdk_python import (
 from cherryservers_sdk_python import (
     block_storages as block_storages,
 )
+from cherryservers_sdk_python import (
+    bulk as bulk,
+)
+from cherryservers_sdk_python import (
+    cache as cache,
+)
+from cherryservers_sdk_python import (
+    changefeed as changefeed,
+)
+from cherryservers_sdk_python import (
+    circuit_breaker as circuit_breaker,
+)
+from cherryservers_sdk_python import (
+    deadlines as deadlines,
+)
+from cherryservers_sdk_python import (
+    dryrun as dryrun,
+)
+from cherryservers_sdk_python import (
+    errors as errors,
+)
 from cherryservers_sdk_python import (
     facade as facade,
 )
+from cherryservers_sdk_python import (
+    fake_api as fake_api,
+)
+from cherryservers_sdk_python import (
+    hedging as hedging,
+)
 from cherryservers_sdk_python import (
     images as images,
 )
+from cherryservers_sdk_python import (
+    inventory as inventory,
+)
 from cherryservers_sdk_python import (
     ips as ips,
 )
+from cherryservers_sdk_python import (
+    operations as operations,
+)
 from cherryservers_sdk_python import (
     plans as plans,
 )
 from cherryservers_sdk_python import (
     projects as projects,
 )
+from cherryservers_sdk_python import (
+    reconcile as reconcile,
+)
 from cherryservers_sdk_python import (
     regions as regions,
 )
@@ -34,6 +70,9 @@ from cherryservers_sdk_python import (
 from cherryservers_sdk_python import (
     teams as teams,
 )
+from cherryservers_sdk_python import (
+    transports as transports,
+)
 from cherryservers_sdk_python import (
     users as users,
 )
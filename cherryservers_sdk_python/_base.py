@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import abc
+import threading
 from typing import TYPE_CHECKING, Generic, TypeVar
 
 from pydantic import BaseModel, ConfigDict
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from cherryservers_sdk_python import _client
 
 
@@ -13,6 +16,23 @@ class ResourceModel(BaseModel, abc.ABC):
     model_config = ConfigDict(frozen=True)
 
 
+class ResourceObserver(abc.ABC):
+    """Cherry Servers resource observer base.
+
+    Observers are notified about resource state seen by a resource client:
+    whenever a resource is fetched, refreshed or mutated through the SDK,
+    and whenever it is deleted.
+    """
+
+    @abc.abstractmethod
+    def resource_updated(self, model: ResourceModel) -> None:
+        """Handle a new resource model."""
+
+    @abc.abstractmethod
+    def resource_deleted(self, resource_id: int | str) -> None:
+        """Handle a resource deletion."""
+
+
 class ResourceClient(abc.ABC):  # noqa: B024
     """Cherry Servers resource client base."""
 
@@ -22,6 +42,25 @@ class ResourceClient(abc.ABC):  # noqa: B024
         """Initialize a Cherry Servers resource client."""
         self._api_client = api_client
         self._request_timeout = request_timeout
+        self._observers: tuple[ResourceObserver, ...] = ()
+
+    @property
+    def observers(self) -> tuple[ResourceObserver, ...]:
+        """Observers subscribed to this client."""
+        return self._observers
+
+    def subscribe(self, observer: ResourceObserver) -> None:
+        """Subscribe an observer to resource updates and deletions."""
+        if observer not in self._observers:
+            self._observers = (*self._observers, observer)
+
+    def unsubscribe(self, observer: ResourceObserver) -> None:
+        """Unsubscribe an observer, if it is subscribed."""
+        self._observers = tuple(o for o in self._observers if o is not observer)
+
+    def _notify_deleted(self, resource_id: int | str) -> None:
+        for observer in self._observers:
+            observer.resource_deleted(resource_id)
 
     @property
     def request_timeout(self) -> int:
@@ -39,18 +78,73 @@ T = TypeVar("T", bound=ResourceModel)
 
 
 class Resource(abc.ABC, Generic[C, T]):
+    """Cherry Servers resource base.
+
+    The resource model is swapped atomically, so a resource can be shared
+    between threads: readers always see a complete model, either
+    the one before or the one after a concurrent update.
+    Every new model is published to the observers of the resource client,
+    in the order the models are stored, so the last model an observer
+    receives for a resource is its current model.
+    """
+
     def __init__(self, client: C, model: T) -> None:
         """Initialize a Cherry Servers resource."""
+        self._model_lock = threading.Lock()
+        # Held while a model is stored and published, so that concurrent
+        # updates reach observers in the order they are stored.
+        # Reentrant, since observers may update the resource.
+        self._update_lock = threading.RLock()
         self._model = model
         self._client = client
+        self._notify_updated(model)
 
     def get_model(self) -> T:
         """Get resource model.
 
         This model is frozen, since it represents actual resource state.
         """
-        return self._model
+        with self._model_lock:
+            return self._model
+
+    def _set_model(self, model: T) -> None:
+        """Atomically replace the resource model."""
+        with self._update_lock:
+            with self._model_lock:
+                self._model = model
+            self._notify_updated(model)
+
+    def _notify_updated(self, model: T) -> None:
+        for observer in self._client.observers:
+            observer.resource_updated(model)
 
 
 class RequestSchema(BaseModel, abc.ABC):
     """Cherry Servers base API request schema."""
+
+
+S = TypeVar("S", bound=RequestSchema)
+
+
+def changed_fields(request: S, current: Mapping[str, object]) -> S | None:
+    """Drop the fields of an update request that would not change anything.
+
+    Fields set to `None` are left unchanged by the API.
+    Every other field is compared to its current value in `current`, if any,
+    and set to `None` if they are equal.
+    Fields without a known current value are always sent.
+
+    :returns: The request with only changed fields set,
+        or `None` if it would not change anything.
+    """
+    fields = {name: value for name, value in request if value is not None}
+    unchanged = {
+        name: None
+        for name, value in fields.items()
+        if name in current and current[name] == value
+    }
+    if len(unchanged) == len(fields):
+        return None
+    if not unchanged:
+        return request
+    return request.model_copy(update=unchanged)
@@ -2,11 +2,32 @@
 
 from __future__ import annotations
 
-from typing import Any
+import hashlib
+import json
+import logging
+import threading
+import time
+import urllib.parse
+from concurrent import futures
+from typing import TYPE_CHECKING, Any
 
 import requests
 
-from cherryservers_sdk_python import _base, _version
+from cherryservers_sdk_python import (
+    _base,
+    _version,
+    cache,
+    circuit_breaker,
+    deadlines,
+    errors,
+    hedging,
+    transports,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable
+
+_logger = logging.getLogger(__name__)
 
 
 class InvalidMethodError(Exception):
@@ -16,20 +37,155 @@ class InvalidMethodError(Exception):
         super().__init__(f"Invalid method {method}")
 
 
+class _SingleFlight:
+    """Share one in-flight call between concurrent callers with the same key."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, futures.Future[requests.Response]] = {}
+
+    def do(
+        self, key: Hashable, fn: Callable[[], requests.Response]
+    ) -> requests.Response:
+        """Call `fn`, or wait for the result of an identical in-flight call."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                leader = False
+            else:
+                leader = True
+                call = futures.Future()
+                self._calls[key] = call
+
+        if not leader:
+            return call.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class _NegativeCache:
+    """Short-lived record of API paths that were not found."""
+
+    def __init__(self, ttl: float, max_entries: int = 1024) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[float, errors.NotFoundError]] = {}
+
+    def get(self, path: str) -> errors.NotFoundError | None:
+        """Get a new error for a path that was recently not found."""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[0]:
+                del self._entries[path]
+                return None
+        return errors.NotFoundError(
+            str(entry[1]), method="GET", endpoint=path, response=entry[1].response
+        )
+
+    def add(self, error: errors.NotFoundError) -> None:
+        """Record a path that was not found."""
+        with self._lock:
+            if len(self._entries) >= self._max_entries:
+                now = time.monotonic()
+                self._entries = {
+                    path: entry
+                    for path, entry in self._entries.items()
+                    if entry[0] > now
+                }
+                if len(self._entries) >= self._max_entries:
+                    self._entries.pop(next(iter(self._entries)))
+            self._entries[error.endpoint] = (time.monotonic() + self._ttl, error)
+
+    def discard(self, paths: Iterable[str]) -> None:
+        """Forget paths, e.g. because they may have been created."""
+        with self._lock:
+            for path in paths:
+                self._entries.pop(path, None)
+
+
 class CherryApiClient:
-    """Cherry Servers API client."""
+    """Cherry Servers API client.
+
+    :param transports.Transport | None transport: HTTP transport used to send
+        requests. Defaults to :class:`transports.RequestsTransport`.
+    :param bool coalesce_gets: Whether concurrent identical GET requests
+        (same path and params) should share a single in-flight request and its
+        response. Disabled by default, since a coalesced GET may have been sent
+        before a concurrent write from the calling thread.
+    :param bool thread_safe: Whether each thread should use its own
+        `requests.Session`. Enable this when the client is shared between
+        threads, e.g. in a `ThreadPoolExecutor`, since `requests.Session`
+        is not guaranteed to be thread-safe.
+        Only applies to the default transport.
+    :param cache.Cache | None response_cache: Cache for GET responses.
+        Stale entries are revalidated from a background thread,
+        so a thread-safe transport should be used along with it.
+    :param float negative_cache_ttl: How long GET requests for paths that were
+        not found fail without being sent, in seconds. Disabled if 0.
+    :param circuit_breaker.CircuitBreaker | None breaker: Circuit breaker that
+        fails requests to failing endpoints fast.
+    :param hedging.HedgingPolicy | None hedging: Policy for hedging slow GET
+        requests. Requires a thread-safe transport.
+    """
 
-    def __init__(
+    _METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE"})
+
+    def __init__(  # noqa: PLR0913
         self,
         token: str,
         api_endpoint_base: str = "https://api.cherryservers.com/v1/",
         user_agent_prefix: str = "",
+        *,
+        transport: transports.Transport | None = None,
+        coalesce_gets: bool = False,
+        thread_safe: bool = False,
+        response_cache: cache.Cache | None = None,
+        negative_cache_ttl: float = 0,
+        breaker: circuit_breaker.CircuitBreaker | None = None,
+        hedging: hedging.HedgingPolicy | None = None,
     ) -> None:
         self._token = token
         self._api_endpoint_base = api_endpoint_base
-        self._requests_session = requests.Session()
         self._headers = self._get_headers(user_agent_prefix)
-        self._requests_session.headers.update(self._headers)
+        if transport is None:
+            transport = transports.RequestsTransport(thread_safe=thread_safe)
+        self._transport = transport
+        self._single_flight = _SingleFlight() if coalesce_gets else None
+        self._cache = response_cache
+        # Entries are namespaced, since cached inventory depends on the account.
+        self._cache_namespace = hashlib.blake2b(
+            f"{api_endpoint_base} {token}".encode(), digest_size=8
+        ).hexdigest()
+        # Incremented by mutations, so that responses fetched before them
+        # are not stored. Guarded by the cache lock, along with stores and
+        # invalidations, so that no stale response is stored after invalidation.
+        self._cache_generation = 0
+        self._cache_lock = threading.Lock()
+        self._revalidations: dict[str, threading.Thread] = {}
+        self._revalidations_lock = threading.Lock()
+        self._negative_cache = (
+            _NegativeCache(negative_cache_ttl) if negative_cache_ttl > 0 else None
+        )
+        self._breaker = breaker
+        self._hedging = hedging
+
+    @property
+    def transport(self) -> transports.Transport:
+        """HTTP transport used to send requests."""
+        return self._transport
 
     def _get_headers(self, user_agent_prefix: str) -> dict[str, str]:
         return {
@@ -47,51 +203,180 @@ class CherryApiClient:
         data: str | None = None,
         timeout: int = 120,
     ) -> requests.Response:
-        r = None
-        if method == "GET":
-            r = self._requests_session.get(
-                url, params=params, timeout=timeout, allow_redirects=False
-            )
-            # We need this to avoid dropping authentication headers, when redirect
-            # uses HTTP, since that will be considered a different domain.
-            if r.status_code in (301, 302):
-                redirect_url = r.headers.get("Location")
-                if redirect_url is not None:
-                    r = self._send_request(
-                        "GET", redirect_url, params=params, timeout=timeout
-                    )
-        if method == "POST":
-            r = self._requests_session.post(
+        if method not in self._METHODS:
+            raise InvalidMethodError(method)
+
+        endpoint = url.removeprefix(self._api_endpoint_base)
+        request_timeout: transports.Timeout = timeout
+        deadline = deadlines.current()
+        if deadline is not None:
+            deadline.check(method, endpoint)
+            request_timeout = deadline.request_timeout(timeout)
+        if self._breaker is None:
+            return self._send(method, url, params, data, request_timeout)
+
+        self._breaker.before_request(method, endpoint)
+        try:
+            r = self._send(method, url, params, data, request_timeout)
+        except Exception as e:
+            self._breaker.record(endpoint, failed=circuit_breaker.is_failure(e))
+            raise
+        self._breaker.record(endpoint, failed=False)
+        return r
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        data: str | None,
+        timeout: transports.Timeout,
+    ) -> requests.Response:
+        endpoint = url.removeprefix(self._api_endpoint_base)
+        try:
+            r = self._transport.send(
+                method,
                 url,
                 params=params,
-                timeout=timeout,
                 data=data,
+                headers=self._headers,
+                timeout=timeout,
             )
-        if method == "PUT":
-            r = self._requests_session.put(
-                url, params=params, timeout=timeout, data=data
-            )
-        if method == "PATCH":
-            r = self._requests_session.patch(
-                url, params=params, timeout=timeout, data=data
+        except requests.exceptions.Timeout as e:
+            deadline = deadlines.current()
+            error_type = (
+                errors.DeadlineExceededError
+                if deadline is not None and deadline.expired
+                else errors.RequestTimeoutError
             )
-        if method == "DELETE":
-            r = self._requests_session.delete(url, params=params, timeout=timeout)
-        if isinstance(r, requests.Response):
-            try:
-                r.raise_for_status()
-            except requests.exceptions.HTTPError as e:
-                raise requests.exceptions.HTTPError(e.response.text) from e
-            return r
-        raise InvalidMethodError(method)
+            raise error_type(str(e), method=method, endpoint=endpoint) from e
+        # We need this to avoid dropping authentication headers, when redirect
+        # uses HTTP, since that will be considered a different domain.
+        if method == "GET" and r.status_code in (301, 302):
+            redirect_url = r.headers.get("Location")
+            if redirect_url is not None:
+                r = self._send("GET", redirect_url, params, None, timeout)
+
+        if not r.ok:
+            raise errors.from_response(r, method, endpoint)
+        return r
 
     def get(
         self, path: str, params: dict[str, Any] | None = None, timeout: int = 120
     ) -> requests.Response:
         """GET to Cherry Servers API."""
-        return self._send_request(
-            "GET", self._api_endpoint_base + path, params, None, timeout
+        if self._negative_cache is None:
+            return self._get_or_cached(path, params, timeout)
+
+        not_found = self._negative_cache.get(path)
+        if not_found is not None:
+            raise not_found
+        try:
+            return self._get_or_cached(path, params, timeout)
+        except errors.NotFoundError as e:
+            if e.endpoint == path:
+                self._negative_cache.add(e)
+            raise
+
+    def _get_or_cached(
+        self, path: str, params: dict[str, Any] | None, timeout: int
+    ) -> requests.Response:
+        if self._cache is not None and self._cache.ttl_for(path) is not None:
+            return self._cached_get(self._cache, path, params, timeout)
+        return self._get(path, params, timeout)
+
+    def _cached_get(
+        self,
+        response_cache: cache.Cache,
+        path: str,
+        params: dict[str, Any] | None,
+        timeout: int,
+    ) -> requests.Response:
+        query = urllib.parse.urlencode(sorted((params or {}).items()))
+        key = f"{self._cache_namespace}:{path}?{query}"
+        url = self._api_endpoint_base + path
+        entry = response_cache.get(key)
+        now = time.time()
+        if entry is not None and now < entry.expires_at + response_cache.stale_ttl:
+            if now >= entry.expires_at:
+                self._revalidate(response_cache, key, path, params, timeout)
+            return transports.build_response(
+                entry.status_code,
+                entry.content,
+                url,
+                {"Content-Type": entry.content_type},
+            )
+        return self._fetch_into_cache(response_cache, key, path, params, timeout)
+
+    def _fetch_into_cache(
+        self,
+        response_cache: cache.Cache,
+        key: str,
+        path: str,
+        params: dict[str, Any] | None,
+        timeout: int,
+    ) -> requests.Response:
+        with self._cache_lock:
+            generation = self._cache_generation
+        r = self._get(path, params, timeout)
+        ttl = response_cache.ttl_for(path) or 0
+        now = time.time()
+        entry = cache.CacheEntry(
+            r.status_code,
+            r.content,
+            r.headers.get("Content-Type", "application/json"),
+            now,
+            now + ttl,
         )
+        tokens = cache.response_tokens(path, r.content)
+        with self._cache_lock:
+            if generation == self._cache_generation:
+                response_cache.set(key, entry, tokens)
+        return r
+
+    def _revalidate(
+        self,
+        response_cache: cache.Cache,
+        key: str,
+        path: str,
+        params: dict[str, Any] | None,
+        timeout: int,
+    ) -> None:
+        def revalidate() -> None:
+            # On failure, the stale entry is kept and revalidated on next use.
+            try:
+                self._fetch_into_cache(response_cache, key, path, params, timeout)
+            except Exception:
+                _logger.warning("Failed to revalidate cached %s", path, exc_info=True)
+            finally:
+                with self._revalidations_lock:
+                    del self._revalidations[key]
+
+        with self._revalidations_lock:
+            if key in self._revalidations:
+                return
+            thread = threading.Thread(target=revalidate, daemon=True)
+            self._revalidations[key] = thread
+        thread.start()
+
+    def _get(
+        self, path: str, params: dict[str, Any] | None, timeout: int
+    ) -> requests.Response:
+        url = self._api_endpoint_base + path
+
+        def send() -> requests.Response:
+            if self._hedging is None:
+                return self._send_request("GET", url, params, None, timeout)
+            return self._hedging.run(
+                path, lambda: self._send_request("GET", url, params, None, timeout)
+            )
+
+        if self._single_flight is None:
+            return send()
+
+        # Param values may be lists or dicts, so they are not hashed directly.
+        key = (url, json.dumps(params, sort_keys=True, default=str))
+        return self._single_flight.do(key, send)
 
     def post(
         self,
@@ -101,13 +386,7 @@ class CherryApiClient:
         timeout: int = 120,
     ) -> requests.Response:
         """POST to Cherry Servers API."""
-        return self._send_request(
-            "POST",
-            self._api_endpoint_base + path,
-            params,
-            data.model_dump_json(),
-            timeout,
-        )
+        return self._mutate("POST", path, params, data.model_dump_json(), timeout)
 
     def put(
         self,
@@ -117,13 +396,7 @@ class CherryApiClient:
         timeout: int = 120,
     ) -> requests.Response:
         """PUT to Cherry Servers API."""
-        return self._send_request(
-            "PUT",
-            self._api_endpoint_base + path,
-            params,
-            data.model_dump_json(),
-            timeout,
-        )
+        return self._mutate("PUT", path, params, data.model_dump_json(), timeout)
 
     def patch(
         self,
@@ -133,18 +406,33 @@ class CherryApiClient:
         timeout: int = 120,
     ) -> requests.Response:
         """PATCH to Cherry Servers API."""
-        return self._send_request(
-            "PATCH",
-            self._api_endpoint_base + path,
-            params,
-            data.model_dump_json(),
-            timeout,
-        )
+        return self._mutate("PATCH", path, params, data.model_dump_json(), timeout)
 
     def delete(
         self, path: str, params: dict[str, Any] | None = None, timeout: int = 120
     ) -> requests.Response:
         """DELETE to Cherry Servers API."""
-        return self._send_request(
-            "DELETE", self._api_endpoint_base + path, params, None, timeout
-        )
+        return self._mutate("DELETE", path, params, None, timeout)
+
+    def _mutate(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None,
+        data: str | None,
+        timeout: int,
+    ) -> requests.Response:
+        try:
+            return self._send_request(
+                method, self._api_endpoint_base + path, params, data, timeout
+            )
+        finally:
+            # Even failed requests may have changed something.
+            if self._cache is not None or self._negative_cache is not None:
+                tokens = cache.mutation_tokens(path, data)
+                if self._cache is not None:
+                    with self._cache_lock:
+                        self._cache_generation += 1
+                        self._cache.invalidate(tokens)
+                if self._negative_cache is not None:
+                    self._negative_cache.discard(tokens)
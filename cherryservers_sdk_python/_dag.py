@@ -0,0 +1,229 @@
+"""Concurrent execution of tasks with dependencies."""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from concurrent import futures
+from typing import TYPE_CHECKING, Literal, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+Outcome = Literal["succeeded", "failed", "skipped", "cancelled"]
+
+
+class DependencyCycleError(Exception):
+    """Tasks depend on each other in a cycle."""
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        """Initialize error."""
+        super().__init__(f"Dependency cycle between tasks: {', '.join(sorted(keys))}")
+
+
+class TaskResult(NamedTuple):
+    """Outcome of a task.
+
+    Attributes:
+        key (str): Task key.
+        outcome (str): `succeeded`, `failed`,
+         `skipped` if a task it depends on failed,
+         or `cancelled` if the run was cancelled before the task started.
+        error (Exception | None): Error the task failed with.
+        value (object): Return value of a succeeded task.
+
+    """
+
+    key: str
+    outcome: Outcome
+    error: Exception | None = None
+    value: object = None
+
+
+class _CancelledError(Exception):
+    """The run was cancelled before a task started."""
+
+
+class _RateLimiter:
+    """Spaces out task starts to at most `rate` per second."""
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1 / rate
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class Graph:
+    """Tasks with dependencies, run concurrently in dependency order.
+
+    Each task starts as soon as all tasks it depends on have succeeded.
+    Tasks that depend on a failed task, directly or not, are skipped.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty graph."""
+        self._tasks: dict[str, Callable[[], object]] = {}
+        self._dependencies: dict[str, set[str]] = {}
+
+    def __contains__(self, key: str) -> bool:
+        """Whether the graph has a task."""
+        return key in self._tasks
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over task keys."""
+        return iter(self._tasks)
+
+    def __len__(self) -> int:
+        """Get the number of tasks."""
+        return len(self._tasks)
+
+    def add(
+        self, key: str, fn: Callable[[], object], depends_on: Iterable[str] = ()
+    ) -> None:
+        """Add a task.
+
+        :param str key: Unique task key.
+        :param Callable[[], object] fn: Task function.
+        :param Iterable[str] depends_on: Keys of tasks that must succeed first.
+            They can be added later.
+        """
+        self._tasks[key] = fn
+        self._dependencies.setdefault(key, set())
+        self.add_dependencies(key, depends_on)
+
+    def add_dependencies(self, key: str, depends_on: Iterable[str]) -> None:
+        """Make a task depend on more tasks."""
+        self._dependencies.setdefault(key, set()).update(depends_on)
+
+    def run(
+        self,
+        max_workers: int = 10,
+        *,
+        rate: float | None = None,
+        cancel: threading.Event | None = None,
+    ) -> dict[str, TaskResult]:
+        """Run all tasks.
+
+        :param int max_workers: Maximum number of tasks run at once.
+        :param float | None rate: Maximum number of tasks started per second,
+            `None` for no limit.
+        :param threading.Event | None cancel: Once set, no more tasks are started.
+            Running tasks are not interrupted.
+
+        :returns dict[str, TaskResult]: Result of every task, by key.
+
+        :raises KeyError: If a task depends on a task that was not added.
+        :raises DependencyCycleError: If tasks depend on each other in a cycle.
+        """
+        for key, dependencies in self._dependencies.items():
+            for dependency in dependencies:
+                if dependency not in self._tasks:
+                    msg = f"task {key} depends on unknown task {dependency}"
+                    raise KeyError(msg)
+        self._check_cycles()
+
+        with futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="cherryservers-graph"
+        ) as pool:
+            return _Run(
+                self._tasks,
+                self._dependencies,
+                pool,
+                None if rate is None else _RateLimiter(rate),
+                cancel or threading.Event(),
+            ).run()
+
+    def _check_cycles(self) -> None:
+        remaining = {key: set(deps) for key, deps in self._dependencies.items()}
+        while remaining:
+            ready = [key for key, deps in remaining.items() if not deps]
+            if not ready:
+                raise DependencyCycleError(remaining)
+            for key in ready:
+                del remaining[key]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+
+class _Run:
+    """Single run of a graph."""
+
+    def __init__(
+        self,
+        tasks: dict[str, Callable[[], object]],
+        dependencies: dict[str, set[str]],
+        pool: futures.Executor,
+        limiter: _RateLimiter | None,
+        cancel: threading.Event,
+    ) -> None:
+        self._tasks = tasks
+        self._pool = pool
+        self._limiter = limiter
+        self._cancel = cancel
+        self._dependents: dict[str, list[str]] = {key: [] for key in tasks}
+        for key, keys in dependencies.items():
+            for dependency in keys:
+                self._dependents[dependency].append(key)
+        self._waiting = {key: len(keys) for key, keys in dependencies.items()}
+        self._running: dict[futures.Future[object], str] = {}
+        self._results: dict[str, TaskResult] = {}
+
+    def run(self) -> dict[str, TaskResult]:
+        for key, count in self._waiting.items():
+            if count == 0:
+                self._submit(key)
+        while self._running:
+            done, _ = futures.wait(self._running, return_when=futures.FIRST_COMPLETED)
+            for call in done:
+                self._complete(self._running.pop(call), call)
+        return self._results
+
+    def _submit(self, key: str) -> None:
+        call = self._pool.submit(contextvars.copy_context().run, self._call, key)
+        self._running[call] = key
+
+    def _call(self, key: str) -> object:
+        if self._limiter is not None and not self._cancel.is_set():
+            self._limiter.wait()
+        if self._cancel.is_set():
+            raise _CancelledError
+        return self._tasks[key]()
+
+    def _complete(self, key: str, call: futures.Future[object]) -> None:
+        error = call.exception()
+        if isinstance(error, _CancelledError):
+            self._skip(key, "cancelled")
+            return
+        if error is not None:
+            self._results[key] = TaskResult(key, "failed", _as_exception(error))
+            for dependent in self._dependents[key]:
+                self._skip(dependent, "skipped")
+            return
+
+        self._results[key] = TaskResult(key, "succeeded", value=call.result())
+        for dependent in self._dependents[key]:
+            self._waiting[dependent] -= 1
+            if self._waiting[dependent] == 0 and dependent not in self._results:
+                self._submit(dependent)
+
+    def _skip(self, key: str, outcome: Outcome) -> None:
+        if key in self._results:
+            return
+        self._results[key] = TaskResult(key, outcome)
+        for dependent in self._dependents[key]:
+            self._skip(dependent, outcome)
+
+
+def _as_exception(error: BaseException) -> Exception:
+    if isinstance(error, Exception):
+        return error
+    raise error
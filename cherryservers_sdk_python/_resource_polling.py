@@ -3,10 +3,23 @@
 from __future__ import annotations
 
 import abc
+import heapq
+import itertools
+import json
+import pathlib
+import statistics
+import threading
 import time
 import typing
 from random import uniform
 
+from cherryservers_sdk_python import deadlines
+
+if typing.TYPE_CHECKING:
+    import os
+
+K = typing.TypeVar("K")
+
 
 class ResourceTimeoutError(Exception):
     """Resource timeout occurred."""
@@ -27,22 +40,35 @@ def wait_for_resource_condition(
     resource: RefreshableResource,
     timeout: float,
     condition: typing.Callable[[], bool],
+    first_check_after: float = 0,
 ) -> None:
     """Refresh resource until condition is met.
 
+    Waits never extend past the active
+    :class:`cherryservers_sdk_python.deadlines.Deadline`,
+    the refresh after it has passed fails instead.
+
     :param RefreshableResource resource: Resource to wait for.
     :param float timeout: Timeout in seconds.
     :param typing.Callable[[], bool] condition: Condition to wait for.
+    :param float first_check_after: Seconds to wait before the first refresh,
+        typically an estimate of when the condition will be met.
 
     :raises ResourceTimeoutError: If timeout occurs.
+    :raises cherryservers_sdk_python.errors.DeadlineExceededError:
+        If the active deadline passes first.
     """
+    ends_at = time.monotonic() + timeout
+    if first_check_after > 0 and not condition():
+        time.sleep(deadlines.cap(min(first_check_after, timeout)))
+        resource.refresh()
     retries = 0
     while not condition():
-        delay = _get_exponential_delay(retries)
-        if delay > timeout:
+        remaining = ends_at - time.monotonic()
+        if remaining <= 0:
             msg = f"timeout waiting for {resource.__class__.__name__} to deploy"
             raise ResourceTimeoutError(msg)
-        time.sleep(delay)
+        time.sleep(deadlines.cap(min(_get_exponential_delay(retries), remaining)))
         resource.refresh()
         retries += 1
 
@@ -55,3 +81,129 @@ def _get_exponential_delay(retries: int) -> float:
     max_delay: float = 20
     delay: float = (2 * 2**retries / 2) + uniform(0, (2 * 2**retries / 2))  # noqa: S311
     return min(delay, max_delay)
+
+
+class PollSchedule(typing.Generic[K]):
+    """Adaptive polling schedule for several resources.
+
+    Each resource backs off exponentially while its state stays the same
+    and is polled again quickly as soon as a change is observed,
+    so that many resources can be followed with few API requests.
+    """
+
+    def __init__(self, keys: typing.Iterable[K], timeout: float | None) -> None:
+        """Initialize a schedule with all resources due immediately.
+
+        :param typing.Iterable[K] keys: Resources to poll.
+        :param float | None timeout: Timeout in seconds, or `None` for no timeout.
+        """
+        now = time.monotonic()
+        self._deadline = None if timeout is None else now + timeout
+        self._counter = itertools.count()
+        self._retries: dict[K, int] = {}
+        self._queue: list[tuple[float, int, K]] = []
+        for key in keys:
+            self._retries[key] = 0
+            heapq.heappush(self._queue, (now, next(self._counter), key))
+
+    def __bool__(self) -> bool:
+        """Whether any resource is still scheduled."""
+        return bool(self._queue)
+
+    def pop(self) -> tuple[K, float]:
+        """Get the next resource to poll and the delay before polling it.
+
+        The delay never extends past the active
+        :class:`cherryservers_sdk_python.deadlines.Deadline`.
+
+        :raises ResourceTimeoutError: If the next poll is past the timeout.
+        """
+        due, _, key = heapq.heappop(self._queue)
+        if self._deadline is not None and due > self._deadline:
+            msg = f"timeout waiting for {len(self._queue) + 1} resources"
+            raise ResourceTimeoutError(msg)
+        return key, deadlines.cap(max(0.0, due - time.monotonic()))
+
+    def add(self, key: K, delay: float = 0) -> None:
+        """Start polling another resource.
+
+        :param K key: Resource to poll.
+        :param float delay: Seconds before its first poll.
+        """
+        self._retries[key] = 0
+        heapq.heappush(
+            self._queue, (time.monotonic() + delay, next(self._counter), key)
+        )
+
+    def reschedule(self, key: K, *, changed: bool) -> None:
+        """Schedule the next poll of a resource.
+
+        :param K key: Polled resource.
+        :param bool changed: Whether the resource changed since the previous poll.
+        """
+        retries = 0 if changed else self._retries[key] + 1
+        self._retries[key] = retries
+        due = time.monotonic() + _get_exponential_delay(retries)
+        heapq.heappush(self._queue, (due, next(self._counter), key))
+
+
+class TransitionHistory:
+    """Recorded durations of resource state transitions.
+
+    Durations are kept per key, such as plan slug, region slug and action,
+    and used to estimate how long future transitions will take.
+    Only the latest samples of each key are kept.
+    If a path is given, the history is loaded from it
+    and saved to it as JSON after every recorded transition.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str] | None = None, max_samples: int = 20
+    ) -> None:
+        """Initialize a transition history.
+
+        :param str | os.PathLike[str] | None path: JSON file to persist
+            the history in, or `None` to only keep it in memory.
+        :param int max_samples: Number of samples to keep per key.
+        """
+        self._path = None if path is None else pathlib.Path(path).expanduser()
+        self._max_samples = max_samples
+        self._lock = threading.Lock()
+        self._samples: dict[str, list[float]] = {}
+        if self._path is not None and self._path.exists():
+            self._samples = json.loads(self._path.read_text())
+
+    @staticmethod
+    def _key(*parts: str) -> str:
+        return "/".join(parts)
+
+    def record(self, duration: float, *key: str) -> None:
+        """Record the duration of a transition in seconds."""
+        with self._lock:
+            samples = self._samples.setdefault(self._key(*key), [])
+            samples.append(round(duration, 1))
+            del samples[: -self._max_samples]
+            if self._path is not None:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self._path.with_suffix(".tmp")
+                tmp.write_text(json.dumps(self._samples, separators=(",", ":")))
+                tmp.replace(self._path)
+
+    def estimate(self, *key: str) -> float | None:
+        """Estimate the duration of a transition in seconds.
+
+        :returns float | None: Median of the recorded durations,
+            `None` if none are recorded.
+        """
+        with self._lock:
+            samples = self._samples.get(self._key(*key))
+            return statistics.median(samples) if samples else None
+
+    def first_check_after(self, *key: str) -> float:
+        """Get a delay before the first check of a transition.
+
+        Slightly shorter than the estimated duration,
+        so that faster than usual transitions are not overslept.
+        """
+        estimate = self.estimate(*key)
+        return 0 if estimate is None else 0.8 * estimate
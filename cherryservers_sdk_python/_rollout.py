@@ -0,0 +1,224 @@
+"""Rolling server operations."""
+
+from __future__ import annotations
+
+import collections
+import contextvars
+import time
+from concurrent import futures
+from typing import TYPE_CHECKING
+
+import requests
+
+from cherryservers_sdk_python import _resource_polling, bulk, errors
+
+# Seconds after which a server that has not been seen leaving the target status
+# is considered done, since the API may report it before the transition starts.
+_MIN_FIRST_CHECK = 10.0
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from cherryservers_sdk_python import servers
+
+
+def _retryable(error: Exception) -> bool:
+    if isinstance(error, errors.ApiError):
+        return error.retryable
+    return isinstance(error, requests.exceptions.ConnectionError)
+
+
+class _InFlight:
+    """Server whose action has started, but not completed yet."""
+
+    def __init__(
+        self, server: servers.Server, started: float, target_status: str
+    ) -> None:
+        self.model = server.get_model()
+        self.started = started
+        self.key = (server.get_plan_slug(), server.get_region_slug())
+        self.left_target = self.model.status != target_status
+
+
+class Rollout:
+    """Act on servers according to a rollout policy.
+
+    Actions are started from a thread pool,
+    and the affected servers are then waited for with a shared poller,
+    which backs off for each server while its status stays the same.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        client: servers.ServerClient,
+        action: str,
+        start: Callable[[int], servers.Server],
+        *,
+        policy: bulk.RolloutPolicy,
+        timeout: float,
+        target_status: str = "deployed",
+    ) -> None:
+        """Initialize a rollout.
+
+        :param servers.ServerClient client: Client used to poll servers.
+        :param str action: Action name, used for transition history.
+        :param Callable[[int], servers.Server] start: Starts the action
+            for a server ID and returns the server from the API response.
+        :param bulk.RolloutPolicy policy: Rollout policy.
+        :param float timeout: Timeout for each server in seconds.
+        :param str target_status: Status of servers whose action has completed.
+        """
+        self._client = client
+        self._action = action
+        self._start_action = start
+        self._policy = policy
+        self._timeout = timeout
+        self._target_status = target_status
+        self._results: dict[int, bulk.ServerResult] = {}
+        self._in_flight: dict[int, _InFlight] = {}
+        self._schedule = _resource_polling.PollSchedule[int]((), None)
+        self._failures = 0
+        self._stop_reason: str | None = None
+
+    def run(self, server_ids: Iterable[int]) -> bulk.BulkResult:
+        """Act on servers and wait for all of them."""
+        ids = list(dict.fromkeys(server_ids))
+        with futures.ThreadPoolExecutor(
+            max_workers=self._policy.concurrency,
+            thread_name_prefix="cherryservers-rollout",
+        ) as pool:
+            previous: Sequence[int] = ()
+            for number, wave in enumerate(self._policy.waves(ids), 1):
+                self._check_health(number - 1, previous)
+                if self._stop_reason is not None:
+                    break
+                self._run_wave(wave, pool)
+                previous = wave
+        return bulk.BulkResult(
+            [
+                self._results.get(server_id, bulk.ServerResult(server_id, "skipped"))
+                for server_id in ids
+            ],
+            self._stop_reason,
+        )
+
+    def _check_health(self, number: int, wave: Sequence[int]) -> None:
+        health_check = self._policy.health_check
+        if not wave or health_check is None or self._stop_reason is not None:
+            return
+        results = [self._results[server_id] for server_id in wave]
+        try:
+            healthy = health_check(results)
+        except Exception as e:  # noqa: BLE001
+            for result in results:
+                if result.outcome == "succeeded":
+                    self._results[result.server_id] = result._replace(
+                        outcome="failed", error=e
+                    )
+            healthy = False
+        if not healthy:
+            self._stop_reason = f"health check failed after wave {number}"
+
+    def _run_wave(self, wave: Sequence[int], pool: futures.Executor) -> None:
+        queue = collections.deque(wave)
+        limit = self._policy.max_unavailable or len(wave)
+        while self._in_flight or (queue and self._stop_reason is None):
+            if self._stop_reason is None:
+                count = min(limit - len(self._in_flight), len(queue))
+                self._start(pool, [queue.popleft() for _ in range(count)])
+            if self._in_flight:
+                server_id, delay = self._schedule.pop()
+                time.sleep(delay)
+                self._poll(server_id)
+
+    def _start(self, pool: futures.Executor, server_ids: list[int]) -> None:
+        started = time.monotonic()
+        calls = {
+            server_id: pool.submit(
+                contextvars.copy_context().run, self._start_action, server_id
+            )
+            for server_id in server_ids
+        }
+        for server_id, call in calls.items():
+            try:
+                server = call.result()
+                in_flight = _InFlight(server, started, self._target_status)
+                first_check_after = self._client.transition_history.first_check_after(
+                    *in_flight.key, self._action
+                )
+            except Exception as e:  # noqa: BLE001
+                self._fail(server_id, e, None, started)
+                continue
+            # A server already reported at the target status
+            # may not have started its transition yet.
+            if not in_flight.left_target:
+                first_check_after = max(first_check_after, _MIN_FIRST_CHECK)
+            self._in_flight[server_id] = in_flight
+            self._schedule.add(server_id, first_check_after)
+
+    def _poll(self, server_id: int) -> None:
+        in_flight = self._in_flight[server_id]
+        try:
+            model = self._client.get_by_id(server_id).get_model()
+        except Exception as e:  # noqa: BLE001
+            if not _retryable(e):
+                del self._in_flight[server_id]
+                self._fail(server_id, e, in_flight.model, in_flight.started)
+                return
+            model = in_flight.model
+
+        changed = model.status != in_flight.model.status
+        in_flight.model = model
+        at_target = model.status == self._target_status
+        if not at_target:
+            in_flight.left_target = True
+        if at_target and (
+            in_flight.left_target
+            or time.monotonic() - in_flight.started >= _MIN_FIRST_CHECK
+        ):
+            del self._in_flight[server_id]
+            self._succeed(server_id, in_flight)
+        elif time.monotonic() - in_flight.started >= self._timeout:
+            del self._in_flight[server_id]
+            msg = (
+                f"timeout waiting for server {server_id} "
+                f"to become {self._target_status}"
+            )
+            self._fail(
+                server_id,
+                _resource_polling.ResourceTimeoutError(msg),
+                model,
+                in_flight.started,
+            )
+        else:
+            self._schedule.reschedule(server_id, changed=changed)
+
+    def _succeed(self, server_id: int, in_flight: _InFlight) -> None:
+        elapsed = time.monotonic() - in_flight.started
+        self._client.transition_history.record(elapsed, *in_flight.key, self._action)
+        self._results[server_id] = bulk.ServerResult(
+            server_id, "succeeded", in_flight.model, None, elapsed
+        )
+
+    def _fail(
+        self,
+        server_id: int,
+        error: Exception,
+        model: servers.ServerModel | None,
+        started: float,
+    ) -> None:
+        self._failures += 1
+        if self._stop_reason is None:
+            self._stop_reason = self._failure_stop_reason(error)
+        self._results[server_id] = bulk.ServerResult(
+            server_id, "failed", model, error, time.monotonic() - started
+        )
+
+    def _failure_stop_reason(self, error: Exception) -> str | None:
+        # Once the deadline has passed, no more servers can be acted on.
+        if isinstance(error, errors.DeadlineExceededError):
+            return "deadline exceeded"
+        max_failures = self._policy.max_failures
+        if max_failures is not None and self._failures > max_failures:
+            return f"more than {max_failures} servers failed"
+        return None
@@ -0,0 +1,81 @@
+"""Bulk resource tag updates."""
+
+from __future__ import annotations
+
+import contextvars
+from concurrent import futures
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from cherryservers_sdk_python import _base, bulk
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+R = TypeVar("R", bound=_base.Resource[Any, Any])
+
+
+def target_tags(
+    current: Mapping[str, str] | None, tags: Mapping[str, str], mode: bulk.TagMode
+) -> dict[str, str]:
+    """Get the tags a resource should have after an update."""
+    if mode == "replace":
+        return dict(tags)
+    if mode == "merge":
+        return {**(current or {}), **tags}
+    msg = f"unknown tag mode: {mode}"
+    raise ValueError(msg)
+
+
+def update_tags(
+    resources: Iterable[R],
+    tags: Mapping[str, str],
+    mode: bulk.TagMode,
+    update: Callable[[R, dict[str, str]], R],
+    max_workers: int,
+) -> bulk.TagUpdateResult[R]:
+    """Update the tags of resources whose tags differ from the target ones.
+
+    Resources are compared using their current models, without fetching them.
+    Updates are sent concurrently, and failures are collected,
+    instead of aborting the remaining updates.
+    Updated resources get the models returned by the API.
+    """
+    seen: set[object] = set()
+    unchanged: list[R] = []
+    pending: list[tuple[R, dict[str, str]]] = []
+    for resource in resources:
+        model = resource.get_model()
+        if model.id in seen:
+            continue
+        seen.add(model.id)
+        new_tags = target_tags(model.tags, tags, mode)
+        if new_tags == (model.tags or {}):
+            unchanged.append(resource)
+        else:
+            pending.append((resource, new_tags))
+
+    updated: list[R] = []
+    failed: list[tuple[R, Exception]] = []
+    if not pending:
+        return bulk.TagUpdateResult(updated, unchanged, failed)
+
+    with futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="cherryservers-tags"
+    ) as pool:
+        calls = [
+            (
+                resource,
+                pool.submit(contextvars.copy_context().run, update, resource, new_tags),
+            )
+            for resource, new_tags in pending
+        ]
+        for resource, call in calls:
+            error = call.exception()
+            if error is None:
+                resource._set_model(call.result().get_model())  # noqa: SLF001
+                updated.append(resource)
+            elif isinstance(error, Exception):
+                failed.append((resource, error))
+            else:
+                raise error
+    return bulk.TagUpdateResult(updated, unchanged, failed)
@@ -370,6 +370,7 @@ class BackupStorageClient(_base.ResourceClient):
         self._api_client.delete(
             f"backup-storages/{storage_id}", None, self.request_timeout
         )
+        self._notify_deleted(storage_id)
 
     def update(
         self,
@@ -425,7 +426,7 @@ class BackupStorage(
     def update(self, update_schema: UpdateRequest) -> None:
         """Update Cherry Servers backup storage resource."""
         updated = self._client.update(self._model.id, update_schema)
-        self._model = updated.get_model()
+        self._set_model(updated.get_model())
 
     def update_access_method(
         self,
@@ -436,11 +437,11 @@ class BackupStorage(
         updated = self._client.update_access_method(
             self._model.id, method_name, update_schema
         )
-        self._model = updated.get_model()
+        self._set_model(updated.get_model())
 
     def refresh(self) -> None:
         """Refresh the resource."""
-        self._model = self._client.get_by_id(self._model.id).get_model()
+        self._set_model(self._client.get_by_id(self._model.id).get_model())
 
     def get_status(self) -> str:
         """Get backup storage status."""
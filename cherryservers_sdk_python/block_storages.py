@@ -27,6 +27,7 @@ class BlockStorageModel(_base.ResourceModel):
         initiator (str | None): EBS initiator.
         discovery_ip (str | None): EBS discovery IP address.
         region (cherryservers_sdk_python.regions.RegionModel | None): Region data.
+        description (str | None): EBS description.
 
     """
 
@@ -48,6 +49,7 @@ class BlockStorageModel(_base.ResourceModel):
         description="EBS discovery IP address.", default=None
     )
     region: regions.RegionModel | None = Field(description="Region data.", default=None)
+    description: str | None = Field(description="EBS description.", default=None)
 
 
 class CreationRequest(_base.RequestSchema):
@@ -183,6 +185,7 @@ class BlockStorageClient(_base.ResourceClient):
     def delete(self, storage_id: int) -> None:
         """Delete block storage."""
         self._api_client.delete(f"storages/{storage_id}", None, self.request_timeout)
+        self._notify_deleted(storage_id)
 
     def update(
         self,
@@ -198,9 +201,10 @@ class BlockStorageClient(_base.ResourceClient):
         )
         storage = BlockStorage(self, BlockStorageModel.model_validate(response.json()))
         # We need to wait for backend.
-        _resource_polling.wait_for_resource_condition(
-            storage, 120, lambda: storage.get_size() == update_schema.size
-        )
+        if update_schema.size is not None:
+            _resource_polling.wait_for_resource_condition(
+                storage, 120, lambda: storage.get_size() == update_schema.size
+            )
         return self.get_by_id(response.json()["id"])
 
     def attach(
@@ -247,9 +251,18 @@ class BlockStorage(
         """Update Cherry Servers block storage resource.
 
         WARNING: increasing storage size will change its ID!
+
+        Only fields that differ from the current model are sent,
+        and no request is sent if none do.
         """
-        updated = self._client.update(self._model.id, update_schema)
-        self._model = updated.get_model()
+        model = self.get_model()
+        changes = _base.changed_fields(
+            update_schema, {"size": model.size, "description": model.description}
+        )
+        if changes is None:
+            return
+        updated = self._client.update(model.id, changes)
+        self._set_model(updated.get_model())
 
     def attach(self, attach_schema: AttachRequest) -> None:
         """Attach Cherry Servers block storage resource to server.
@@ -257,12 +270,12 @@ class BlockStorage(
         Block storage volumes can only be attached to baremetal servers.
         """
         attached = self._client.attach(self._model.id, attach_schema)
-        self._model = attached.get_model()
+        self._set_model(attached.get_model())
 
     def detach(self) -> None:
         """Detach Cherry Servers block storage resource from server."""
         detached = self._client.detach(self._model.id)
-        self._model = detached.get_model()
+        self._set_model(detached.get_model())
 
     def get_id(self) -> int:
         """Get resource ID."""
@@ -274,4 +287,4 @@ class BlockStorage(
 
     def refresh(self) -> None:
         """Refresh Cherry Servers block storage resource."""
-        self._model = self._client.get_by_id(self._model.id).get_model()
+        self._set_model(self._client.get_by_id(self._model.id).get_model())
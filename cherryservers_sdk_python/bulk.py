@@ -0,0 +1,218 @@
+"""Cherry Servers bulk operations.
+
+Bulk operations, such as
+:meth:`cherryservers_sdk_python.servers.ServerClient.reboot_many`,
+act on many servers at once and wait for all of them with a single poller.
+A :class:`RolloutPolicy` bounds how many servers are affected at a time,
+and the outcome of every server is reported in a :class:`BulkResult`,
+instead of the first failure aborting the whole operation.
+
+Bulk tag updates, such as
+:meth:`cherryservers_sdk_python.servers.ServerClient.bulk_update_tags`,
+only send requests for resources whose tags actually change,
+and report their outcome in a :class:`TagUpdateResult`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Generic, Literal, NamedTuple, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from cherryservers_sdk_python import servers
+
+Outcome = Literal["succeeded", "failed", "skipped"]
+
+TagMode = Literal["merge", "replace"]
+"""How new tags are combined with the current ones.
+
+`merge` adds the new tags and overwrites existing ones with the same key,
+keeping the rest. `replace` makes the new tags the only ones.
+"""
+
+R = TypeVar("R")
+
+
+class RolloutPolicy:
+    """Policy bounding how many servers a bulk operation affects at a time.
+
+    Servers are processed in waves of `batch_size`.
+    Within a wave, up to `max_unavailable` servers are in flight at once,
+    and the next one is started as soon as one of them completes.
+    The next wave starts once the previous one has completed
+    and passed the health check, if one is set.
+    No more servers are started once more than `max_failures` have failed,
+    and the servers left are reported as skipped.
+
+    Example:
+        .. code-block:: python
+
+            # Reboot two servers at a time, one rack of ten after another.
+            result = facade.servers.reboot_many(
+                server_ids,
+                cherryservers_sdk_python.bulk.RolloutPolicy(
+                    batch_size=10, max_unavailable=2
+                ),
+            )
+            for failed in result.failed:
+                print(failed.server_id, failed.error)
+
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: int | None = None,
+        max_unavailable: int | None = None,
+        max_failures: int | None = None,
+        health_check: Callable[[Sequence[ServerResult]], bool] | None = None,
+        concurrency: int = 10,
+    ) -> None:
+        """Initialize a rollout policy.
+
+        :param int | None batch_size: Number of servers per wave,
+            `None` for a single wave of all servers.
+        :param int | None max_unavailable: Maximum number of servers
+            being acted on at once, `None` for the whole wave.
+        :param int | None max_failures: Number of failed servers tolerated,
+            `None` for no limit.
+        :param Callable[[Sequence[ServerResult]], bool] | None health_check:
+            Called with the results of each completed wave,
+            before the next one is started. The operation stops
+            if it returns `False`, or if it raises, in which case
+            the servers of the wave are reported as failed with the error.
+        :param int concurrency: Maximum number of concurrent API requests
+            that start actions.
+        """
+        self.batch_size = batch_size
+        self.max_unavailable = max_unavailable
+        self.max_failures = max_failures
+        self.health_check = health_check
+        self.concurrency = concurrency
+
+    def waves(self, server_ids: Sequence[int]) -> list[Sequence[int]]:
+        """Split servers into waves."""
+        size = self.batch_size or len(server_ids) or 1
+        return [server_ids[i : i + size] for i in range(0, len(server_ids), size)]
+
+
+class ServerResult(NamedTuple):
+    """Outcome of a bulk operation for a single server.
+
+    Attributes:
+        server_id (int): Server ID.
+        outcome (str): `succeeded`, `failed`,
+         or `skipped` if the operation stopped before the server was acted on.
+        model (cherryservers_sdk_python.servers.ServerModel | None):
+         Last observed server model.
+        error (Exception | None): Error the server failed with.
+        elapsed (float): Seconds from starting the action
+         until the server completed or failed.
+
+    """
+
+    server_id: int
+    outcome: Outcome
+    model: servers.ServerModel | None = None
+    error: Exception | None = None
+    elapsed: float = 0
+
+
+class BulkOperationError(Exception):
+    """Some resources of a bulk operation did not succeed."""
+
+    def __init__(self, result: BulkResult | TagUpdateResult[Any]) -> None:
+        """Initialize error."""
+        if isinstance(result, TagUpdateResult):
+            msg = f"{len(result.failed)} tag updates failed"
+        else:
+            msg = f"{len(result.failed)} servers failed, {len(result.skipped)} skipped"
+            if result.stop_reason is not None:
+                msg += f": {result.stop_reason}"
+        super().__init__(msg)
+        self.result = result
+
+
+class BulkResult:
+    """Outcome of a bulk operation, with a result for every server."""
+
+    def __init__(
+        self, results: Sequence[ServerResult], stop_reason: str | None = None
+    ) -> None:
+        """Initialize a bulk operation result.
+
+        :param Sequence[ServerResult] results: Server results,
+            in the order the servers were given.
+        :param str | None stop_reason: Why the operation stopped
+            before acting on every server, if it did.
+        """
+        self.results = list(results)
+        self.stop_reason = stop_reason
+
+    def _with_outcome(self, outcome: Outcome) -> list[ServerResult]:
+        return [result for result in self.results if result.outcome == outcome]
+
+    @property
+    def succeeded(self) -> list[ServerResult]:
+        """Results of servers the operation succeeded for."""
+        return self._with_outcome("succeeded")
+
+    @property
+    def failed(self) -> list[ServerResult]:
+        """Results of servers the operation failed for."""
+        return self._with_outcome("failed")
+
+    @property
+    def skipped(self) -> list[ServerResult]:
+        """Results of servers that were not acted on."""
+        return self._with_outcome("skipped")
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded for every server."""
+        return all(result.outcome == "succeeded" for result in self.results)
+
+    def raise_for_failures(self) -> None:
+        """Raise an error if the operation did not succeed for every server.
+
+        :raises BulkOperationError: If any server failed or was skipped.
+        """
+        if not self.ok:
+            raise BulkOperationError(self)
+
+
+class TagUpdateResult(Generic[R]):
+    """Outcome of a bulk tag update."""
+
+    def __init__(
+        self,
+        updated: Sequence[R],
+        unchanged: Sequence[R],
+        failed: Sequence[tuple[R, Exception]],
+    ) -> None:
+        """Initialize a bulk tag update result.
+
+        :param Sequence[R] updated: Resources whose tags were updated,
+            with the models returned by the API.
+        :param Sequence[R] unchanged: Resources that already had the tags,
+            for which no request was sent.
+        :param Sequence[tuple[R, Exception]] failed: Resources whose update
+            failed, with the error.
+        """
+        self.updated = list(updated)
+        self.unchanged = list(unchanged)
+        self.failed = list(failed)
+
+    @property
+    def ok(self) -> bool:
+        """Whether no update failed."""
+        return not self.failed
+
+    def raise_for_failures(self) -> None:
+        """Raise an error if any update failed.
+
+        :raises BulkOperationError: If any update failed.
+        """
+        if not self.ok:
+            raise BulkOperationError(self)
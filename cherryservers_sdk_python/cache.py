@@ -0,0 +1,431 @@
+"""Cherry Servers API response caches.
+
+A cache stores successful GET responses of the API client,
+so that repeated catalog and inventory queries can be answered without network.
+Each path is cached for the TTL of the first pattern it matches.
+Expired entries are still served for a while as stale,
+while a fresh response is fetched in the background.
+Entries are stamped with the SDK version and ignored by other versions,
+since the models they are validated against may differ.
+
+Requests that mutate resources through the same API client invalidate
+exactly the entries that may have changed: the entries of the mutated
+resource and of resources referenced in the request, every entry that
+contains any of them, such as project lists, and the list a resource
+is created in. Resources created under another resource, such as
+the backup storage of a server, invalidate every project list
+of their collection, since the project is not part of the path.
+"""
+
+from __future__ import annotations
+
+import abc
+import collections
+import contextlib
+import json
+import os
+import pathlib
+import re
+import sqlite3
+import threading
+import time
+import urllib.parse
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from cherryservers_sdk_python import _version
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Iterator, Mapping
+
+SCHEMA_VERSION = _version.__version__
+
+CATALOG_TTLS: dict[str, float] = {
+    r"regions(/[^/]+)?": 24 * 3600,
+    r"plans/[^/]+": 24 * 3600,
+    r"plans/[^/]+/images": 24 * 3600,
+    r"teams/\d+/plans": 24 * 3600,
+    r"backup-storage-plans": 24 * 3600,
+}
+"""Default TTLs in seconds for catalog paths: regions, plans and images."""
+
+INVENTORY_TTLS: dict[str, float] = {
+    r"projects/\d+/(servers|ips|storages|backup-storages)": 60,
+    r"(servers|ips|storages|backup-storages)/[^/]+": 60,
+}
+"""TTLs in seconds for project inventory paths.
+
+Not cached by :class:`SQLiteCache` by default,
+since other processes may change the inventory.
+"""
+
+# Request body fields that reference other resources, by resource collection.
+_REFERENCE_FIELDS = {
+    "attach_to": "servers",
+    "targeted_to": "servers",
+    "routed_to": "ips",
+    "ip_addresses": "ips",
+}
+
+# Sub-paths of a resource that mutate the resource itself.
+_RESOURCE_ACTIONS = frozenset({"actions", "attachments", "methods"})
+
+# Resources that own lists of other resources, without being changed by them.
+_OWNERS = frozenset({"projects", "teams"})
+
+# Collections that also change when a resource is created in a project.
+_CREATION_SIDE_EFFECTS = {"servers": ("ips",)}
+
+
+# Project list pattern, and the token of the lists of a collection in any project.
+_PROJECT_LIST = re.compile(r"projects/\d+/([^/]+)")
+_ANY_PROJECT_LIST = "projects/*/{}"
+
+
+def _resource_path(href: str) -> str:
+    """Get the API path of a resource from its href or URL."""
+    path = urllib.parse.urlsplit(href).path.strip("/")
+    _, _, relative = path.partition("v1/")
+    return relative or path
+
+
+def _hrefs(value: Any) -> Iterator[str]:  # noqa: ANN401
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key == "href" and isinstance(item, str):
+                yield item
+            else:
+                yield from _hrefs(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _hrefs(item)
+
+
+def response_tokens(path: str, content: bytes) -> set[str]:
+    """Get the invalidation tokens of a cached response.
+
+    A response is invalidated by its own path
+    and by the paths of all resources it contains.
+    Project lists are also invalidated by their collection.
+    """
+    tokens = {path}
+    if match := _PROJECT_LIST.fullmatch(path):
+        tokens.add(_ANY_PROJECT_LIST.format(match.group(1)))
+    # Responses that are not JSON are only invalidated by their own path.
+    with contextlib.suppress(ValueError):
+        tokens.update(_resource_path(href) for href in _hrefs(json.loads(content)))
+    return tokens
+
+
+def mutation_tokens(path: str, data: str | None) -> set[str]:
+    """Get the tokens of the entries invalidated by a mutating request.
+
+    :param str path: Request API path, e.g. `servers/123/actions`.
+    :param str | None data: Request JSON body.
+    """
+    segments = path.strip("/").split("/")
+    tokens = {"/".join(segments)}
+    if len(segments) >= 3:  # noqa: PLR2004
+        parent, collection = "/".join(segments[:2]), segments[2]
+        if collection in _RESOURCE_ACTIONS or segments[0] not in _OWNERS:
+            tokens.add(parent)
+        if collection not in _RESOURCE_ACTIONS and segments[0] not in _OWNERS:
+            tokens.add(_ANY_PROJECT_LIST.format(collection))
+        tokens.update(
+            f"{parent}/{other}" for other in _CREATION_SIDE_EFFECTS.get(collection, ())
+        )
+
+    body = json.loads(data) if data else None
+    if isinstance(body, dict):
+        for field, collection in _REFERENCE_FIELDS.items():
+            referenced = body.get(field)
+            for resource_id in (
+                referenced if isinstance(referenced, list) else [referenced]
+            ):
+                if resource_id is not None:
+                    tokens.add(f"{collection}/{resource_id}")
+    return tokens
+
+
+class CacheEntry(NamedTuple):
+    """Cached API response.
+
+    Attributes:
+        status_code (int): Response status code.
+        content (bytes): Response body.
+        content_type (str): Response content type.
+        stored_at (float): Time the response was stored, as a UNIX timestamp.
+        expires_at (float): Time the response expires, as a UNIX timestamp.
+
+    """
+
+    status_code: int
+    content: bytes
+    content_type: str
+    stored_at: float
+    expires_at: float
+
+
+class Cache(abc.ABC):
+    """Cherry Servers API response cache base."""
+
+    def __init__(
+        self, ttls: Mapping[str, float] | None = None, stale_ttl: float = 7 * 24 * 3600
+    ) -> None:
+        """Initialize a cache.
+
+        :param Mapping[str, float] | None ttls: TTLs in seconds,
+            by API path regular expression. Paths that match none are not cached.
+            Defaults to :data:`CATALOG_TTLS`.
+        :param float stale_ttl: How long an expired entry may still be served
+            while it is revalidated in the background, in seconds.
+        """
+        self._ttls = [
+            (re.compile(pattern), ttl)
+            for pattern, ttl in (CATALOG_TTLS if ttls is None else ttls).items()
+        ]
+        self.stale_ttl = stale_ttl
+
+    def ttl_for(self, path: str) -> float | None:
+        """Get the TTL of an API path, `None` if it is not cached."""
+        for pattern, ttl in self._ttls:
+            if pattern.fullmatch(path):
+                return ttl
+        return None
+
+    @abc.abstractmethod
+    def get(self, key: str) -> CacheEntry | None:
+        """Get a cached entry, if any."""
+
+    @abc.abstractmethod
+    def set(self, key: str, entry: CacheEntry, tokens: Collection[str] = ()) -> None:
+        """Store an entry.
+
+        :param str key: Entry key.
+        :param CacheEntry entry: Entry.
+        :param Collection[str] tokens: Tokens that invalidate the entry.
+        """
+
+    @abc.abstractmethod
+    def invalidate(self, tokens: Iterable[str]) -> None:
+        """Remove all entries with any of the given tokens."""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+    def close(self) -> None:  # noqa: B027
+        """Release resources held by the cache."""
+
+
+class MemoryCache(Cache):
+    """In-memory API response cache.
+
+    Caches both catalog and inventory paths by default,
+    which stays correct as long as the inventory is only mutated
+    through the API client that uses the cache.
+    The least recently used entries are evicted above `max_entries`.
+
+    Example:
+        .. code-block:: python
+
+            facade = cherryservers_sdk_python.facade.CherryApiFacade(
+                token="my-token",
+                response_cache=cherryservers_sdk_python.cache.MemoryCache(),
+            )
+
+            servers = facade.servers.list_by_project(123456)
+            # Invalidates the server and the project server list.
+            servers[0].update(
+                cherryservers_sdk_python.servers.UpdateRequest(name="db-1")
+            )
+
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] | None = None,
+        stale_ttl: float = 0,
+        max_entries: int = 1024,
+    ) -> None:
+        """Initialize an in-memory cache.
+
+        :param Mapping[str, float] | None ttls: See :class:`Cache`.
+            Defaults to :data:`CATALOG_TTLS` and :data:`INVENTORY_TTLS`.
+        :param float stale_ttl: See :class:`Cache`.
+        :param int max_entries: Maximum number of entries.
+        """
+        super().__init__(
+            {**CATALOG_TTLS, **INVENTORY_TTLS} if ttls is None else ttls, stale_ttl
+        )
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[
+            str, tuple[CacheEntry, Collection[str]]
+        ] = collections.OrderedDict()
+        self._keys_by_token: dict[str, set[str]] = collections.defaultdict(set)
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get a cached entry, if any."""
+        with self._lock:
+            stored = self._entries.get(key)
+            if stored is None:
+                return None
+            self._entries.move_to_end(key)
+            return stored[0]
+
+    def set(self, key: str, entry: CacheEntry, tokens: Collection[str] = ()) -> None:
+        """Store an entry."""
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (entry, tokens)
+            for token in tokens:
+                self._keys_by_token[token].add(key)
+            while len(self._entries) > self._max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str) -> None:
+        stored = self._entries.pop(key, None)
+        if stored is None:
+            return
+        for token in stored[1]:
+            keys = self._keys_by_token[token]
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_token[token]
+
+    def invalidate(self, tokens: Iterable[str]) -> None:
+        """Remove all entries with any of the given tokens."""
+        with self._lock:
+            for token in tokens:
+                for key in list(self._keys_by_token.get(token, ())):
+                    self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_token.clear()
+
+
+def default_cache_path() -> pathlib.Path:
+    """Get the default path of the on-disk cache.
+
+    Located in `$XDG_CACHE_HOME`, or `~/.cache` if it is not set.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or "~/.cache"
+    return (
+        pathlib.Path(cache_home).expanduser()
+        / "cherryservers_sdk_python"
+        / "cache.sqlite3"
+    )
+
+
+class SQLiteCache(Cache):
+    """Persistent SQLite API response cache.
+
+    Can be shared between threads and processes,
+    e.g. consecutive invocations of a command line tool.
+
+    Example:
+        .. code-block:: python
+
+            facade = cherryservers_sdk_python.facade.CherryApiFacade(
+                token="my-token",
+                response_cache=cherryservers_sdk_python.cache.SQLiteCache(),
+            )
+
+            # Answered from disk on the next run.
+            plans = facade.plans.list_by_team(123456)
+
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        ttls: Mapping[str, float] | None = None,
+        stale_ttl: float = 7 * 24 * 3600,
+    ) -> None:
+        """Initialize an SQLite cache, creating the database if needed.
+
+        :param str | os.PathLike[str] | None path: Database path.
+            Defaults to :func:`default_cache_path`.
+        :param Mapping[str, float] | None ttls: See :class:`Cache`.
+        :param float stale_ttl: See :class:`Cache`.
+        """
+        super().__init__(ttls, stale_ttl)
+        path = default_cache_path() if path is None else pathlib.Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, schema TEXT, status_code INTEGER, "
+                "content BLOB, content_type TEXT, stored_at REAL, expires_at REAL)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS tokens (token TEXT, key TEXT, "
+                "PRIMARY KEY (token, key))"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS tokens_key ON tokens (key)")
+            self._db.execute(
+                "DELETE FROM entries WHERE schema != ? OR expires_at < ?",
+                (SCHEMA_VERSION, time.time() - stale_ttl),
+            )
+            self._db.execute(
+                "DELETE FROM tokens WHERE key NOT IN (SELECT key FROM entries)"
+            )
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get a cached entry, if any."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT status_code, content, content_type, stored_at, expires_at "
+                "FROM entries WHERE key = ? AND schema = ?",
+                (key, SCHEMA_VERSION),
+            ).fetchone()
+        return None if row is None else CacheEntry(*row)
+
+    def set(self, key: str, entry: CacheEntry, tokens: Collection[str] = ()) -> None:
+        """Store an entry."""
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, SCHEMA_VERSION, *entry),
+            )
+            self._db.execute("DELETE FROM tokens WHERE key = ?", (key,))
+            self._db.executemany(
+                "INSERT OR IGNORE INTO tokens VALUES (?, ?)",
+                [(token, key) for token in tokens],
+            )
+
+    def invalidate(self, tokens: Iterable[str]) -> None:
+        """Remove all entries with any of the given tokens."""
+        tokens = list(tokens)
+        placeholders = ", ".join("?" * len(tokens))
+        with self._lock, self._db:
+            keys = [
+                key
+                for (key,) in self._db.execute(
+                    f"SELECT DISTINCT key FROM tokens WHERE token IN ({placeholders})",  # noqa: S608
+                    tokens,
+                )
+            ]
+            self._db.executemany(
+                "DELETE FROM entries WHERE key = ?", [(k,) for k in keys]
+            )
+            self._db.executemany(
+                "DELETE FROM tokens WHERE key = ?", [(k,) for k in keys]
+            )
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM entries")
+            self._db.execute("DELETE FROM tokens")
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
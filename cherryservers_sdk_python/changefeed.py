@@ -0,0 +1,206 @@
+"""Cherry Servers project change feed module."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field, SerializeAsAny
+
+from cherryservers_sdk_python import _base, inventory
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from cherryservers_sdk_python import facade
+
+ResourceType = Literal["server", "ip", "block_storage"]
+
+
+class FieldChange(BaseModel):
+    """Change of a single resource model field.
+
+    Attributes:
+        old (Any): Previous field value.
+        new (Any): Current field value.
+
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    old: Any = Field(description="Previous field value.")
+    new: Any = Field(description="Current field value.")
+
+
+class ResourceEvent(BaseModel):
+    """Cherry Servers project change event base.
+
+    Attributes:
+        resource_type (str): Resource type: `server`, `ip` or `block_storage`.
+        resource_id (int | str): Resource ID.
+        model (cherryservers_sdk_python._base.ResourceModel):
+         Current resource model, or the last known one for removed resources.
+
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    resource_type: ResourceType = Field(description="Resource type.")
+    resource_id: int | str = Field(description="Resource ID.")
+    model: SerializeAsAny[_base.ResourceModel] = Field(
+        description="Current resource model, "
+        "or the last known one for removed resources."
+    )
+
+
+class ResourceAdded(ResourceEvent):
+    """A resource appeared in the project."""
+
+
+class ResourceRemoved(ResourceEvent):
+    """A resource disappeared from the project."""
+
+
+class ResourceChanged(ResourceEvent):
+    """A resource changed.
+
+    Attributes:
+        previous (cherryservers_sdk_python._base.ResourceModel):
+         Previous resource model.
+        changes (dict[str, FieldChange]): Changed fields, by field name.
+
+    """
+
+    previous: SerializeAsAny[_base.ResourceModel] = Field(
+        description="Previous resource model."
+    )
+    changes: dict[str, FieldChange] = Field(
+        description="Changed fields, by field name."
+    )
+
+
+def _field_changes(
+    previous: _base.ResourceModel, current: _base.ResourceModel
+) -> dict[str, FieldChange]:
+    changes: dict[str, FieldChange] = {}
+    for name in type(current).model_fields:
+        old, new = getattr(previous, name), getattr(current, name)
+        if old != new:
+            changes[name] = FieldChange(old=old, new=new)
+    return changes
+
+
+class ProjectWatcher:
+    """Cherry Servers project watcher.
+
+    Polls the servers, IP addresses and block storages of a project
+    and reports the differences from the previous poll as events.
+    Each record is compared to its previous model with `==`,
+    which compares field values without serializing the models,
+    so only records that actually changed are diffed field by field.
+    The first poll reports every resource as added.
+
+    Example:
+        .. code-block:: python
+
+            facade = cherryservers_sdk_python.facade.CherryApiFacade(
+                token="my-token", thread_safe=True
+            )
+            watcher = cherryservers_sdk_python.changefeed.ProjectWatcher(
+                facade, 123456
+            )
+
+            for events in watcher.watch(interval=30):
+                for event in events:
+                    if isinstance(
+                        event, cherryservers_sdk_python.changefeed.ResourceChanged
+                    ):
+                        print(event.resource_id, event.changes)
+
+    """
+
+    def __init__(self, api_facade: facade.CherryApiFacade, project_id: int) -> None:
+        """Initialize a project watcher.
+
+        The listings are sent in parallel, so the facade should be created
+        with `thread_safe=True`.
+
+        :param cherryservers_sdk_python.facade.CherryApiFacade api_facade:
+            Facade used to list resources.
+        :param int project_id: Project ID.
+        """
+        self._facade = api_facade
+        self._project_id = project_id
+        self._state: dict[tuple[ResourceType, int | str], _base.ResourceModel] = {}
+
+    @property
+    def project_id(self) -> int:
+        """Watched project ID."""
+        return self._project_id
+
+    def _list(self) -> dict[tuple[ResourceType, int | str], _base.ResourceModel]:
+        snapshot = inventory.ProjectSnapshot.fetch(
+            self._facade, self._project_id, backup_storages=False
+        )
+        listed: Sequence[tuple[ResourceType, Sequence[_base.Resource[Any, Any]]]] = (
+            ("server", snapshot.servers),
+            ("ip", snapshot.ips),
+            ("block_storage", snapshot.block_storages),
+        )
+        return {
+            (resource_type, resource.get_model().id): resource.get_model()
+            for resource_type, resources in listed
+            for resource in resources
+        }
+
+    def poll(self) -> list[ResourceEvent]:
+        """List project resources and get the changes since the previous poll."""
+        current = self._list()
+        events: list[ResourceEvent] = []
+
+        for key, model in current.items():
+            resource_type, resource_id = key
+            previous = self._state.get(key)
+            if previous is None:
+                events.append(
+                    ResourceAdded(
+                        resource_type=resource_type,
+                        resource_id=resource_id,
+                        model=model,
+                    )
+                )
+            elif previous != model:
+                events.append(
+                    ResourceChanged(
+                        resource_type=resource_type,
+                        resource_id=resource_id,
+                        model=model,
+                        previous=previous,
+                        changes=_field_changes(previous, model),
+                    )
+                )
+
+        events.extend(
+            ResourceRemoved(
+                resource_type=resource_type, resource_id=resource_id, model=model
+            )
+            for (resource_type, resource_id), model in self._state.items()
+            if (resource_type, resource_id) not in current
+        )
+        self._state = current
+        return events
+
+    def watch(
+        self, interval: float = 30, *, skip_empty: bool = True
+    ) -> Iterator[list[ResourceEvent]]:
+        """Poll the project periodically, yielding the events of each poll.
+
+        :param float interval: Time between polls in seconds.
+        :param bool skip_empty: Whether to skip polls with no changes.
+        """
+        while True:
+            started = time.monotonic()
+            events = self.poll()
+            if events or not skip_empty:
+                yield events
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
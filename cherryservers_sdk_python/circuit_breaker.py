@@ -0,0 +1,211 @@
+"""Cherry Servers API circuit breaker.
+
+A circuit breaker stops sending requests to an API endpoint that keeps failing,
+so that callers fail fast instead of waiting for timeouts.
+Endpoints are tracked separately by template, e.g. `servers/{id}/actions`,
+so failures of one API subsystem don't affect requests to healthy ones.
+
+A circuit opens when the failure rate of the latest requests to an endpoint
+reaches a threshold. While open, requests fail with
+:class:`cherryservers_sdk_python.errors.CircuitOpenError` without being sent.
+After a cool-down the circuit becomes half-open and lets probe requests through:
+it closes if they succeed and opens again if they fail.
+Only server errors, timeouts and connection errors count as failures.
+"""
+
+from __future__ import annotations
+
+import collections
+import threading
+import time
+from typing import TYPE_CHECKING, Literal, NamedTuple
+
+import requests
+
+from cherryservers_sdk_python import errors
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+State = Literal["closed", "open", "half_open"]
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Get the template of an API path, replacing resource IDs with `{id}`.
+
+    For example, `servers/123/actions` becomes `servers/{id}/actions`.
+    """
+    return "/".join(
+        "{id}" if i % 2 else segment
+        for i, segment in enumerate(endpoint.strip("/").split("/"))
+    )
+
+
+def is_failure(error: BaseException) -> bool:
+    """Whether a request error indicates an unhealthy endpoint.
+
+    Requests cut short by an operation deadline are not failures,
+    since the caller ran out of time rather than the endpoint.
+    """
+    return isinstance(
+        error,
+        errors.ServerError
+        | errors.RequestTimeoutError
+        | requests.exceptions.ConnectionError,
+    ) and not isinstance(error, errors.DeadlineExceededError)
+
+
+class CircuitState(NamedTuple):
+    """Circuit state of an endpoint template.
+
+    Attributes:
+        state (str): `closed`, `open` or `half_open`.
+        calls (int): Number of recorded recent requests.
+        failures (int): Number of failed recent requests.
+        opened_at (float | None): Time the circuit last opened,
+         on the breaker clock.
+
+    """
+
+    state: State
+    calls: int
+    failures: int
+    opened_at: float | None
+
+
+class _Circuit:
+    def __init__(self, window_size: int) -> None:
+        self.state: State = "closed"
+        self.outcomes: collections.deque[bool] = collections.deque(maxlen=window_size)
+        self.opened_at: float | None = None
+        self.retry_at = 0.0
+        self.probes = 0
+
+
+class CircuitBreaker:
+    """Per-endpoint circuit breaker.
+
+    Example:
+        .. code-block:: python
+
+            breaker = cherryservers_sdk_python.circuit_breaker.CircuitBreaker()
+            facade = cherryservers_sdk_python.facade.CherryApiFacade(
+                token="my-token", breaker=breaker
+            )
+
+            try:
+                facade.backup_storages.list_by_project(123456)
+            except cherryservers_sdk_python.errors.CircuitOpenError:
+                print("backup storages are degraded")
+
+            print(breaker.states())
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        failure_rate_threshold: float = 0.5,
+        minimum_calls: int = 10,
+        window_size: int = 20,
+        open_duration: float = 30,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a circuit breaker with all circuits closed.
+
+        :param float failure_rate_threshold: Failure rate of recent requests
+            at which a circuit opens.
+        :param int minimum_calls: Number of recent requests needed
+            before the failure rate is considered.
+        :param int window_size: Number of recent requests per endpoint
+            the failure rate is computed from.
+        :param float open_duration: Seconds a circuit stays open
+            before probe requests are let through.
+        :param int half_open_max_calls: Number of concurrent probe requests
+            of a half-open circuit.
+        :param Callable[[], float] clock: Monotonic clock in seconds.
+        """
+        self._failure_rate_threshold = failure_rate_threshold
+        self._minimum_calls = minimum_calls
+        self._window_size = window_size
+        self._open_duration = open_duration
+        self._half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _Circuit] = {}
+
+    def before_request(self, method: str, endpoint: str) -> None:
+        """Check whether a request may be sent.
+
+        :raises cherryservers_sdk_python.errors.CircuitOpenError:
+            If the endpoint circuit is open.
+        """
+        template = endpoint_template(endpoint)
+        with self._lock:
+            circuit = self._circuits.get(template)
+            if circuit is None or circuit.state == "closed":
+                return
+            if circuit.state == "open":
+                now = self._clock()
+                if now < circuit.retry_at:
+                    raise errors.CircuitOpenError(
+                        template,
+                        method=method,
+                        endpoint=endpoint,
+                        retry_after=circuit.retry_at - now,
+                    )
+                circuit.state = "half_open"
+                circuit.probes = 0
+            if circuit.probes >= self._half_open_max_calls:
+                raise errors.CircuitOpenError(
+                    template, method=method, endpoint=endpoint, retry_after=None
+                )
+            circuit.probes += 1
+
+    def record(self, endpoint: str, *, failed: bool) -> None:
+        """Record the outcome of a sent request."""
+        template = endpoint_template(endpoint)
+        with self._lock:
+            circuit = self._circuits.setdefault(template, _Circuit(self._window_size))
+            if circuit.state == "half_open":
+                circuit.probes -= 1
+                if failed:
+                    self._open(circuit)
+                else:
+                    circuit.state = "closed"
+                    circuit.outcomes.clear()
+                return
+
+            circuit.outcomes.append(failed)
+            calls = len(circuit.outcomes)
+            if (
+                circuit.state == "closed"
+                and calls >= self._minimum_calls
+                and sum(circuit.outcomes) / calls >= self._failure_rate_threshold
+            ):
+                self._open(circuit)
+
+    def _open(self, circuit: _Circuit) -> None:
+        circuit.state = "open"
+        circuit.opened_at = self._clock()
+        circuit.retry_at = circuit.opened_at + self._open_duration
+        circuit.outcomes.clear()
+
+    def states(self) -> dict[str, CircuitState]:
+        """Get the circuit state of every endpoint template requested so far."""
+        with self._lock:
+            return {
+                template: CircuitState(
+                    circuit.state,
+                    len(circuit.outcomes),
+                    sum(circuit.outcomes),
+                    circuit.opened_at,
+                )
+                for template, circuit in self._circuits.items()
+            }
+
+    def reset(self) -> None:
+        """Close all circuits and forget their history."""
+        with self._lock:
+            self._circuits.clear()
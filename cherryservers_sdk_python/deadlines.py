@@ -0,0 +1,174 @@
+"""Cherry Servers operation deadlines.
+
+A deadline bounds the total duration of a composite operation,
+such as creating a server, waiting for it to deploy and fetching it again.
+While a :class:`Deadline` is active, every API request is sent with
+the remaining time as its timeout, waits for resource state changes
+end at the deadline, and requests fail with
+:class:`cherryservers_sdk_python.errors.DeadlineExceededError`
+instead of being sent once the deadline has passed.
+
+Deadlines are held in a context variable, so they apply to the current thread
+or asyncio task, and to the worker threads the SDK itself starts for them.
+Nested deadlines can only shorten the time left.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import time
+from typing import TYPE_CHECKING
+
+from cherryservers_sdk_python import errors
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from cherryservers_sdk_python import transports
+
+_current: contextvars.ContextVar[Deadline | None] = contextvars.ContextVar(
+    "cherryservers_deadline", default=None
+)
+
+
+def current() -> Deadline | None:
+    """Get the active deadline of the current context, if any."""
+    return _current.get()
+
+
+def cap(seconds: float) -> float:
+    """Limit a duration to the time left until the active deadline."""
+    deadline = _current.get()
+    remaining = None if deadline is None else deadline.remaining()
+    return seconds if remaining is None else min(seconds, remaining)
+
+
+class Deadline:
+    """Deadline of an operation, with connect and read timeouts of its requests.
+
+    The deadline is counted from its creation and applies
+    while it is used as a context manager. Each deadline can be entered once.
+
+    Example:
+        .. code-block:: python
+
+            with cherryservers_sdk_python.deadlines.Deadline(
+                900, connect_timeout=5, read_timeout=60
+            ):
+                server = facade.servers.create(creation_req, project_id=123456)
+                server.power_off()
+
+    """
+
+    def __init__(
+        self,
+        timeout: float | None = None,
+        *,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a deadline.
+
+        :param float | None timeout: Seconds until the deadline,
+            or `None` to only set request timeouts.
+        :param float | None connect_timeout: Timeout for establishing
+            connections in seconds. Defaults to the enclosing deadline's,
+            or to the request timeout of the resource client.
+        :param float | None read_timeout: Timeout for receiving responses
+            in seconds. Defaults to the enclosing deadline's,
+            or to the request timeout of the resource client.
+        :param Callable[[], float] clock: Monotonic clock in seconds.
+        """
+        self._clock = clock
+        self._expires_at = None if timeout is None else clock() + timeout
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self._parent: Deadline | None = None
+        self._entered = False
+        self._token: contextvars.Token[Deadline | None] | None = None
+
+    def __enter__(self) -> Self:
+        """Make this the active deadline of the current context.
+
+        :raises RuntimeError: If the deadline has already been entered.
+        """
+        if self._entered:
+            msg = "Deadline can only be entered once"
+            raise RuntimeError(msg)
+        self._entered = True
+        # The enclosing deadline is kept after exit, so that work started
+        # in copies of this context is still bounded by it.
+        self._parent = _current.get()
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Restore the previously active deadline."""
+        if self._token is not None:
+            _current.reset(self._token)
+            self._token = None
+
+    def remaining(self) -> float | None:
+        """Get the seconds left, or `None` if there is no deadline."""
+        remaining = None
+        if self._expires_at is not None:
+            remaining = max(0.0, self._expires_at - self._clock())
+        if self._parent is not None:
+            parent_remaining = self._parent.remaining()
+            if remaining is None or (
+                parent_remaining is not None and parent_remaining < remaining
+            ):
+                remaining = parent_remaining
+        return remaining
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def _timeouts(self) -> tuple[float | None, float | None]:
+        connect_timeout, read_timeout = self._connect_timeout, self._read_timeout
+        if self._parent is not None:
+            parent_connect_timeout, parent_read_timeout = self._parent._timeouts()  # noqa: SLF001
+            if connect_timeout is None:
+                connect_timeout = parent_connect_timeout
+            if read_timeout is None:
+                read_timeout = parent_read_timeout
+        return connect_timeout, read_timeout
+
+    def request_timeout(self, default: float) -> transports.Timeout:
+        """Get the timeout of a request sent now.
+
+        :param float default: Request timeout used for timeouts
+            the deadline does not set.
+
+        :returns Timeout: Timeout in seconds if connect and read timeouts
+            are equal, otherwise a `(connect, read)` tuple.
+        """
+        connect_timeout, read_timeout = self._timeouts()
+        connect = default if connect_timeout is None else connect_timeout
+        read = default if read_timeout is None else read_timeout
+        remaining = self.remaining()
+        if remaining is not None:
+            connect, read = min(connect, remaining), min(read, remaining)
+        return connect if connect == read else (connect, read)
+
+    def check(self, method: str, endpoint: str) -> None:
+        """Check that a request may still be sent.
+
+        :raises cherryservers_sdk_python.errors.DeadlineExceededError:
+            If the deadline has passed.
+        """
+        if self.expired:
+            msg = f"Deadline exceeded before {method} {endpoint}"
+            raise errors.DeadlineExceededError(msg, method=method, endpoint=endpoint)
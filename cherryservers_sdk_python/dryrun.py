@@ -0,0 +1,420 @@
+"""Cherry Servers API dry runs.
+
+In dry-run mode, API requests that would change anything are recorded
+instead of sent, and answered with synthetic responses,
+so SDK code runs through unchanged while nothing is created, changed or deleted.
+Read requests are still sent, or served from the response cache of the facade,
+and their latencies recorded.
+
+The recorded calls make up a :class:`DryRunPlan`, with call counts per endpoint
+and an estimate of how long the operation would take,
+based on the recorded latencies and on server transition history,
+to size rate limits and concurrency before running it for real.
+
+Synthetic responses are built from the current state of the affected
+resource and the request, so they only approximate real responses.
+Resources created in a dry run can be retrieved by ID, but are not listed.
+
+Example:
+    .. code-block:: python
+
+        facade = cherryservers_sdk_python.facade.CherryApiFacade(
+            token="my-token", dry_run=True
+        )
+        facade.servers.reboot_many(server_ids)
+
+        plan = facade.dry_run_plan()
+        print(plan.counts)
+        print(plan.estimate(concurrency=10))
+
+"""
+
+from __future__ import annotations
+
+import collections
+import itertools
+import json
+import re
+import statistics
+import threading
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from cherryservers_sdk_python import (
+    _resource_polling,
+    cache,
+    circuit_breaker,
+    transports,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Mapping
+
+    import requests
+
+_ACTION = re.compile(r"^servers/([^/]+)/actions$")
+_ATTACHMENT = re.compile(r"^storages/([^/]+)/attachments$")
+# Request fields echoed in synthetic responses, which have the same type
+# in requests and resource models.
+_ECHOED_FIELDS = (
+    "name",
+    "hostname",
+    "label",
+    "key",
+    "tags",
+    "size",
+    "ptr_record",
+    "a_record",
+    "description",
+)
+
+
+class RecordedCall(NamedTuple):
+    """API call made in a dry run.
+
+    Attributes:
+        method (str): HTTP method.
+        endpoint (str): API path.
+        body (dict[str, Any] | None): Request body.
+        sent (bool): Whether the call was sent to the API.
+         Only read requests of existing resources are.
+        latency (float): Measured latency of a sent call, otherwise
+         the estimated latency, in seconds.
+        transition (float): Estimated duration of the server transition
+         the call starts, such as deploying a new server, in seconds.
+
+    """
+
+    method: str
+    endpoint: str
+    body: dict[str, Any] | None
+    sent: bool
+    latency: float
+    transition: float = 0
+
+    @property
+    def template(self) -> str:
+        """Endpoint template, such as `servers/{id}/actions`."""
+        return f"{self.method} {circuit_breaker.endpoint_template(self.endpoint)}"
+
+
+class DryRunPlan:
+    """API calls recorded in a dry run, with duration estimates."""
+
+    def __init__(self, calls: list[RecordedCall]) -> None:
+        """Initialize a dry-run plan.
+
+        :param list[RecordedCall] calls: Recorded calls, in order.
+        """
+        self.calls = calls
+
+    @property
+    def counts(self) -> dict[str, int]:
+        """Number of calls per endpoint template, such as `GET servers/{id}`."""
+        return dict(collections.Counter(call.template for call in self.calls))
+
+    @property
+    def mutations(self) -> list[RecordedCall]:
+        """Calls that would change something, which were not sent."""
+        return [call for call in self.calls if call.method != "GET"]
+
+    @property
+    def request_time(self) -> float:
+        """Total latency of all calls in seconds."""
+        return sum(call.latency for call in self.calls)
+
+    @property
+    def transition_time(self) -> float:
+        """Total duration of all started server transitions in seconds."""
+        return sum(call.transition for call in self.calls)
+
+    def estimate(self, concurrency: int = 1) -> float:
+        """Estimate how long the recorded calls would take, in seconds.
+
+        :param int concurrency: Number of calls made at once.
+            Calls and the transitions they start are assumed to spread
+            evenly over concurrent workers.
+        """
+        longest = max(
+            (call.latency + call.transition for call in self.calls), default=0
+        )
+        return max(longest, (self.request_time + self.transition_time) / concurrency)
+
+
+class ReadOnlyTransitionHistory(_resource_polling.TransitionHistory):
+    """Transition history that estimates from another one, without recording.
+
+    Server transitions complete instantly in a dry run,
+    so they must not be recorded as real durations.
+    """
+
+    def __init__(self, history: _resource_polling.TransitionHistory) -> None:
+        """Initialize a read-only view of a transition history."""
+        super().__init__()
+        self._history = history
+
+    def record(self, duration: float, *key: str) -> None:
+        """Ignore a transition."""
+
+    def estimate(self, *key: str) -> float | None:
+        """Estimate the duration of a transition from the wrapped history."""
+        return self._history.estimate(*key)
+
+
+class ReadOnlyCache(cache.Cache):
+    """Response cache that serves entries from another one, without changing it.
+
+    Mutations are not sent in a dry run, so they must not invalidate entries
+    of a cache that may be shared with real runs, and synthetic responses
+    must not be stored in it.
+    """
+
+    def __init__(self, response_cache: cache.Cache) -> None:
+        """Initialize a read-only view of a response cache."""
+        super().__init__({}, response_cache.stale_ttl)
+        self._cache = response_cache
+
+    def ttl_for(self, path: str) -> float | None:
+        """Get the TTL of an API path in the wrapped cache."""
+        return self._cache.ttl_for(path)
+
+    def get(self, key: str) -> cache.CacheEntry | None:
+        """Get an entry of the wrapped cache, if any."""
+        return self._cache.get(key)
+
+    def set(
+        self,
+        key: str,
+        entry: cache.CacheEntry,
+        tokens: Collection[str] = (),
+    ) -> None:
+        """Ignore an entry."""
+
+    def invalidate(self, tokens: Iterable[str]) -> None:
+        """Ignore an invalidation."""
+
+    def clear(self) -> None:
+        """Ignore clearing."""
+
+
+class _Record(NamedTuple):
+    method: str
+    endpoint: str
+    body: dict[str, Any] | None
+    latency: float | None
+    transition: tuple[str, str, str] | None
+
+
+class DryRunTransport(transports.Transport):
+    """Transport that records mutating API calls instead of sending them.
+
+    Typically created by :class:`cherryservers_sdk_python.facade.CherryApiFacade`
+    with `dry_run=True`.
+    """
+
+    def __init__(
+        self,
+        transport: transports.Transport | None = None,
+        *,
+        base_url: str = "https://api.cherryservers.com/v1/",
+        default_latency: float = 0.5,
+    ) -> None:
+        """Initialize a dry-run transport.
+
+        :param transports.Transport | None transport: Transport read requests
+            are sent with, or `None` to answer them as not found.
+        :param str base_url: API endpoint base URL.
+        :param float default_latency: Latency assumed for calls
+            to endpoints without any measured latency, in seconds.
+        """
+        self._transport = transport
+        self._base_url = base_url
+        self._default_latency = default_latency
+        self._lock = threading.Lock()
+        self._records: list[_Record] = []
+        self._resources: dict[str, dict[str, Any]] = {}
+        self._deleted: set[str] = set()
+        self._ids = itertools.count(1)
+
+    def send(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None,
+        data: str | None,
+        headers: Mapping[str, str],
+        timeout: transports.Timeout,
+    ) -> requests.Response:
+        """Send a read request, or record any other request."""
+        path = url.removeprefix(self._base_url).split("?")[0].strip("/")
+        body = json.loads(data) if data else None
+        if method != "GET":
+            status_code, resp, transition = self._synthesize(
+                method, path, body or {}, headers, timeout
+            )
+            self._record(_Record(method, path, body, None, transition))
+            content = json.dumps(resp).encode() if resp is not None else b""
+            return transports.build_response(status_code, content, url)
+
+        with self._lock:
+            synthetic = self._resources.get(path)
+            deleted = path in self._deleted
+        if synthetic is not None or deleted or self._transport is None:
+            self._record(_Record(method, path, None, None, None))
+            if synthetic is None:
+                return _not_found(url)
+            return transports.build_response(200, json.dumps(synthetic).encode(), url)
+
+        started = time.monotonic()
+        response = self._transport.send(
+            method, url, params=params, data=data, headers=headers, timeout=timeout
+        )
+        self._record(_Record(method, path, None, time.monotonic() - started, None))
+        return response
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        if self._transport is not None:
+            self._transport.close()
+
+    def _record(self, record: _Record) -> None:
+        with self._lock:
+            self._records.append(record)
+
+    def reset(self) -> None:
+        """Forget recorded calls and synthetic resources."""
+        with self._lock:
+            self._records.clear()
+            self._resources.clear()
+            self._deleted.clear()
+
+    def plan(
+        self, transition_history: _resource_polling.TransitionHistory | None = None
+    ) -> DryRunPlan:
+        """Get the calls recorded so far.
+
+        :param TransitionHistory | None transition_history:
+            History used to estimate server transitions, such as
+            :attr:`cherryservers_sdk_python.servers.ServerClient.transition_history`.
+        """
+        with self._lock:
+            records = list(self._records)
+
+        measured: dict[str, list[float]] = collections.defaultdict(list)
+        for record in records:
+            if record.latency is not None:
+                template = circuit_breaker.endpoint_template(record.endpoint)
+                measured[f"{record.method} {template}"].append(record.latency)
+
+        calls: list[RecordedCall] = []
+        for record in records:
+            call = RecordedCall(
+                record.method,
+                record.endpoint,
+                record.body,
+                sent=record.latency is not None,
+                latency=record.latency or 0,
+            )
+            latency = record.latency
+            if latency is None:
+                latencies = measured.get(call.template)
+                latency = (
+                    statistics.median(latencies) if latencies else self._default_latency
+                )
+            transition = None
+            if record.transition is not None and transition_history is not None:
+                transition = transition_history.estimate(*record.transition)
+            calls.append(call._replace(latency=latency, transition=transition or 0))
+        return DryRunPlan(calls)
+
+    def _current(
+        self, path: str, headers: Mapping[str, str], timeout: transports.Timeout
+    ) -> dict[str, Any]:
+        """Get the current state of a resource, to build a response from."""
+        with self._lock:
+            synthetic = self._resources.get(path)
+        if synthetic is not None:
+            return dict(synthetic)
+        resource_id = path.rsplit("/", 1)[-1]
+        fallback = {
+            "id": int(resource_id) if resource_id.isdigit() else resource_id,
+            "status": "deployed",
+        }
+        if self._transport is None:
+            return fallback
+        response = self._transport.send(
+            "GET",
+            self._base_url + path,
+            params=None,
+            data=None,
+            headers=headers,
+            timeout=timeout,
+        )
+        return response.json() if response.ok else fallback
+
+    def _synthesize(
+        self,
+        method: str,
+        path: str,
+        body: dict[str, Any],
+        headers: Mapping[str, str],
+        timeout: transports.Timeout,
+    ) -> tuple[int, dict[str, Any] | None, tuple[str, str, str] | None]:
+        """Build the response to a mutating request.
+
+        :returns: Status code, response body and the transition key
+            of the server transition the request starts, if any.
+        """
+        if method == "DELETE":
+            with self._lock:
+                if _ATTACHMENT.match(path) is None:
+                    self._resources.pop(path, None)
+                    self._deleted.add(path)
+            return 204, None, None
+
+        echoed = {k: body[k] for k in _ECHOED_FIELDS if body.get(k) is not None}
+        action = _ACTION.match(path)
+        attachment = _ATTACHMENT.match(path)
+        transition = None
+        if action is not None:
+            resource_path = f"servers/{action.group(1)}"
+            resource = {**self._current(resource_path, headers, timeout), **echoed}
+            transition = _transition_key(resource, body.get("type", "action"))
+        elif attachment is not None:
+            resource_path = f"storages/{attachment.group(1)}"
+            resource = self._current(resource_path, headers, timeout)
+            resource["attached_to"] = {"id": body.get("attach_to")}
+        elif method == "POST":
+            collection = path.rsplit("/", 1)[-1]
+            number = next(self._ids)
+            resource_id: int | str = (
+                f"dry-run-{number}" if collection == "ips" else -number
+            )
+            resource_path = f"{collection}/{resource_id}"
+            resource = {
+                "id": resource_id,
+                "status": "deployed",
+                "href": f"/{resource_path}",
+                **echoed,
+            }
+            if collection == "servers":
+                transition = (body.get("plan", ""), body.get("region", ""), "create")
+        else:
+            resource_path = path
+            resource = {**self._current(path, headers, timeout), **echoed}
+
+        with self._lock:
+            self._resources[resource_path] = resource
+        return 201, resource, transition
+
+
+def _transition_key(server: dict[str, Any], action_type: str) -> tuple[str, str, str]:
+    plan = (server.get("plan") or {}).get("slug", "")
+    region = (server.get("region") or {}).get("slug", "")
+    return plan, region, action_type.replace("-", "_")
+
+
+def _not_found(url: str) -> requests.Response:
+    body = json.dumps({"code": 404, "message": "Resource not found"}).encode()
+    return transports.build_response(404, body, url)
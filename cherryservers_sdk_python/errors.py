@@ -0,0 +1,176 @@
+"""Cherry Servers API errors.
+
+Errors raised for unsuccessful API requests.
+All of them subclass `requests.exceptions.HTTPError`,
+so existing handlers of it keep working.
+Use :attr:`ApiError.retryable` to decide whether a request may be retried.
+"""
+
+from __future__ import annotations
+
+import email.utils
+import time
+from typing import TYPE_CHECKING
+
+import requests
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+class ApiError(requests.exceptions.HTTPError):
+    """Cherry Servers API request failed.
+
+    Attributes:
+        method (str): HTTP method of the request.
+        endpoint (str): API path of the request, e.g. `servers/123456`.
+        status_code (int | None): Response status code,
+         `None` if no response was received.
+        request_id (str | None): API request ID, if the response included one.
+
+    """
+
+    retryable = False
+    """Whether the request may succeed if retried later."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        method: str,
+        endpoint: str,
+        response: requests.Response | None = None,
+    ) -> None:
+        """Initialize error."""
+        super().__init__(message, response=response)
+        self.method = method
+        self.endpoint = endpoint
+        self.status_code = None if response is None else response.status_code
+        self.request_id = (
+            None if response is None else response.headers.get("X-Request-Id")
+        )
+
+
+class NotFoundError(ApiError):
+    """Requested resource does not exist."""
+
+
+class ConflictError(ApiError):
+    """Request conflicts with the current resource state."""
+
+
+class RateLimitedError(ApiError):
+    """Too many requests were sent.
+
+    Attributes:
+        retry_after (float | None): Seconds to wait before retrying,
+         if the API specified it.
+
+    """
+
+    retryable = True
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        method: str,
+        endpoint: str,
+        response: requests.Response | None = None,
+    ) -> None:
+        """Initialize error."""
+        super().__init__(message, method=method, endpoint=endpoint, response=response)
+        self.retry_after = (
+            None if response is None else _parse_retry_after(response.headers)
+        )
+
+
+class ServerError(ApiError):
+    """API failed to handle the request."""
+
+    retryable = True
+
+
+class RequestTimeoutError(ApiError, requests.exceptions.Timeout):
+    """Request timed out before a response was received."""
+
+    retryable = True
+
+
+class DeadlineExceededError(RequestTimeoutError):
+    """Request was not completed within the deadline of the calling operation.
+
+    Raised instead of sending requests once
+    a :class:`cherryservers_sdk_python.deadlines.Deadline` has expired.
+    Not retryable, since the whole operation has run out of time.
+    """
+
+    retryable = False
+
+
+class CircuitOpenError(ApiError):
+    """Request was not sent, since its endpoint is failing.
+
+    Raised by :class:`cherryservers_sdk_python.circuit_breaker.CircuitBreaker`.
+
+    Attributes:
+        template (str): Endpoint template of the open circuit.
+        retry_after (float | None): Seconds until requests are let through again,
+         `None` if probe requests are already in progress.
+
+    """
+
+    retryable = True
+
+    def __init__(
+        self,
+        template: str,
+        *,
+        method: str,
+        endpoint: str,
+        retry_after: float | None,
+    ) -> None:
+        """Initialize error."""
+        super().__init__(
+            f"Circuit open for {template}", method=method, endpoint=endpoint
+        )
+        self.template = template
+        self.retry_after = retry_after
+
+
+def _parse_retry_after(headers: Mapping[str, str]) -> float | None:
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+_ERRORS_BY_STATUS: dict[int, type[ApiError]] = {
+    404: NotFoundError,
+    408: RequestTimeoutError,
+    409: ConflictError,
+    429: RateLimitedError,
+}
+
+
+def from_response(response: requests.Response, method: str, endpoint: str) -> ApiError:
+    """Build the error of an unsuccessful API response.
+
+    :param requests.Response response: Unsuccessful response.
+    :param str method: HTTP method of the request.
+    :param str endpoint: API path of the request.
+    """
+    error_type = _ERRORS_BY_STATUS.get(response.status_code)
+    if error_type is None:
+        error_type = ServerError if response.status_code >= 500 else ApiError  # noqa: PLR2004
+    return error_type(
+        response.text, method=method, endpoint=endpoint, response=response
+    )
@@ -6,14 +6,20 @@ from cherryservers_sdk_python import (
     _client,
     backup_storages,
     block_storages,
+    cache,
+    circuit_breaker,
+    dryrun,
+    hedging,
     images,
     ips,
+    operations,
     plans,
     projects,
     regions,
     servers,
     sshkeys,
     teams,
+    transports,
     users,
 )
 
@@ -37,11 +43,25 @@ class CherryApiFacade:
         block_storages (block_storages.BlockStorageClient): Manage EBS resources.
         backup_storages (backup_storages.BackupStorageClient):
          Manage backup storage resources.
+        dry_run (dryrun.DryRunTransport | None): Transport recording
+         API calls, in dry-run mode.
 
     """
 
-    def __init__(
-        self, token: str, user_agent_prefix: str = "", request_timeout: int = 120
+    def __init__(  # noqa: PLR0913
+        self,
+        token: str,
+        user_agent_prefix: str = "",
+        request_timeout: int = 120,
+        *,
+        transport: transports.Transport | None = None,
+        coalesce_gets: bool = False,
+        thread_safe: bool = False,
+        response_cache: cache.Cache | None = None,
+        negative_cache_ttl: float = 0,
+        breaker: circuit_breaker.CircuitBreaker | None = None,
+        hedging: hedging.HedgingPolicy | None = None,
+        dry_run: bool = False,
     ) -> None:
         """Create a new :class:`CherryApiFacade` instance.
 
@@ -50,6 +70,38 @@ class CherryApiFacade:
         :param str user_agent_prefix:
             User-Agent prefix that will be added to the header. Empty by default.
         :param int request_timeout: Default timeout for API requests, in seconds.
+        :param transports.Transport | None transport: HTTP transport used to send
+            API requests, e.g. :class:`transports.HttpxTransport` for HTTP/2.
+            Defaults to :class:`transports.RequestsTransport`.
+        :param bool coalesce_gets: Share a single in-flight request between
+            concurrent identical GET requests. Useful when many threads poll
+            the same resources. Disabled by default.
+        :param bool thread_safe: Use a separate HTTP session for each thread.
+            Enable this when sharing the facade between threads,
+            e.g. in a `ThreadPoolExecutor`. Disabled by default.
+            Only applies to the default transport.
+        :param cache.Cache | None response_cache: Cache GET responses,
+            e.g. :class:`cache.SQLiteCache` to answer catalog queries
+            of short-lived processes from disk, or :class:`cache.MemoryCache`
+            to cache the inventory, invalidated by mutations made through
+            this facade. Disabled by default.
+        :param float negative_cache_ttl: Seconds during which lookups of
+            resources that were not found fail locally with
+            :class:`errors.NotFoundError`. Disabled by default.
+        :param circuit_breaker.CircuitBreaker | None breaker: Fail requests
+            to failing endpoints fast, see :mod:`circuit_breaker`.
+            Its state is available from :meth:`circuit_breaker.CircuitBreaker.states`.
+            Disabled by default.
+        :param hedging.HedgingPolicy | None hedging: Send a second identical
+            GET request when the first one is unusually slow,
+            see :mod:`hedging`. Should be combined with `thread_safe=True`.
+            Disabled by default.
+        :param bool dry_run: Record API calls that would change anything
+            instead of sending them, see :mod:`dryrun`.
+            Read requests are still sent, or served from `response_cache`,
+            which is neither updated nor invalidated in dry-run mode.
+            Server transitions are not recorded in the transition history
+            in dry-run mode, even if it is replaced. Disabled by default.
 
         Example:
             .. code-block:: python
@@ -65,15 +117,34 @@ class CherryApiFacade:
                 server = facade.servers.create(creation_req, project_id=217727)
 
         """
+        self.dry_run: dryrun.DryRunTransport | None = None
+        if dry_run:
+            self.dry_run = dryrun.DryRunTransport(
+                transport or transports.RequestsTransport(thread_safe=thread_safe)
+            )
+            transport = self.dry_run
+            if response_cache is not None:
+                response_cache = dryrun.ReadOnlyCache(response_cache)
+
         self._api_client = _client.CherryApiClient(
-            token=token, user_agent_prefix=user_agent_prefix
+            token=token,
+            user_agent_prefix=user_agent_prefix,
+            transport=transport,
+            coalesce_gets=coalesce_gets,
+            thread_safe=thread_safe,
+            response_cache=response_cache,
+            negative_cache_ttl=negative_cache_ttl,
+            breaker=breaker,
+            hedging=hedging,
         )
 
         self.users = users.UserClient(self._api_client, request_timeout)
 
         self.sshkeys = sshkeys.SSHKeyClient(self._api_client, request_timeout)
 
-        self.projects = projects.ProjectClient(self._api_client, request_timeout)
+        self.projects = projects.ProjectClient(
+            self._api_client, request_timeout, api_facade=self
+        )
 
         self.regions = regions.RegionClient(self._api_client, request_timeout)
 
@@ -85,7 +156,9 @@ class CherryApiFacade:
 
         self.images = images.ImageClient(self._api_client, request_timeout)
 
-        self.servers = servers.ServerClient(self._api_client, request_timeout)
+        self.servers = servers.ServerClient(
+            self._api_client, request_timeout, record_transitions=not dry_run
+        )
 
         self.block_storages = block_storages.BlockStorageClient(
             self._api_client, request_timeout
@@ -94,3 +167,30 @@ class CherryApiFacade:
         self.backup_storages = backup_storages.BackupStorageClient(
             self._api_client, request_timeout
         )
+
+    def operation_graph(
+        self, *, max_workers: int = 10, rate: float | None = None
+    ) -> operations.OperationGraph:
+        """Create a graph of dependent operations, see :mod:`operations`.
+
+        Operations run concurrently, so the facade should be created
+        with `thread_safe=True`.
+
+        :param int max_workers: Maximum number of operations run at once.
+        :param float | None rate: Maximum number of operations started
+            per second, `None` for no limit.
+        """
+        return operations.OperationGraph(max_workers=max_workers, rate=rate)
+
+    def dry_run_plan(self) -> dryrun.DryRunPlan:
+        """Get the API calls recorded in dry-run mode so far.
+
+        Server transitions are estimated with the transition history
+        of :attr:`servers`.
+
+        :raises RuntimeError: If the facade is not in dry-run mode.
+        """
+        if self.dry_run is None:
+            msg = "Facade is not in dry-run mode."
+            raise RuntimeError(msg)
+        return self.dry_run.plan(self.servers.transition_history)
@@ -0,0 +1,786 @@
+"""In-process fake Cherry Servers API.
+
+:class:`FakeCherryApi` is a :class:`cherryservers_sdk_python.transports.Transport`
+that serves the API endpoints used by the SDK from in-memory state,
+without any network access or real resources.
+Resources go through realistic status transitions,
+e.g. a new server is `pending`, then `deploying`, then `deployed`,
+and latencies, server errors and rate limiting can be injected,
+so throughput, polling behaviour and retry policies can be load tested offline.
+
+Example:
+    .. code-block:: python
+
+        api = cherryservers_sdk_python.fake_api.FakeCherryApi(
+            deploy_time=5, latency=(0.05, 0.2), rate_limit_rate=0.01
+        )
+        facade = cherryservers_sdk_python.facade.CherryApiFacade(
+            "fake-token", transport=api
+        )
+        project = facade.projects.create(
+            cherryservers_sdk_python.projects.CreationRequest(name="load-test"),
+            team_id=api.team_id,
+        )
+        server = facade.servers.create(
+            cherryservers_sdk_python.servers.CreationRequest(
+                region="LT-Siauliai", plan="B1-1-1gb-20s-shared"
+            ),
+            project_id=project.get_id(),
+        )
+        print(api.request_counts)
+
+"""
+
+from __future__ import annotations
+
+import collections
+import copy
+import itertools
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from typing import TYPE_CHECKING, Any
+
+from cherryservers_sdk_python import transports
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    import requests
+
+    _Json = dict[str, Any]
+    _Handler = Callable[..., tuple[int, Any]]
+
+
+class _NotFoundError(Exception):
+    """Requested fake resource does not exist."""
+
+
+_REGIONS: list[_Json] = [
+    {
+        "id": 1,
+        "name": "EU-Nord-1",
+        "slug": "LT-Siauliai",
+        "region_iso_2": "LT",
+        "location": "Lithuania, Šiauliai",
+        "href": "/regions/1",
+    },
+    {
+        "id": 2,
+        "name": "EU-West-1",
+        "slug": "NL-Amsterdam",
+        "region_iso_2": "NL",
+        "location": "Netherlands, Amsterdam",
+        "href": "/regions/2",
+    },
+    {
+        "id": 3,
+        "name": "US-Chicago-1",
+        "slug": "US-Chicago",
+        "region_iso_2": "US",
+        "location": "United States, Chicago",
+        "href": "/regions/3",
+    },
+]
+
+_PLANS: list[_Json] = [
+    {
+        "id": 625,
+        "name": "Cloud VPS 1",
+        "slug": "B1-1-1gb-20s-shared",
+        "type": "vps",
+        "pricing": [{"price": 0.0182, "currency": "EUR", "unit": "Hourly"}],
+    },
+    {
+        "id": 626,
+        "name": "Cloud VPS 2",
+        "slug": "B1-2-2gb-40s-shared",
+        "type": "vps",
+        "pricing": [{"price": 0.0364, "currency": "EUR", "unit": "Hourly"}],
+    },
+    {
+        "id": 161,
+        "name": "E3-1240v3",
+        "slug": "e3_1240v3",
+        "type": "baremetal",
+        "pricing": [{"price": 0.1, "currency": "EUR", "unit": "Hourly"}],
+    },
+]
+
+_IMAGES: list[_Json] = [
+    {"id": 1, "name": "Ubuntu 24.04 64bit", "slug": "ubuntu_24_04_64bit"},
+    {"id": 2, "name": "Fedora 41 64bit", "slug": "fedora_41_64bit"},
+    {"id": 3, "name": "Debian 12 64bit", "slug": "debian_12_64bit"},
+]
+
+_BACKUP_PLANS: list[_Json] = [
+    {"id": 1, "name": "Backup 50", "slug": "backup_50", "size_gigabytes": 50},
+    {"id": 2, "name": "Backup 500", "slug": "backup_500", "size_gigabytes": 500},
+]
+
+
+class FakeCherryApi(transports.Transport):
+    """In-process fake Cherry Servers API.
+
+    State transitions are driven by `clock`, so tests can advance time manually,
+    while load tests use the real monotonic clock.
+
+    :param str base_url: API base URL that requests are expected to use.
+    :param float | tuple[float, float] latency: Simulated latency of every request,
+        in seconds. A tuple is treated as a uniform random range.
+    :param float error_rate: Probability of a request failing with HTTP 500.
+    :param float rate_limit_rate: Probability of a request
+        being rejected with HTTP 429.
+    :param int retry_after: `Retry-After` header value of HTTP 429 responses.
+    :param float deploy_time: Time in seconds for servers to be deployed,
+        after creation or rebuild. Also applies to backup storages.
+    :param float action_time: Time in seconds for server power, reboot
+        and rescue mode actions to complete.
+    :param float resize_time: Time in seconds for a storage resize to complete.
+    :param int | None seed: Seed for error and latency randomness.
+    :param Callable[[], float] clock: Time source, in seconds.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        base_url: str = "https://api.cherryservers.com/v1/",
+        latency: float | tuple[float, float] = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: int = 1,
+        deploy_time: float = 0.0,
+        action_time: float = 0.0,
+        resize_time: float = 0.0,
+        seed: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a fake Cherry Servers API."""
+        self.base_url = base_url
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.deploy_time = deploy_time
+        self.action_time = action_time
+        self.resize_time = resize_time
+        self._clock = clock
+        self._random = random.Random(seed)  # noqa: S311
+        self._lock = threading.RLock()
+        self._ids = itertools.count(100000)
+
+        self.team_id = 1
+        self.request_counts: collections.Counter[tuple[str, str]] = (
+            collections.Counter()
+        )
+        self.projects: dict[int, _Json] = {}
+        self.servers: dict[int, _Json] = {}
+        self.ips: dict[str, _Json] = {}
+        self.storages: dict[int, _Json] = {}
+        self.backup_storages: dict[int, _Json] = {}
+        self.sshkeys: dict[int, _Json] = {}
+
+        routes: list[tuple[str, str, _Handler]] = [
+            ("GET", r"regions", self._list_regions),
+            ("GET", r"regions/(\d+)", self._get_region),
+            ("GET", r"teams/(\d+)/plans", self._list_plans),
+            ("GET", r"plans/([^/]+)", self._get_plan),
+            ("GET", r"plans/([^/]+)/images", self._list_images),
+            ("GET", r"backup-storage-plans", self._list_backup_plans),
+            ("GET", r"teams/(\d+)/projects", self._list_projects),
+            ("POST", r"teams/(\d+)/projects", self._create_project),
+            ("GET", r"projects/(\d+)", self._get_project),
+            ("PUT", r"projects/(\d+)", self._update_project),
+            ("DELETE", r"projects/(\d+)", self._delete_project),
+            ("GET", r"ssh-keys", self._list_sshkeys),
+            ("POST", r"ssh-keys", self._create_sshkey),
+            ("GET", r"ssh-keys/(\d+)", self._get_sshkey),
+            ("PUT", r"ssh-keys/(\d+)", self._update_sshkey),
+            ("DELETE", r"ssh-keys/(\d+)", self._delete_sshkey),
+            ("GET", r"projects/(\d+)/servers", self._list_servers),
+            ("POST", r"projects/(\d+)/servers", self._create_server),
+            ("GET", r"servers/(\d+)", self._get_server),
+            ("PUT", r"servers/(\d+)", self._update_server),
+            ("DELETE", r"servers/(\d+)", self._delete_server),
+            ("POST", r"servers/(\d+)/actions", self._server_action),
+            ("GET", r"projects/(\d+)/ips", self._list_ips),
+            ("POST", r"projects/(\d+)/ips", self._create_ip),
+            ("GET", r"ips/([^/]+)", self._get_ip),
+            ("PUT", r"ips/([^/]+)", self._update_ip),
+            ("DELETE", r"ips/([^/]+)", self._delete_ip),
+            ("GET", r"projects/(\d+)/storages", self._list_storages),
+            ("POST", r"projects/(\d+)/storages", self._create_storage),
+            ("GET", r"storages/(\d+)", self._get_storage),
+            ("PUT", r"storages/(\d+)", self._update_storage),
+            ("DELETE", r"storages/(\d+)", self._delete_storage),
+            ("POST", r"storages/(\d+)/attachments", self._attach_storage),
+            ("DELETE", r"storages/(\d+)/attachments", self._detach_storage),
+            ("GET", r"projects/(\d+)/backup-storages", self._list_backups),
+            ("POST", r"servers/(\d+)/backup-storages", self._create_backup),
+            ("GET", r"backup-storages/(\d+)", self._get_backup),
+            ("PUT", r"backup-storages/(\d+)", self._update_backup),
+            ("DELETE", r"backup-storages/(\d+)", self._delete_backup),
+            (
+                "PATCH",
+                r"backup-storages/(\d+)/methods/([^/]+)",
+                self._update_backup_method,
+            ),
+        ]
+        self._routes = [
+            (method, re.compile(f"^{pattern}$"), handler)
+            for method, pattern, handler in routes
+        ]
+
+    def send(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None,  # noqa: ARG002
+        data: str | None,
+        headers: Mapping[str, str],  # noqa: ARG002
+        timeout: transports.Timeout,  # noqa: ARG002
+    ) -> requests.Response:
+        """Handle a request against the fake API state."""
+        self._sleep_latency()
+        path = url.removeprefix(self.base_url).split("?")[0].strip("/")
+
+        for route_method, pattern, handler in self._routes:
+            match = pattern.match(path)
+            if match is None or route_method != method:
+                continue
+            with self._lock:
+                self.request_counts[method, pattern.pattern] += 1
+                failure = self._inject_failure(url)
+                if failure is not None:
+                    return failure
+                body = json.loads(data) if data else {}
+                try:
+                    status_code, resp = handler(*match.groups(), body=body)
+                except _NotFoundError:
+                    return self._error(url, 404, "Resource not found")
+            return transports.build_response(
+                status_code, json.dumps(resp).encode(), url
+            )
+
+        return self._error(url, 404, f"Unknown endpoint {method} {path}")
+
+    def _sleep_latency(self) -> None:
+        latency = self.latency
+        if isinstance(latency, tuple):
+            with self._lock:
+                latency = self._random.uniform(*latency)
+        if latency > 0:
+            time.sleep(latency)
+
+    def _inject_failure(self, url: str) -> requests.Response | None:
+        roll = self._random.random()
+        if roll < self.rate_limit_rate:
+            return self._error(
+                url,
+                429,
+                "Too many requests",
+                {"Retry-After": str(self.retry_after)},
+            )
+        if roll < self.rate_limit_rate + self.error_rate:
+            return self._error(url, 500, "Internal server error")
+        return None
+
+    @staticmethod
+    def _error(
+        url: str,
+        status_code: int,
+        message: str,
+        headers: dict[str, str] | None = None,
+    ) -> requests.Response:
+        body = json.dumps({"code": status_code, "message": message}).encode()
+        return transports.build_response(status_code, body, url, headers)
+
+    def _now(self) -> float:
+        return self._clock()
+
+    def _next_id(self) -> int:
+        return next(self._ids)
+
+    @staticmethod
+    def _find(collection: Mapping[Any, _Json], key: object) -> _Json:
+        try:
+            return collection[key]
+        except KeyError as e:
+            raise _NotFoundError from e
+
+    @staticmethod
+    def _find_by_slug(catalog: list[_Json], id_or_slug: str) -> _Json:
+        for item in catalog:
+            if id_or_slug in (item["slug"], str(item["id"])):
+                return item
+        raise _NotFoundError
+
+    def _project_ref(self, project_id: int) -> _Json:
+        project = self._find(self.projects, project_id)
+        return {k: project[k] for k in ("id", "name", "bgp", "href")}
+
+    @staticmethod
+    def _server_ref(server: _Json) -> _Json:
+        return {k: server[k] for k in ("id", "href", "hostname")}
+
+    def _schedule(self, resource: _Json, *steps: tuple[float, _Json]) -> None:
+        """Schedule resource field changes, relative to now."""
+        now = self._now()
+        resource["_timeline"] = [(now + delay, change) for delay, change in steps]
+
+    def _render(self, resource: _Json) -> _Json:
+        """Apply due scheduled changes and return the public representation."""
+        now = self._now()
+        timeline = resource.get("_timeline", [])
+        while timeline and timeline[0][0] <= now:
+            _, change = timeline.pop(0)
+            resource.update(change)
+        return {k: copy.deepcopy(v) for k, v in resource.items() if k[0] != "_"}
+
+    # Catalog.
+
+    def _list_regions(self, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        return 200, _REGIONS
+
+    def _get_region(self, region_id: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        return 200, self._find_by_slug(_REGIONS, region_id)
+
+    def _list_plans(self, team_id: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        return 200, _PLANS
+
+    def _get_plan(self, plan: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        return 200, self._find_by_slug(_PLANS, plan)
+
+    def _list_images(self, plan: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        self._find_by_slug(_PLANS, plan)
+        return 200, _IMAGES
+
+    def _list_backup_plans(self, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        return 200, _BACKUP_PLANS
+
+    # Projects.
+
+    def _list_projects(self, team_id: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        return 200, list(self.projects.values())
+
+    def _create_project(self, team_id: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        project_id = self._next_id()
+        project = {
+            "id": project_id,
+            "name": body.get("name"),
+            "bgp": {"enabled": bool(body.get("bgp")), "local_asn": 0},
+            "href": f"/projects/{project_id}",
+        }
+        self.projects[project_id] = project
+        return 201, project
+
+    def _get_project(self, project_id: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        return 200, self._find(self.projects, int(project_id))
+
+    def _update_project(self, project_id: str, *, body: _Json) -> tuple[int, Any]:
+        project = self._find(self.projects, int(project_id))
+        if body.get("name") is not None:
+            project["name"] = body["name"]
+        if body.get("bgp") is not None:
+            project["bgp"]["enabled"] = body["bgp"]
+        return 201, project
+
+    def _delete_project(self, project_id: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        self._find(self.projects, int(project_id))
+        del self.projects[int(project_id)]
+        return 204, {}
+
+    # SSH keys.
+
+    def _list_sshkeys(self, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        return 200, list(self.sshkeys.values())
+
+    def _create_sshkey(self, *, body: _Json) -> tuple[int, Any]:
+        key_id = self._next_id()
+        sshkey = {
+            "id": key_id,
+            "label": body.get("label"),
+            "key": body.get("key"),
+            "fingerprint": uuid.uuid5(uuid.NAMESPACE_OID, str(body.get("key"))).hex,
+            "href": f"/ssh-keys/{key_id}",
+        }
+        self.sshkeys[key_id] = sshkey
+        return 201, sshkey
+
+    def _get_sshkey(self, key_id: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        return 200, self._find(self.sshkeys, int(key_id))
+
+    def _update_sshkey(self, key_id: str, *, body: _Json) -> tuple[int, Any]:
+        sshkey = self._find(self.sshkeys, int(key_id))
+        sshkey.update({k: v for k, v in body.items() if v is not None})
+        return 201, sshkey
+
+    def _delete_sshkey(self, key_id: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        self._find(self.sshkeys, int(key_id))
+        del self.sshkeys[int(key_id)]
+        return 204, {}
+
+    # Servers.
+
+    def _list_servers(self, project_id: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        self._find(self.projects, int(project_id))
+        return 200, [
+            self._render(s)
+            for s in list(self.servers.values())
+            if s["project"]["id"] == int(project_id)
+        ]
+
+    def _create_server(self, project_id: str, *, body: _Json) -> tuple[int, Any]:
+        plan = self._find_by_slug(_PLANS, body["plan"])
+        region = self._find_by_slug(_REGIONS, body["region"])
+        server_id = self._next_id()
+        hostname = body.get("hostname") or f"server-{server_id}"
+        server: _Json = {
+            "id": server_id,
+            "name": plan["name"],
+            "href": f"/servers/{server_id}",
+            "hostname": hostname,
+            "username": "root",
+            "spot_instance": bool(body.get("spot_market")),
+            "region": region,
+            "state": "pending",
+            "status": "pending",
+            "plan": plan,
+            "ssh_keys": [
+                self.sshkeys[k] for k in body.get("ssh_keys") or [] if k in self.sshkeys
+            ],
+            "tags": body.get("tags") or {},
+            "deployed_image": self._image_ref(body.get("image")),
+            "project": self._project_ref(int(project_id)),
+            "ip_addresses": [],
+            "storage": None,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime()),
+        }
+        self.servers[server_id] = server
+        primary_ip = self._new_ip(int(project_id), region, "primary-ip", {})
+        primary_ip["targeted_to"] = self._server_ref(server)
+        self._sync_server_ips(server)
+        self._schedule(
+            server,
+            (self.deploy_time / 3, {"status": "deploying"}),
+            (self.deploy_time, {"status": "deployed", "state": "active"}),
+        )
+        return 201, self._render(server)
+
+    def _image_ref(self, image: str | None) -> _Json | None:
+        if image is None:
+            return None
+        found = self._find_by_slug(_IMAGES, image)
+        return {"name": found["name"], "slug": found["slug"]}
+
+    def _get_server(self, server_id: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        return 200, self._render(self._find(self.servers, int(server_id)))
+
+    def _update_server(self, server_id: str, *, body: _Json) -> tuple[int, Any]:
+        server = self._find(self.servers, int(server_id))
+        for field in ("name", "hostname", "tags"):
+            if body.get(field) is not None:
+                server[field] = body[field]
+        if body.get("bgp") is not None:
+            server["bgp"] = {"enabled": body["bgp"]}
+        return 201, self._render(server)
+
+    def _delete_server(self, server_id: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        server = self._find(self.servers, int(server_id))
+        del self.servers[server["id"]]
+        for ip_id, ip in list(self.ips.items()):
+            targeted = ip["targeted_to"]
+            if targeted is not None and targeted["id"] == server["id"]:
+                if ip["type"] == "primary-ip":
+                    del self.ips[ip_id]
+                else:
+                    ip["targeted_to"] = None
+        for storage in self.storages.values():
+            attached = storage["attached_to"]
+            if attached is not None and attached["id"] == server["id"]:
+                storage["attached_to"] = None
+        for backup_id, backup in list(self.backup_storages.items()):
+            if backup["attached_to"]["id"] == server["id"]:
+                del self.backup_storages[backup_id]
+        return 204, {}
+
+    def _server_action(self, server_id: str, *, body: _Json) -> tuple[int, Any]:
+        server = self._find(self.servers, int(server_id))
+        self._render(server)
+        action = body.get("type")
+        t = self.action_time
+        if action == "power-off":
+            steps = [
+                (0, {"status": "powering off"}),
+                (t, {"status": "deployed", "state": "off"}),
+            ]
+        elif action == "power-on":
+            steps = [
+                (0, {"status": "powering on"}),
+                (t, {"status": "deployed", "state": "active"}),
+            ]
+        elif action == "reboot":
+            steps = [
+                (0, {"status": "rebooting"}),
+                (t, {"status": "deployed", "state": "active"}),
+            ]
+        elif action == "enter-rescue-mode":
+            steps = [
+                (0, {"status": "entering rescue mode"}),
+                (t, {"status": "rescue mode"}),
+            ]
+        elif action == "exit-rescue-mode":
+            steps = [
+                (0, {"status": "exiting rescue mode"}),
+                (t, {"status": "deployed"}),
+            ]
+        elif action == "rebuild":
+            server["hostname"] = body.get("hostname") or server["hostname"]
+            server["deployed_image"] = self._image_ref(body.get("image"))
+            steps = [
+                (0, {"status": "reinstalling"}),
+                (self.deploy_time, {"status": "deployed", "state": "active"}),
+            ]
+        elif action == "reset-bmc-password":
+            steps = []
+        else:
+            return 422, {"code": 422, "message": f"Unknown action {action}"}
+        self._schedule(server, *steps)
+        return 201, self._render(server)
+
+    def _sync_server_ips(self, server: _Json) -> None:
+        server["ip_addresses"] = [
+            self._render(ip)
+            for ip in self.ips.values()
+            if ip["targeted_to"] is not None and ip["targeted_to"]["id"] == server["id"]
+        ]
+
+    # IP addresses.
+
+    def _new_ip(
+        self, project_id: int, region: _Json, ip_type: str, body: _Json
+    ) -> _Json:
+        ip_id = str(uuid.UUID(int=self._random.getrandbits(128)))
+        n = len(self.ips) + 1
+        address = f"10.{(n >> 16) & 255}.{(n >> 8) & 255}.{n & 255}"
+        ip: _Json = {
+            "id": ip_id,
+            "address": address,
+            "address_family": 4,
+            "cidr": f"{address}/32",
+            "type": ip_type,
+            "region": region,
+            "routed_to": None,
+            "targeted_to": None,
+            "project": self._project_ref(project_id),
+            "ptr_record": body.get("ptr_record"),
+            "a_record": body.get("a_record"),
+            "tags": body.get("tags") or {},
+            "href": f"/ips/{ip_id}",
+        }
+        self.ips[ip_id] = ip
+        return ip
+
+    def _list_ips(self, project_id: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        self._find(self.projects, int(project_id))
+        return 200, [
+            self._render(ip)
+            for ip in self.ips.values()
+            if ip["project"]["id"] == int(project_id)
+        ]
+
+    def _create_ip(self, project_id: str, *, body: _Json) -> tuple[int, Any]:
+        region = self._find_by_slug(_REGIONS, body["region"])
+        ip = self._new_ip(int(project_id), region, "floating-ip", body)
+        self._target_ip(ip, body)
+        return 201, self._render(ip)
+
+    def _target_ip(self, ip: _Json, body: _Json) -> None:
+        previous = ip["targeted_to"]
+        if body.get("targeted_to") is not None:
+            if body["targeted_to"] == 0:
+                ip["targeted_to"] = None
+            else:
+                server = self._find(self.servers, body["targeted_to"])
+                ip["targeted_to"] = self._server_ref(server)
+                ip["routed_to"] = None
+        if body.get("routed_to") == "":
+            ip["routed_to"] = None
+        elif body.get("routed_to") is not None:
+            ip["routed_to"] = self._render(self._find(self.ips, body["routed_to"]))
+            ip["targeted_to"] = None
+        for ref in (previous, ip["targeted_to"]):
+            if ref is not None and ref["id"] in self.servers:
+                self._sync_server_ips(self.servers[ref["id"]])
+
+    def _get_ip(self, ip_id: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        return 200, self._render(self._find(self.ips, ip_id))
+
+    def _update_ip(self, ip_id: str, *, body: _Json) -> tuple[int, Any]:
+        ip = self._find(self.ips, ip_id)
+        for field in ("ptr_record", "a_record", "tags"):
+            if body.get(field) is not None:
+                ip[field] = body[field]
+        self._target_ip(ip, body)
+        return 201, self._render(ip)
+
+    def _delete_ip(self, ip_id: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        ip = self._find(self.ips, ip_id)
+        if ip["type"] == "primary-ip":
+            return 422, {"code": 422, "message": "Primary IP cannot be deleted"}
+        if any(
+            other["routed_to"] is not None and other["routed_to"]["id"] == ip_id
+            for other in self.ips.values()
+        ):
+            return 422, {"code": 422, "message": "IP has addresses routed to it"}
+        del self.ips[ip_id]
+        self._target_ip(ip, {"targeted_to": 0})
+        return 204, {}
+
+    # Block storages.
+
+    def _list_storages(self, project_id: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        self._find(self.projects, int(project_id))
+        return 200, [
+            self._render(s)
+            for s in self.storages.values()
+            if s["_project_id"] == int(project_id)
+        ]
+
+    def _create_storage(self, project_id: str, *, body: _Json) -> tuple[int, Any]:
+        self._find(self.projects, int(project_id))
+        region = self._find_by_slug(_REGIONS, body["region"])
+        storage_id = self._next_id()
+        storage: _Json = {
+            "id": storage_id,
+            "name": f"storage-{storage_id}",
+            "href": f"/storages/{storage_id}",
+            "size": body["size"],
+            "allow_edit_size": True,
+            "unit": "GB",
+            "description": body.get("description"),
+            "attached_to": None,
+            "vlan_id": "2000",
+            "vlan_ip": f"10.168.{storage_id & 255}.1",
+            "initiator": f"iqn.2019-03.com.cherryservers:{storage_id}",
+            "discovery_ip": "10.168.0.1",
+            "region": region,
+            "_project_id": int(project_id),
+        }
+        self.storages[storage_id] = storage
+        return 201, self._render(storage)
+
+    def _get_storage(self, storage_id: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        return 200, self._render(self._find(self.storages, int(storage_id)))
+
+    def _update_storage(self, storage_id: str, *, body: _Json) -> tuple[int, Any]:
+        storage = self._find(self.storages, int(storage_id))
+        self._render(storage)
+        if body.get("description") is not None:
+            storage["description"] = body["description"]
+        if body.get("size") is not None:
+            if body["size"] < storage["size"]:
+                return 422, {"code": 422, "message": "Storage size cannot be reduced"}
+            self._schedule(storage, (self.resize_time, {"size": body["size"]}))
+        return 201, self._render(storage)
+
+    def _delete_storage(self, storage_id: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        storage = self._find(self.storages, int(storage_id))
+        if storage["attached_to"] is not None:
+            return 422, {"code": 422, "message": "Detach storage before deleting"}
+        del self.storages[storage["id"]]
+        return 204, {}
+
+    def _attach_storage(self, storage_id: str, *, body: _Json) -> tuple[int, Any]:
+        storage = self._find(self.storages, int(storage_id))
+        server = self._find(self.servers, body["attach_to"])
+        storage["attached_to"] = self._server_ref(server)
+        server["storage"] = {
+            k: v for k, v in storage.items() if k not in ("attached_to", "_project_id")
+        }
+        return 201, self._render(storage)
+
+    def _detach_storage(self, storage_id: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        storage = self._find(self.storages, int(storage_id))
+        attached = storage["attached_to"]
+        if attached is not None and attached["id"] in self.servers:
+            self.servers[attached["id"]]["storage"] = None
+        storage["attached_to"] = None
+        return 204, {}
+
+    # Backup storages.
+
+    def _list_backups(self, project_id: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        self._find(self.projects, int(project_id))
+        return 200, [
+            self._render(b)
+            for b in self.backup_storages.values()
+            if b["_project_id"] == int(project_id)
+        ]
+
+    def _create_backup(self, server_id: str, *, body: _Json) -> tuple[int, Any]:
+        server = self._find(self.servers, int(server_id))
+        plan = self._find_by_slug(_BACKUP_PLANS, body["slug"])
+        backup_id = self._next_id()
+        backup: _Json = {
+            "id": backup_id,
+            "status": "pending",
+            "state": "pending",
+            "size_gigabytes": plan["size_gigabytes"],
+            "used_gigabytes": 0,
+            "attached_to": self._server_ref(server),
+            "methods": [
+                {"name": name, "enabled": True, "processing": False, "whitelist": []}
+                for name in ("borg", "ftp", "nfs", "smb")
+            ],
+            "plan": {"id": plan["id"], "name": plan["name"], "slug": plan["slug"]},
+            "region": self._find_by_slug(_REGIONS, body["region"]),
+            "href": f"/backup-storages/{backup_id}",
+            "_project_id": server["project"]["id"],
+        }
+        self.backup_storages[backup_id] = backup
+        self._schedule(
+            backup, (self.deploy_time, {"status": "deployed", "state": "active"})
+        )
+        return 201, self._render(backup)
+
+    def _get_backup(self, backup_id: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        return 200, self._render(self._find(self.backup_storages, int(backup_id)))
+
+    def _update_backup(self, backup_id: str, *, body: _Json) -> tuple[int, Any]:
+        backup = self._find(self.backup_storages, int(backup_id))
+        self._render(backup)
+        if body.get("slug") is not None:
+            plan = self._find_by_slug(_BACKUP_PLANS, body["slug"])
+            backup["status"] = "processing"
+            self._schedule(
+                backup,
+                (
+                    self.resize_time,
+                    {
+                        "status": "deployed",
+                        "size_gigabytes": plan["size_gigabytes"],
+                        "plan": {k: plan[k] for k in ("id", "name", "slug")},
+                    },
+                ),
+            )
+        return 201, self._render(backup)
+
+    def _delete_backup(self, backup_id: str, *, body: _Json) -> tuple[int, Any]:  # noqa: ARG002
+        self._find(self.backup_storages, int(backup_id))
+        del self.backup_storages[int(backup_id)]
+        return 204, {}
+
+    def _update_backup_method(
+        self, backup_id: str, method_name: str, *, body: _Json
+    ) -> tuple[int, Any]:
+        backup = self._find(self.backup_storages, int(backup_id))
+        for method in backup["methods"]:
+            if method["name"] == method_name:
+                method.update({k: v for k, v in body.items() if v is not None})
+                return 201, method
+        raise _NotFoundError
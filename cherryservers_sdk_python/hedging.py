@@ -0,0 +1,240 @@
+"""Cherry Servers API request hedging.
+
+Hedging cuts the tail latency of idempotent GET requests:
+if a request has not completed after a delay,
+an identical request is sent and whichever completes first is used.
+The delay is a high percentile of the recent latencies of the endpoint,
+so only unusually slow requests are hedged,
+and a budget bounds hedged requests to a small fraction of all requests.
+
+Requests are sent from persistent worker threads, which keep their
+connections between requests, and hedges from a bounded pool,
+so the API client should use a thread-safe transport.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextvars
+import math
+import queue
+import threading
+import time
+from concurrent import futures
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from cherryservers_sdk_python import circuit_breaker
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+R = TypeVar("R")
+
+
+class HedgingPolicy:
+    """Request hedging policy.
+
+    Example:
+        .. code-block:: python
+
+            facade = cherryservers_sdk_python.facade.CherryApiFacade(
+                token="my-token",
+                thread_safe=True,
+                hedging=cherryservers_sdk_python.hedging.HedgingPolicy(),
+            )
+            server = facade.servers.get_by_id(123456)
+
+    Attributes:
+        requests (int): Number of requests run through the policy.
+        hedged (int): Number of hedged requests.
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        percentile: float = 95,
+        min_delay: float = 0.05,
+        initial_delay: float = 1,
+        budget: float = 0.05,
+        max_tokens: float = 10,
+        window_size: int = 200,
+        max_workers: int = 16,
+        max_requests: int = 64,
+    ) -> None:
+        """Initialize a hedging policy.
+
+        :param float percentile: Percentile of recent endpoint latencies
+            after which a request is hedged.
+        :param float min_delay: Minimum hedging delay in seconds.
+        :param float initial_delay: Hedging delay in seconds for endpoints
+            with too few recorded latencies.
+        :param float budget: Fraction of requests that may be hedged.
+        :param float max_tokens: Maximum number of hedges that can be saved up
+            for bursts of slow requests.
+        :param int window_size: Number of recent latencies kept per endpoint.
+        :param int max_workers: Maximum number of concurrently sent hedges.
+        :param int max_requests: Maximum number of concurrent requests
+            that can be hedged. Further requests are sent
+            from the calling thread without hedging.
+        """
+        self._percentile = percentile
+        self._min_delay = min_delay
+        self._initial_delay = initial_delay
+        self._budget = budget
+        self._max_tokens = max_tokens
+        self._window_size = window_size
+        self._lock = threading.Lock()
+        self._latencies: dict[str, collections.deque[float]] = {}
+        self._tokens = max_tokens
+        self._workers = _Workers(max_requests)
+        self._pool = futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="cherryservers-hedging"
+        )
+        self.requests = 0
+        self.hedged = 0
+
+    def delay(self, template: str) -> float:
+        """Get the hedging delay of an endpoint template in seconds."""
+        with self._lock:
+            latencies = sorted(self._latencies.get(template, ()))
+        if len(latencies) < 20:  # noqa: PLR2004
+            return self._initial_delay
+        index = math.ceil(self._percentile / 100 * len(latencies)) - 1
+        return max(self._min_delay, latencies[max(0, index)])
+
+    def _record(self, template: str, latency: float) -> None:
+        with self._lock:
+            latencies = self._latencies.get(template)
+            if latencies is None:
+                latencies = collections.deque(maxlen=self._window_size)
+                self._latencies[template] = latencies
+            latencies.append(latency)
+
+    def _take_token(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.hedged += 1
+            return True
+
+    def _timed(self, template: str, fn: Callable[[], R]) -> Callable[[], R]:
+        def timed() -> R:
+            started = time.monotonic()
+            result = fn()
+            self._record(template, time.monotonic() - started)
+            return result
+
+        return timed
+
+    def run(self, endpoint: str, fn: Callable[[], R]) -> R:
+        """Call `fn`, calling it again concurrently if it is slow.
+
+        :param str endpoint: API path of the request.
+        :param Callable[[], R] fn: Idempotent request.
+
+        :returns R: Result of the first call to complete successfully,
+            or the error of the last one to fail.
+        """
+        template = circuit_breaker.endpoint_template(endpoint)
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self._max_tokens, self._tokens + self._budget)
+            can_hedge = self._tokens >= 1
+
+        attempt = self._timed(template, fn)
+        # Each attempt runs in a copy of the caller's context,
+        # so that context variables, such as deadlines, apply to it.
+        # Without budget for a hedge, or with every worker busy,
+        # the request is sent from the calling thread.
+        first = (
+            self._workers.submit(contextvars.copy_context(), attempt)
+            if can_hedge
+            else None
+        )
+        if first is None:
+            return attempt()
+
+        pending = {first}
+        done, _ = futures.wait(pending, timeout=self.delay(template))
+        if not done and self._take_token():
+            pending.add(self._pool.submit(contextvars.copy_context().run, attempt))
+
+        while True:
+            done, pending = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+            for call in done:
+                if call.exception() is None:
+                    return call.result()
+            if not pending:
+                return done.pop().result()
+
+    def close(self) -> None:
+        """Stop the worker threads, without waiting for hedged requests."""
+        self._workers.close()
+        self._pool.shutdown(wait=False)
+
+
+class _Workers:
+    """Persistent threads that send first attempts.
+
+    Threads are reused, so their transport sessions and connections are too,
+    and started only when no thread is idle, up to `max_workers`.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._queue: queue.SimpleQueue[_WorkItem | None] = queue.SimpleQueue()
+        self._threads = 0
+        self._idle = 0
+        self._closed = False
+
+    def submit(
+        self, context: contextvars.Context, fn: Callable[[], R]
+    ) -> futures.Future[R] | None:
+        """Send `fn` from an idle or new worker thread, `None` if all are busy."""
+        with self._lock:
+            if self._closed:
+                return None
+            if self._idle > 0:
+                self._idle -= 1
+            elif self._threads < self._max_workers:
+                self._threads += 1
+                threading.Thread(
+                    target=self._work, name="cherryservers-request", daemon=True
+                ).start()
+            else:
+                return None
+        future: futures.Future[R] = futures.Future()
+        self._queue.put((future, context, fn))
+        return future
+
+    def _work(self) -> None:
+        while (item := self._queue.get()) is not None:
+            future, context, fn = item
+            try:
+                result = context.run(fn)
+            except BaseException as e:  # noqa: BLE001
+                self._release()
+                future.set_exception(e)
+            else:
+                # The thread is marked idle before the result is set,
+                # so that the caller's next request reuses it.
+                self._release()
+                future.set_result(result)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._idle += 1
+
+    def close(self) -> None:
+        """Stop the worker threads once their requests complete."""
+        with self._lock:
+            self._closed = True
+            threads = self._threads
+        for _ in range(threads):
+            self._queue.put(None)
+
+
+_WorkItem = tuple["futures.Future[Any]", contextvars.Context, "Callable[[], Any]"]
@@ -0,0 +1,507 @@
+"""Cherry Servers project inventory module."""
+
+from __future__ import annotations
+
+import abc
+import collections
+import contextvars
+import threading
+import time
+from concurrent import futures
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from cherryservers_sdk_python import _base
+from cherryservers_sdk_python import ips as ips_module
+from cherryservers_sdk_python import servers as servers_module
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Iterator
+
+    from cherryservers_sdk_python import backup_storages as backup_storages_module
+    from cherryservers_sdk_python import block_storages as block_storages_module
+    from cherryservers_sdk_python import facade
+
+R = TypeVar("R")
+M = TypeVar("M", bound=_base.ResourceModel)
+
+
+class ProjectSnapshot:
+    """Cherry Servers project snapshot.
+
+    A point-in-time view of all servers, IP addresses, block storages
+    and backup storages of a project, with indexes for cross-referencing them.
+    Should typically be created with :meth:`fetch`,
+    which lists all resources concurrently.
+
+    Example:
+        .. code-block:: python
+
+            facade = cherryservers_sdk_python.facade.CherryApiFacade(
+                token="my-token", thread_safe=True
+            )
+            snapshot = cherryservers_sdk_python.inventory.ProjectSnapshot.fetch(
+                facade, 123456
+            )
+
+            for server in snapshot.servers_with_tag("role", "db"):
+                print(server.get_model().hostname)
+                print([ip.get_model().address for ip in snapshot.ips_of(server)])
+                print(snapshot.block_storages_of(server))
+                print(snapshot.backup_storage_of(server))
+
+    Attributes:
+        project_id (int): Project ID.
+        servers (list[cherryservers_sdk_python.servers.Server]): Project servers.
+        ips (list[cherryservers_sdk_python.ips.IP]): Project IP addresses.
+        block_storages (list[cherryservers_sdk_python.block_storages.BlockStorage]):
+         Project block storages.
+        backup_storages (list[cherryservers_sdk_python.backup_storages.BackupStorage]):
+         Project backup storages.
+        fetched_at (float): Time of the snapshot, as a UNIX timestamp.
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        project_id: int,
+        servers: list[servers_module.Server],
+        ips: list[ips_module.IP],
+        block_storages: list[block_storages_module.BlockStorage],
+        backup_storages: list[backup_storages_module.BackupStorage],
+        *,
+        fetched_at: float | None = None,
+    ) -> None:
+        """Initialize a project snapshot and build its indexes."""
+        self.project_id = project_id
+        self.servers = servers
+        self.ips = ips
+        self.block_storages = block_storages
+        self.backup_storages = backup_storages
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+
+        self._servers_by_id = {s.get_id(): s for s in servers}
+        self._servers_by_hostname: dict[str, list[servers_module.Server]] = (
+            collections.defaultdict(list)
+        )
+        self._servers_by_tag: dict[tuple[str, str], list[servers_module.Server]] = (
+            collections.defaultdict(list)
+        )
+        self._ips_by_server: dict[int, list[ips_module.IP]] = collections.defaultdict(
+            list
+        )
+        self._ips_by_tag: dict[tuple[str, str], list[ips_module.IP]] = (
+            collections.defaultdict(list)
+        )
+        self._block_storages_by_server: dict[
+            int, list[block_storages_module.BlockStorage]
+        ] = collections.defaultdict(list)
+        self._backup_storage_by_server: dict[
+            int, backup_storages_module.BackupStorage
+        ] = {}
+        self._build_server_indexes()
+        self._build_ip_indexes()
+        self._build_storage_indexes()
+
+    def _build_server_indexes(self) -> None:
+        for server in self.servers:
+            model = server.get_model()
+            if model.hostname is not None:
+                self._servers_by_hostname[model.hostname].append(server)
+            for tag in (model.tags or {}).items():
+                self._servers_by_tag[tag].append(server)
+
+    def _build_ip_indexes(self) -> None:
+        for ip in self.ips:
+            model = ip.get_model()
+            if model.targeted_to is not None:
+                self._ips_by_server[model.targeted_to.id].append(ip)
+            for tag in (model.tags or {}).items():
+                self._ips_by_tag[tag].append(ip)
+
+    def _build_storage_indexes(self) -> None:
+        for storage in self.block_storages:
+            attached_to = storage.get_model().attached_to
+            if attached_to is not None:
+                self._block_storages_by_server[attached_to.id].append(storage)
+
+        for backup in self.backup_storages:
+            attached_to = backup.get_model().attached_to
+            if attached_to is not None:
+                self._backup_storage_by_server[attached_to.id] = backup
+
+    @classmethod
+    def fetch(
+        cls,
+        api_facade: facade.CherryApiFacade,
+        project_id: int,
+        *,
+        backup_storages: bool = True,
+    ) -> ProjectSnapshot:
+        """Fetch a project snapshot, listing all resources concurrently.
+
+        The listings are sent in parallel, so the facade should be created
+        with `thread_safe=True`.
+
+        :param cherryservers_sdk_python.facade.CherryApiFacade api_facade:
+            Facade used to list resources.
+        :param int project_id: Project ID.
+        :param bool backup_storages: Whether to list backup storages.
+            If not, the snapshot has none.
+        """
+        fetched_at = time.time()
+        with futures.ThreadPoolExecutor(max_workers=4) as pool:
+            servers = pool.submit(
+                contextvars.copy_context().run,
+                api_facade.servers.list_by_project,
+                project_id,
+            )
+            ips = pool.submit(
+                contextvars.copy_context().run,
+                api_facade.ips.list_by_project,
+                project_id,
+            )
+            block_storages = pool.submit(
+                contextvars.copy_context().run,
+                api_facade.block_storages.list_by_project,
+                project_id,
+            )
+            backups = (
+                pool.submit(
+                    contextvars.copy_context().run,
+                    api_facade.backup_storages.list_by_project,
+                    project_id,
+                )
+                if backup_storages
+                else None
+            )
+            return cls(
+                project_id,
+                servers.result(),
+                ips.result(),
+                block_storages.result(),
+                [] if backups is None else backups.result(),
+                fetched_at=fetched_at,
+            )
+
+    @staticmethod
+    def _server_id(server: servers_module.Server | int) -> int:
+        return server if isinstance(server, int) else server.get_id()
+
+    def get_server(self, server_id: int) -> servers_module.Server | None:
+        """Get a server by ID, if it belongs to the project."""
+        return self._servers_by_id.get(server_id)
+
+    def servers_by_hostname(self, hostname: str) -> list[servers_module.Server]:
+        """Get servers with the given hostname."""
+        return list(self._servers_by_hostname.get(hostname, []))
+
+    def servers_with_tag(
+        self, key: str, value: str | None = None
+    ) -> list[servers_module.Server]:
+        """Get servers that have a tag, optionally with a specific value."""
+        return self._with_tag(self._servers_by_tag, key, value)
+
+    def ips_with_tag(self, key: str, value: str | None = None) -> list[ips_module.IP]:
+        """Get IP addresses that have a tag, optionally with a specific value."""
+        return self._with_tag(self._ips_by_tag, key, value)
+
+    @staticmethod
+    def _with_tag(
+        index: dict[tuple[str, str], list[R]], key: str, value: str | None
+    ) -> list[R]:
+        if value is not None:
+            return list(index.get((key, value), []))
+        return [r for (k, _), resources in index.items() if k == key for r in resources]
+
+    def ips_of(self, server: servers_module.Server | int) -> list[ips_module.IP]:
+        """Get IP addresses targeted to a server."""
+        return list(self._ips_by_server.get(self._server_id(server), []))
+
+    def block_storages_of(
+        self, server: servers_module.Server | int
+    ) -> list[block_storages_module.BlockStorage]:
+        """Get block storages attached to a server."""
+        return list(self._block_storages_by_server.get(self._server_id(server), []))
+
+    def backup_storage_of(
+        self, server: servers_module.Server | int
+    ) -> backup_storages_module.BackupStorage | None:
+        """Get the backup storage attached to a server, if any."""
+        return self._backup_storage_by_server.get(self._server_id(server))
+
+
+class ModelIndex(_base.ResourceObserver, Generic[M]):
+    """Cherry Servers resource model index base.
+
+    Keeps the latest model of each resource, with inverted indexes
+    from attribute values to resource IDs.
+    Subscribe it to a resource client to keep it up to date
+    with resources fetched, refreshed, mutated or deleted through the SDK.
+    """
+
+    def __init__(self, model_type: type[M]) -> None:
+        """Initialize an empty model index."""
+        self._model_type = model_type
+        self._lock = threading.Lock()
+        self._models: dict[int | str, M] = {}
+        self._index: dict[tuple[str, Hashable], set[int | str]] = (
+            collections.defaultdict(set)
+        )
+        # IDs of the resources in the latest listing of each project.
+        self._listings: dict[int, set[int | str]] = {}
+
+    @abc.abstractmethod
+    def _attributes(self, model: M) -> Iterator[tuple[str, Hashable]]:
+        """Get the indexed attributes of a model."""
+
+    @abc.abstractmethod
+    def _id(self, model: M) -> int | str:
+        """Get the ID of a model."""
+
+    @abc.abstractmethod
+    def _project_id(self, model: M) -> int | None:
+        """Get the ID of the project a model belongs to, if known."""
+
+    def resource_updated(self, model: _base.ResourceModel) -> None:
+        """Index a new resource model, replacing the previous one."""
+        if not isinstance(model, self._model_type):
+            return
+        resource_id = self._id(model)
+        with self._lock:
+            self._remove(resource_id)
+            self._models[resource_id] = model
+            for attribute in self._attributes(model):
+                self._index[attribute].add(resource_id)
+
+    def resource_deleted(self, resource_id: int | str) -> None:
+        """Remove a resource from the index."""
+        with self._lock:
+            self._remove(resource_id)
+
+    def _remove(self, resource_id: int | str) -> None:
+        model = self._models.pop(resource_id, None)
+        if model is None:
+            return
+        for attribute in self._attributes(model):
+            ids = self._index[attribute]
+            ids.discard(resource_id)
+            if not ids:
+                del self._index[attribute]
+
+    def update(self, models: Iterable[M]) -> None:
+        """Index several resource models."""
+        for model in models:
+            self.resource_updated(model)
+
+    def replace_project(self, project_id: int, models: Iterable[M]) -> None:
+        """Index the full listing of a project's resources.
+
+        Resources of the project that are not in the listing are removed,
+        since they have been deleted elsewhere.
+        """
+        models = list(models)
+        listed = {self._id(model) for model in models}
+        with self._lock:
+            previous = self._listings.get(project_id, set())
+            stale = [
+                resource_id
+                for resource_id, model in self._models.items()
+                if resource_id not in listed
+                and (resource_id in previous or self._project_id(model) == project_id)
+            ]
+            for resource_id in stale:
+                self._remove(resource_id)
+            self._listings[project_id] = listed
+        self.update(models)
+
+    def get(self, resource_id: int | str) -> M | None:
+        """Get the latest known model of a resource."""
+        with self._lock:
+            return self._models.get(resource_id)
+
+    def __len__(self) -> int:
+        """Get the number of indexed resources."""
+        with self._lock:
+            return len(self._models)
+
+    def _find(
+        self, criteria: list[tuple[str, Hashable]], tags: dict[str, str] | None
+    ) -> list[M]:
+        criteria = criteria + [("tag", tag) for tag in (tags or {}).items()]
+        with self._lock:
+            if not criteria:
+                ids = set(self._models)
+            else:
+                matches = sorted((self._index.get(c, set()) for c in criteria), key=len)
+                ids = matches[0].intersection(*matches[1:])
+            return sorted(
+                (self._models[i] for i in ids), key=lambda m: str(self._id(m))
+            )
+
+
+class ServerIndex(ModelIndex[servers_module.ServerModel]):
+    """Cherry Servers server index.
+
+    Indexes servers by tag, status, region slug, plan slug and hostname.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty server index."""
+        super().__init__(servers_module.ServerModel)
+
+    def _id(self, model: servers_module.ServerModel) -> int:
+        return model.id
+
+    def _project_id(self, model: servers_module.ServerModel) -> int | None:
+        return model.project.id if model.project is not None else None
+
+    def _attributes(
+        self, model: servers_module.ServerModel
+    ) -> Iterator[tuple[str, Hashable]]:
+        yield "status", model.status
+        if model.region is not None:
+            yield "region", model.region.slug
+        if model.plan is not None:
+            yield "plan", model.plan.slug
+        if model.hostname is not None:
+            yield "hostname", model.hostname
+        for tag in (model.tags or {}).items():
+            yield "tag", tag
+
+    def find(
+        self,
+        *,
+        tags: dict[str, str] | None = None,
+        status: str | None = None,
+        region: str | None = None,
+        plan: str | None = None,
+        hostname: str | None = None,
+    ) -> list[servers_module.ServerModel]:
+        """Find servers matching all given criteria.
+
+        :param dict[str, str] | None tags: Tags the server must have.
+        :param str | None status: Server status, such as `deployed`.
+        :param str | None region: Region slug.
+        :param str | None plan: Plan slug.
+        :param str | None hostname: Server hostname.
+        """
+        criteria: list[tuple[str, Hashable]] = [
+            (name, value)
+            for name, value in (
+                ("status", status),
+                ("region", region),
+                ("plan", plan),
+                ("hostname", hostname),
+            )
+            if value is not None
+        ]
+        return self._find(criteria, tags)
+
+
+class IPIndex(ModelIndex[ips_module.IPModel]):
+    """Cherry Servers IP address index.
+
+    Indexes IP addresses by tag, type, region slug and targeted server.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty IP address index."""
+        super().__init__(ips_module.IPModel)
+
+    def _id(self, model: ips_module.IPModel) -> str:
+        return model.id
+
+    def _project_id(self, model: ips_module.IPModel) -> int | None:
+        return model.project.id if model.project is not None else None
+
+    def _attributes(self, model: ips_module.IPModel) -> Iterator[tuple[str, Hashable]]:
+        if model.type is not None:
+            yield "type", model.type
+        if model.region is not None:
+            yield "region", model.region.slug
+        if model.targeted_to is not None:
+            yield "targeted_to", model.targeted_to.id
+        for tag in (model.tags or {}).items():
+            yield "tag", tag
+
+    def find(
+        self,
+        *,
+        tags: dict[str, str] | None = None,
+        type: str | None = None,  # noqa: A002
+        region: str | None = None,
+        targeted_to: int | None = None,
+    ) -> list[ips_module.IPModel]:
+        """Find IP addresses matching all given criteria.
+
+        :param dict[str, str] | None tags: Tags the IP address must have.
+        :param str | None type: IP address type, such as `floating-ip`.
+        :param str | None region: Region slug.
+        :param int | None targeted_to: ID of the server the IP address targets.
+        """
+        criteria: list[tuple[str, Hashable]] = [
+            (name, value)
+            for name, value in (
+                ("type", type),
+                ("region", region),
+                ("targeted_to", targeted_to),
+            )
+            if value is not None
+        ]
+        return self._find(criteria, tags)
+
+
+class InventoryStore:
+    """Cherry Servers indexed inventory store.
+
+    A local store of server and IP address models, kept up to date
+    through the resource clients of a facade.
+
+    Example:
+        .. code-block:: python
+
+            facade = cherryservers_sdk_python.facade.CherryApiFacade(token="my-token")
+            store = cherryservers_sdk_python.inventory.InventoryStore(facade)
+            store.load_project(123456)
+
+            for model in store.servers.find(
+                tags={"role": "db"}, status="deployed", region="LT-Siauliai"
+            ):
+                print(model.hostname)
+
+            # Resources refreshed or mutated through the facade update the store.
+            facade.servers.power_off(model.id)
+
+    Attributes:
+        servers (ServerIndex): Server index.
+        ips (IPIndex): IP address index.
+
+    """
+
+    def __init__(self, api_facade: facade.CherryApiFacade) -> None:
+        """Initialize an inventory store and subscribe it to the facade clients."""
+        self._facade = api_facade
+        self.servers = ServerIndex()
+        self.ips = IPIndex()
+        api_facade.servers.subscribe(self.servers)
+        api_facade.ips.subscribe(self.ips)
+
+    def load_project(self, project_id: int) -> None:
+        """List all servers and IP addresses of a project into the store.
+
+        Servers and IP addresses of the project that are no longer listed
+        are removed from the store.
+        """
+        self.servers.replace_project(
+            project_id,
+            (s.get_model() for s in self._facade.servers.list_by_project(project_id)),
+        )
+        self.ips.replace_project(
+            project_id,
+            (ip.get_model() for ip in self._facade.ips.list_by_project(project_id)),
+        )
+
+    def close(self) -> None:
+        """Unsubscribe the store from the facade clients."""
+        self._facade.servers.unsubscribe(self.servers)
+        self._facade.ips.unsubscribe(self.ips)
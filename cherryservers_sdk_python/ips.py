@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from pydantic import Field
 
-from cherryservers_sdk_python import _base, projects, regions
+from cherryservers_sdk_python import _base, _tagging, bulk, projects, regions
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
 
 
 class AddressAttachedError(Exception):
@@ -150,6 +155,7 @@ class UpdateRequest(_base.RequestSchema):
         routed_to (str | None):
          ID of the IP address that this address will be routed to.
          Mutually exclusive with `targeted_to`.
+         Set to an empty string to unroute IP address.
         targeted_to (int | None):
          ID of the server that this address will be targeted to.
          Mutually exclusive with `routed_to`.
@@ -162,7 +168,8 @@ class UpdateRequest(_base.RequestSchema):
     a_record: str | None = Field(description="IP address A record.", default=None)
     routed_to: str | None = Field(
         description="ID of the IP address that this address will be routed to."
-        " Mutually exclusive with `targeted_to`.",
+        " Mutually exclusive with `targeted_to`."
+        " Set to an empty string to unroute IP address.",
         default=None,
     )
     targeted_to: int | None = Field(
@@ -251,6 +258,7 @@ class IPClient(_base.ResourceClient):
     def delete(self, ip_id: str) -> None:
         """Delete IP address by ID."""
         self._api_client.delete(f"ips/{ip_id}", None, self.request_timeout)
+        self._notify_deleted(ip_id)
 
     def update(self, ip_id: str, update_schema: UpdateRequest) -> IP:
         """Update IP address by ID."""
@@ -259,6 +267,27 @@ class IPClient(_base.ResourceClient):
         )
         return self.get_by_id(response.json()["id"])
 
+    def bulk_update_tags(
+        self,
+        ips: Iterable[IP],
+        tags: Mapping[str, str],
+        mode: bulk.TagMode = "merge",
+        *,
+        max_workers: int = 10,
+    ) -> bulk.TagUpdateResult[IP]:
+        """Update the tags of many IP addresses at once.
+
+        Same as :meth:`cherryservers_sdk_python.servers.ServerClient.bulk_update_tags`,
+        but for IP addresses.
+        """
+        return _tagging.update_tags(ips, tags, mode, self._update_tags, max_workers)
+
+    def _update_tags(self, ip: IP, tags: dict[str, str]) -> IP:
+        response = self._api_client.put(
+            f"ips/{ip.get_id()}", UpdateRequest(tags=tags), None, self.request_timeout
+        )
+        return IP(self, IPModel.model_validate(response.json()))
+
 
 class IP(_base.Resource[IPClient, IPModel]):
     """Cherry Servers IP address resource.
@@ -275,9 +304,27 @@ class IP(_base.Resource[IPClient, IPModel]):
         self._client.delete(self._model.id)
 
     def update(self, update_schema: UpdateRequest) -> None:
-        """Update Cherry Servers IP address resource."""
-        updated = self._client.update(self._model.id, update_schema)
-        self._model = updated.get_model()
+        """Update Cherry Servers IP address resource.
+
+        Only fields that differ from the current model are sent,
+        and no request is sent if none do.
+        Server targets are always sent, since IP address models
+        retrieved by ID do not include them.
+        """
+        model = self.get_model()
+        changes = _base.changed_fields(
+            update_schema,
+            {
+                "ptr_record": model.ptr_record,
+                "a_record": model.a_record,
+                "tags": model.tags,
+                "routed_to": model.routed_to.id if model.routed_to else None,
+            },
+        )
+        if changes is None:
+            return
+        updated = self._client.update(model.id, changes)
+        self._set_model(updated.get_model())
 
     def get_id(self) -> str:
         """Get resource ID."""
@@ -0,0 +1,261 @@
+"""Cherry Servers operation graphs.
+
+An :class:`OperationGraph` composes dependent SDK calls,
+such as creating a server, then a floating IP address targeted to it.
+Each operation is started as soon as the operations it depends on
+have succeeded, and is called with their return values,
+so independent branches, e.g. for many servers, run concurrently.
+Operations are started under global concurrency and rate limits,
+and the outcome of every operation is reported,
+instead of the first failure aborting the whole graph.
+
+Example:
+    .. code-block:: python
+
+        facade = cherryservers_sdk_python.facade.CherryApiFacade(
+            token="my-token", thread_safe=True
+        )
+        graph = facade.operation_graph(max_workers=8, rate=5)
+
+        for i in range(10):
+            server = graph.add(
+                f"server-{i}",
+                lambda i=i: facade.servers.create(
+                    cherryservers_sdk_python.servers.CreationRequest(
+                        region="LT-Siauliai", plan="B1-1-1gb-20s-shared",
+                        hostname=f"node-{i}",
+                    ),
+                    project_id=123456,
+                ),
+            )
+            graph.add(
+                f"ip-{i}",
+                lambda server: facade.ips.create(
+                    cherryservers_sdk_python.ips.CreationRequest(
+                        region="LT-Siauliai", targeted_to=server.get_id()
+                    ),
+                    project_id=123456,
+                ),
+                server,
+            )
+
+        result = graph.run()
+        for failed in result.failed:
+            print(failed.name, failed.error)
+
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, Generic, Literal, NamedTuple, TypeVar, cast
+
+from cherryservers_sdk_python import _dag
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+T = TypeVar("T")
+
+Outcome = Literal["succeeded", "failed", "skipped", "cancelled"]
+
+
+class Operation(Generic[T]):
+    """Operation added to an :class:`OperationGraph`.
+
+    Pass it to :meth:`OperationGraph.add` to make other operations
+    depend on it, and to :meth:`GraphResult.value` to get its return value.
+
+    Attributes:
+        name (str): Unique operation name.
+
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize an operation handle."""
+        self.name = name
+
+    def __repr__(self) -> str:
+        """Get the operation representation."""
+        return f"Operation({self.name!r})"
+
+
+class OperationResult(NamedTuple):
+    """Outcome of an operation.
+
+    Attributes:
+        name (str): Operation name.
+        outcome (str): `succeeded`, `failed`,
+         `skipped` if an operation it depends on failed,
+         or `cancelled` if the graph was cancelled before it started.
+        value (Any): Return value of a succeeded operation.
+        error (Exception | None): Error the operation failed with.
+
+    """
+
+    name: str
+    outcome: Outcome
+    value: Any = None
+    error: Exception | None = None
+
+
+class OperationGraphError(Exception):
+    """Some operations of a graph did not succeed."""
+
+    def __init__(self, result: GraphResult) -> None:
+        """Initialize error."""
+        errors = "; ".join(f"{r.name}: {r.error}" for r in result.failed)
+        super().__init__(
+            f"{len(result.failed)} operations failed, {len(result.skipped)} skipped,"
+            f" {len(result.cancelled)} cancelled: {errors}"
+        )
+        self.result = result
+
+
+class GraphResult:
+    """Outcome of an operation graph run, with a result for every operation."""
+
+    def __init__(self, results: Iterable[OperationResult]) -> None:
+        """Initialize a graph result.
+
+        :param Iterable[OperationResult] results: Operation results,
+            in the order the operations were added.
+        """
+        self.results = {result.name: result for result in results}
+
+    def _with_outcome(self, outcome: Outcome) -> list[OperationResult]:
+        return [r for r in self.results.values() if r.outcome == outcome]
+
+    @property
+    def succeeded(self) -> list[OperationResult]:
+        """Results of operations that succeeded."""
+        return self._with_outcome("succeeded")
+
+    @property
+    def failed(self) -> list[OperationResult]:
+        """Results of operations that failed."""
+        return self._with_outcome("failed")
+
+    @property
+    def skipped(self) -> list[OperationResult]:
+        """Results of operations skipped after a failure."""
+        return self._with_outcome("skipped")
+
+    @property
+    def cancelled(self) -> list[OperationResult]:
+        """Results of operations that were cancelled."""
+        return self._with_outcome("cancelled")
+
+    @property
+    def ok(self) -> bool:
+        """Whether every operation succeeded."""
+        return all(r.outcome == "succeeded" for r in self.results.values())
+
+    def value(self, operation: Operation[T]) -> T:
+        """Get the return value of a succeeded operation.
+
+        :raises OperationGraphError: If the operation did not succeed.
+        """
+        result = self.results[operation.name]
+        if result.outcome != "succeeded":
+            raise OperationGraphError(self)
+        return cast("T", result.value)
+
+    def raise_for_failures(self) -> None:
+        """Raise an error if any operation did not succeed.
+
+        :raises OperationGraphError: If any operation failed,
+            was skipped or cancelled.
+        """
+        if not self.ok:
+            raise OperationGraphError(self)
+
+
+class OperationGraph:
+    """Graph of dependent operations, run concurrently.
+
+    Should typically be created with
+    :meth:`cherryservers_sdk_python.facade.CherryApiFacade.operation_graph`,
+    whose facade should be created with `thread_safe=True`.
+    """
+
+    def __init__(self, *, max_workers: int = 10, rate: float | None = None) -> None:
+        """Initialize an empty operation graph.
+
+        :param int max_workers: Maximum number of operations run at once.
+        :param float | None rate: Maximum number of operations started
+            per second, `None` for no limit.
+        """
+        self._max_workers = max_workers
+        self._rate = rate
+        self._graph = _dag.Graph()
+        self._values: dict[str, object] = {}
+        self._cancel = threading.Event()
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[..., T],
+        *inputs: Operation[Any],
+        after: Iterable[Operation[Any]] = (),
+    ) -> Operation[T]:
+        """Add an operation.
+
+        :param str name: Unique operation name.
+        :param Callable[..., T] fn: Operation function,
+            called with the return values of the `inputs` operations.
+        :param Operation inputs: Operations whose return values are passed
+            to `fn`, in order.
+        :param Iterable[Operation] after: Operations that must succeed first,
+            without passing their return values.
+
+        :returns Operation[T]: Operation handle.
+
+        :raises ValueError: If the name is already used,
+            or the operation depends on one that is not in the graph.
+        """
+        if name in self._graph:
+            msg = f"duplicate operation name: {name}"
+            raise ValueError(msg)
+        dependencies = [op.name for op in (*inputs, *after)]
+        for dependency in dependencies:
+            if dependency not in self._graph:
+                msg = f"operation {name} depends on unknown operation {dependency}"
+                raise ValueError(msg)
+
+        input_names = [op.name for op in inputs]
+
+        def call() -> T:
+            value = fn(*(self._values[input_name] for input_name in input_names))
+            self._values[name] = value
+            return value
+
+        self._graph.add(name, call, dependencies)
+        return Operation(name)
+
+    def cancel(self) -> None:
+        """Cancel the graph.
+
+        Operations that have not started yet are not started,
+        and running ones are left to complete.
+        Can be called from any thread, e.g. from an operation.
+        """
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the graph has been cancelled."""
+        return self._cancel.is_set()
+
+    def run(self) -> GraphResult:
+        """Run all operations and wait for them.
+
+        :returns GraphResult: Outcome for each operation.
+        """
+        results = self._graph.run(
+            self._max_workers, rate=self._rate, cancel=self._cancel
+        )
+        return GraphResult(
+            OperationResult(r.key, r.outcome, r.value, r.error)
+            for r in (results[name] for name in self._graph)
+        )
@@ -2,9 +2,40 @@
 
 from __future__ import annotations
 
+import functools
+from typing import TYPE_CHECKING
+
 from pydantic import Field
 
-from cherryservers_sdk_python import _base
+from cherryservers_sdk_python import _base, _dag, _resource_polling
+
+if TYPE_CHECKING:
+    from cherryservers_sdk_python import (
+        _client,
+        backup_storages,
+        block_storages,
+        facade,
+        ips,
+        servers,
+    )
+
+
+class TeardownError(Exception):
+    """Some steps of a project teardown failed.
+
+    The project itself is only deleted if every other step succeeded.
+
+    Attributes:
+        failures (dict[str, Exception]): Errors of the failed steps,
+         by step description, e.g. `detach storage 123`.
+
+    """
+
+    def __init__(self, project_id: int, failures: dict[str, Exception]) -> None:
+        """Initialize error."""
+        steps = "; ".join(f"{step}: {error}" for step, error in failures.items())
+        super().__init__(f"Teardown of project {project_id} failed: {steps}")
+        self.failures = failures
 
 
 class ProjectBGPModel(_base.ResourceModel):
@@ -109,6 +140,21 @@ class ProjectClient(_base.ResourceClient):
 
     """
 
+    def __init__(
+        self,
+        api_client: _client.CherryApiClient,
+        request_timeout: int = 120,
+        *,
+        api_facade: facade.CherryApiFacade | None = None,
+    ) -> None:
+        """Initialize a Cherry Servers project client.
+
+        :param cherryservers_sdk_python.facade.CherryApiFacade | None api_facade:
+            Facade whose resource clients are used for project teardown.
+        """
+        super().__init__(api_client, request_timeout)
+        self._facade = api_facade
+
     def get_by_id(self, project_id: int) -> Project:
         """Retrieve a project by ID."""
         response = self._api_client.get(
@@ -141,6 +187,7 @@ class ProjectClient(_base.ResourceClient):
     def delete(self, project_id: int) -> None:
         """Delete project by ID."""
         self._api_client.delete(f"projects/{project_id}", None, self.request_timeout)
+        self._notify_deleted(project_id)
 
     def update(self, project_id: int, update_schema: UpdateRequest) -> Project:
         """Update project by ID."""
@@ -149,6 +196,174 @@ class ProjectClient(_base.ResourceClient):
         )
         return self.get_by_id(response.json()["id"])
 
+    def teardown(
+        self, project_id: int, *, max_workers: int = 10, timeout: float = 1800
+    ) -> None:
+        """Delete a project along with all of its resources.
+
+        The project resources are listed with
+        :meth:`cherryservers_sdk_python.inventory.ProjectSnapshot.fetch`
+        and deleted in dependency order through the facade's resource clients,
+        so their subscribed observers are notified:
+        block storages are detached before they are deleted,
+        floating IPs are unassigned and released once nothing is routed to them,
+        backup storages are deleted, and servers are deleted once nothing
+        is attached or routed to them. Independent steps are run concurrently,
+        so the facade should be created with `thread_safe=True`.
+        Finally, once all servers are gone, the project is deleted.
+
+        :param int project_id: Project ID.
+        :param int max_workers: Maximum number of concurrent API requests.
+        :param float timeout: Timeout for servers to be deleted in seconds.
+
+        :raises TeardownError: If any step fails.
+            Steps that depend on a failed one are not run.
+        :raises RuntimeError: If the client was not created by a facade.
+        """
+        if self._facade is None:
+            msg = "Project teardown requires a client created by CherryApiFacade."
+            raise RuntimeError(msg)
+        _Teardown(self._facade, project_id).run(max_workers, timeout)
+
+
+class _Teardown:
+    """Project teardown steps, as a dependency graph."""
+
+    def __init__(self, api_facade: facade.CherryApiFacade, project_id: int) -> None:
+        # Imported here, since these modules depend on this one.
+        from cherryservers_sdk_python import ips  # noqa: PLC0415
+
+        self._facade = api_facade
+        self._project_id = project_id
+        self._unassign_request = ips.UpdateRequest(targeted_to=0, routed_to="")
+        self._graph = _dag.Graph()
+        self._server_steps: dict[int, str] = {}
+
+    def run(self, max_workers: int, timeout: float) -> None:
+        # Imported here, since it depends on this module.
+        from cherryservers_sdk_python import inventory  # noqa: PLC0415
+
+        snapshot = inventory.ProjectSnapshot.fetch(self._facade, self._project_id)
+        self._add_servers([s.get_model() for s in snapshot.servers], timeout)
+        self._add_storages([s.get_model() for s in snapshot.block_storages])
+        self._add_backups([b.get_model() for b in snapshot.backup_storages])
+        self._add_ips([ip.get_model() for ip in snapshot.ips])
+
+        self._graph.add(
+            f"delete project {self._project_id}",
+            functools.partial(self._facade.projects.delete, self._project_id),
+            list(self._graph),
+        )
+        results = self._graph.run(max_workers)
+        failures = {
+            step: result.error
+            for step, result in results.items()
+            if result.error is not None
+        }
+        if failures:
+            raise TeardownError(self._project_id, failures)
+
+    def _before_server(self, server_id: int, step: str) -> None:
+        if server_id in self._server_steps:
+            self._graph.add_dependencies(self._server_steps[server_id], [step])
+
+    def _add_servers(self, models: list[servers.ServerModel], timeout: float) -> None:
+        for model in models:
+            step = f"delete server {model.id}"
+            self._server_steps[model.id] = step
+            self._graph.add(
+                step, functools.partial(self._facade.servers.delete, model.id)
+            )
+        if not models:
+            return
+
+        self._graph.add(
+            "wait for servers to be deleted",
+            functools.partial(self._wait_for_servers, timeout),
+            self._server_steps.values(),
+        )
+
+    def _wait_for_servers(self, timeout: float) -> None:
+        remaining = _ProjectServers(self._facade.servers, self._project_id)
+        remaining.refresh()
+        _resource_polling.wait_for_resource_condition(
+            remaining, timeout, lambda: remaining.count == 0
+        )
+
+    def _add_storages(self, models: list[block_storages.BlockStorageModel]) -> None:
+        storage_client = self._facade.block_storages
+        for model in models:
+            delete_step = f"delete storage {model.id}"
+            self._graph.add(
+                delete_step, functools.partial(storage_client.delete, model.id)
+            )
+            if model.attached_to is not None:
+                detach_step = f"detach storage {model.id}"
+                self._graph.add(
+                    detach_step, functools.partial(storage_client.detach, model.id)
+                )
+                self._graph.add_dependencies(delete_step, [detach_step])
+                self._before_server(model.attached_to.id, detach_step)
+
+    def _add_backups(self, models: list[backup_storages.BackupStorageModel]) -> None:
+        for model in models:
+            step = f"delete backup storage {model.id}"
+            self._graph.add(
+                step, functools.partial(self._facade.backup_storages.delete, model.id)
+            )
+            if model.attached_to is not None:
+                self._before_server(model.attached_to.id, step)
+
+    def _add_ips(self, models: list[ips.IPModel]) -> None:
+        ip_client = self._facade.ips
+        by_id = {model.id: model for model in models}
+        release_steps: dict[str, str] = {}
+        for model in models:
+            # Primary and private addresses are released along with their servers.
+            if model.type in (None, "primary-ip", "private-ip"):
+                continue
+            release_step = f"release ip {model.id}"
+            release_steps[model.id] = release_step
+            self._graph.add(release_step, functools.partial(ip_client.delete, model.id))
+
+        for model in models:
+            if model.targeted_to is None and model.routed_to is None:
+                continue
+            if model.id not in release_steps:
+                continue
+            unassign_step = f"unassign ip {model.id}"
+            self._graph.add(
+                unassign_step,
+                functools.partial(ip_client.update, model.id, self._unassign_request),
+            )
+            self._graph.add_dependencies(release_steps[model.id], [unassign_step])
+            if model.targeted_to is not None:
+                self._before_server(model.targeted_to.id, unassign_step)
+            if model.routed_to is not None:
+                # The address routed to is released, either on its own
+                # or along with its server, only once this one is unrouted.
+                target_id = model.routed_to.id
+                if target_id in release_steps:
+                    self._graph.add_dependencies(
+                        release_steps[target_id], [unassign_step]
+                    )
+                target = by_id.get(target_id, model.routed_to)
+                if target.targeted_to is not None:
+                    self._before_server(target.targeted_to.id, unassign_step)
+
+
+class _ProjectServers(_resource_polling.RefreshableResource):
+    """Number of servers left in a project."""
+
+    def __init__(self, client: servers.ServerClient, project_id: int) -> None:
+        self._client = client
+        self._project_id = project_id
+        self.count = 0
+
+    def refresh(self) -> None:
+        """Count the project servers."""
+        self.count = len(self._client.list_by_project(self._project_id))
+
 
 class Project(_base.Resource[ProjectClient, ProjectModel]):
     """Cherry Servers project resource.
@@ -162,9 +377,20 @@ class Project(_base.Resource[ProjectClient, ProjectModel]):
         self._client.delete(self._model.id)
 
     def update(self, update_schema: UpdateRequest) -> None:
-        """Update Cherry Servers project resource."""
-        updated = self._client.update(self._model.id, update_schema)
-        self._model = updated.get_model()
+        """Update Cherry Servers project resource.
+
+        Only fields that differ from the current model are sent,
+        and no request is sent if none do.
+        """
+        model = self.get_model()
+        changes = _base.changed_fields(
+            update_schema,
+            {"name": model.name, "bgp": model.bgp.enabled if model.bgp else None},
+        )
+        if changes is None:
+            return
+        updated = self._client.update(model.id, changes)
+        self._set_model(updated.get_model())
 
     def get_id(self) -> int:
         """Get resource ID."""
@@ -0,0 +1,675 @@
+"""Cherry Servers desired-state reconciliation.
+
+Describe the servers, floating IP addresses and block storage volumes
+of a project as a :class:`DesiredState`, for example loaded from YAML,
+and let a :class:`Reconciler` plan and apply the changes needed to reach it.
+
+Planning lists the project resources concurrently and compares them
+with the desired state, so applying a state that is already reached
+costs only these listings.
+Changes are applied concurrently, each as soon as the changes it depends on,
+such as creating the server a volume is attached to, have succeeded.
+
+Example:
+    .. code-block:: python
+
+        facade = cherryservers_sdk_python.facade.CherryApiFacade(
+            token="my-token", thread_safe=True
+        )
+        with open("infrastructure.yaml") as f:
+            desired = cherryservers_sdk_python.reconcile.DesiredState.model_validate(
+                yaml.safe_load(f)
+            )
+
+        reconciler = cherryservers_sdk_python.reconcile.Reconciler(facade, 123456)
+        plan = reconciler.plan(desired)
+        for change in plan.changes:
+            print(change.key, change.request)
+        plan.apply()
+
+"""
+
+from __future__ import annotations
+
+import collections
+import functools
+from typing import TYPE_CHECKING, Literal, NamedTuple
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from cherryservers_sdk_python import (
+    _base,
+    _dag,
+    block_storages,
+    inventory,
+    ips,
+    servers,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from cherryservers_sdk_python import facade
+
+NAME_TAG = "reconcile-name"
+"""Tag identifying the floating IP addresses of a desired state by name."""
+
+Action = Literal["create", "update", "attach", "target", "detach", "delete"]
+Kind = Literal["server", "ip", "storage"]
+
+
+class ServerSpec(BaseModel):
+    """Desired server, identified by its hostname.
+
+    Attributes:
+        hostname (str): Server hostname.
+        plan (str): Plan slug.
+        region (str): Region slug.
+        image (str | None): Image slug.
+        ssh_keys (set[int] | None): IDs of SSH keys added to a new server.
+        user_data (str | None): Base64 encoded user data of a new server.
+        tags (dict[str, str]): Server tags.
+
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    hostname: str = Field(description="Server hostname.")
+    plan: str = Field(description="Plan slug.")
+    region: str = Field(description="Region slug.")
+    image: str | None = Field(description="Image slug.", default=None)
+    ssh_keys: set[int] | None = Field(
+        description="IDs of SSH keys added to a new server.", default=None
+    )
+    user_data: str | None = Field(
+        description="Base64 encoded user data of a new server.", default=None
+    )
+    tags: dict[str, str] = Field(description="Server tags.", default_factory=dict)
+
+
+class IPSpec(BaseModel):
+    """Desired floating IP address, identified by the :data:`NAME_TAG` tag.
+
+    Attributes:
+        name (str): IP address name.
+        region (str): Region slug.
+        target (str | None): Hostname of the server the address is targeted to.
+        ptr_record (str | None): PTR record.
+        a_record (str | None): A record.
+        tags (dict[str, str]): IP address tags, besides the name tag.
+
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    name: str = Field(description="IP address name.")
+    region: str = Field(description="Region slug.")
+    target: str | None = Field(
+        description="Hostname of the server the address is targeted to.",
+        default=None,
+    )
+    ptr_record: str | None = Field(description="PTR record.", default=None)
+    a_record: str | None = Field(description="A record.", default=None)
+    tags: dict[str, str] = Field(
+        description="IP address tags, besides the name tag.", default_factory=dict
+    )
+
+
+class VolumeSpec(BaseModel):
+    """Desired block storage volume, identified by the server it is attached to.
+
+    Attributes:
+        server (str): Hostname of the server the volume is attached to.
+        size (int): Volume size in GB.
+        description (str | None): Description of a new volume.
+
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    server: str = Field(description="Hostname of the server the volume is attached to.")
+    size: int = Field(description="Volume size in GB.")
+    description: str | None = Field(
+        description="Description of a new volume.", default=None
+    )
+
+
+class DesiredState(BaseModel):
+    """Desired state of project resources.
+
+    Attributes:
+        servers (list[ServerSpec]): Desired servers.
+        ips (list[IPSpec]): Desired floating IP addresses.
+        volumes (list[VolumeSpec]): Desired block storage volumes,
+         at most one per server.
+
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    servers: list[ServerSpec] = Field(
+        description="Desired servers.", default_factory=list
+    )
+    ips: list[IPSpec] = Field(
+        description="Desired floating IP addresses.", default_factory=list
+    )
+    volumes: list[VolumeSpec] = Field(
+        description="Desired block storage volumes, at most one per server.",
+        default_factory=list,
+    )
+
+    @model_validator(mode="after")
+    def _check_references(self) -> DesiredState:
+        hostnames = _unique("server hostname", (s.hostname for s in self.servers))
+        _unique("IP address name", (ip.name for ip in self.ips))
+        _unique("volume server", (v.server for v in self.volumes))
+        for reference in [ip.target for ip in self.ips] + [
+            v.server for v in self.volumes
+        ]:
+            if reference is not None and reference not in hostnames:
+                msg = f"unknown server hostname: {reference}"
+                raise ValueError(msg)
+        return self
+
+
+def _unique(what: str, values: Iterable[str]) -> set[str]:
+    counts = collections.Counter(values)
+    duplicates = sorted(value for value, count in counts.items() if count > 1)
+    if duplicates:
+        msg = f"duplicate {what}: {', '.join(duplicates)}"
+        raise ValueError(msg)
+    return set(counts)
+
+
+class Change(NamedTuple):
+    """Planned change of a project resource.
+
+    Attributes:
+        action (str): `create`, `update`, `attach`, `target`,
+         `detach` or `delete`.
+        kind (str): `server`, `ip` or `storage`.
+        name (str): Server hostname, IP address name or volume server hostname.
+         Resources that are not in the desired state are named
+         by their ID as well.
+        request (cherryservers_sdk_python._base.RequestSchema | None):
+         Request sent for the change, if known before earlier changes
+         are applied.
+        depends_on (tuple[str, ...]): Keys of changes applied first.
+
+    """
+
+    action: Action
+    kind: Kind
+    name: str
+    request: _base.RequestSchema | None = None
+    depends_on: tuple[str, ...] = ()
+
+    @property
+    def key(self) -> str:
+        """Change key, such as `create server web-1`."""
+        return f"{self.action} {self.kind} {self.name}"
+
+
+class ReconcileError(Exception):
+    """Some changes of a plan failed.
+
+    Attributes:
+        failures (dict[str, Exception]): Errors of the failed changes, by key.
+        skipped (list[str]): Keys of changes that were not applied,
+         since a change they depend on failed.
+
+    """
+
+    def __init__(self, failures: dict[str, Exception], skipped: list[str]) -> None:
+        """Initialize error."""
+        changes = "; ".join(f"{key}: {error}" for key, error in failures.items())
+        super().__init__(
+            f"{len(failures)} changes failed, {len(skipped)} skipped: {changes}"
+        )
+        self.failures = failures
+        self.skipped = skipped
+
+
+class Plan:
+    """Changes needed to reach a desired state.
+
+    Should only be created by :meth:`Reconciler.plan`.
+
+    Attributes:
+        changes (list[Change]): Planned changes.
+        drift (list[str]): Differences that are not reconciled,
+         such as the plan of an existing server.
+
+    """
+
+    def __init__(
+        self,
+        changes: list[Change],
+        drift: list[str],
+        tasks: dict[str, Callable[[], object]],
+    ) -> None:
+        """Initialize a plan."""
+        self.changes = changes
+        self.drift = drift
+        self._tasks = tasks
+
+    def __len__(self) -> int:
+        """Get the number of planned changes."""
+        return len(self.changes)
+
+    def apply(self, max_workers: int = 10) -> None:
+        """Apply the planned changes concurrently, in dependency order.
+
+        :param int max_workers: Maximum number of changes applied at once.
+
+        :raises ReconcileError: If any change failed.
+        """
+        graph = _dag.Graph()
+        for change in self.changes:
+            graph.add(change.key, self._tasks[change.key], change.depends_on)
+        results = graph.run(max_workers)
+        failures = {
+            key: result.error
+            for key, result in results.items()
+            if result.error is not None
+        }
+        if failures:
+            skipped = [
+                key for key, result in results.items() if result.outcome == "skipped"
+            ]
+            raise ReconcileError(failures, skipped)
+
+
+class Reconciler:
+    """Cherry Servers project reconciler.
+
+    Plans and applies the changes that bring the servers,
+    floating IP addresses and block storage volumes of a project
+    to a desired state:
+
+    * Missing servers, IP addresses and volumes are created.
+      Volumes are attached to their servers,
+      and IP addresses targeted to them, once the servers are deployed.
+    * Server and IP address tags and records are updated,
+      and volumes are grown.
+    * With `prune`, resources that are not in the desired state are deleted.
+
+    Plans, images and regions of existing resources are never changed,
+    since that would mean replacing them; differences are reported
+    as drift instead.
+    The facade should be created with `thread_safe=True`.
+    """
+
+    def __init__(
+        self,
+        api_facade: facade.CherryApiFacade,
+        project_id: int,
+        *,
+        prune: bool = False,
+        deployment_timeout: int = servers.ServerClient.DEFAULT_DEPLOYMENT_TIMEOUT,
+    ) -> None:
+        """Initialize a reconciler.
+
+        :param cherryservers_sdk_python.facade.CherryApiFacade api_facade:
+            Facade used to list and change resources.
+        :param int project_id: Project ID.
+        :param bool prune: Whether to delete servers, floating IP addresses
+            and volumes that are not in the desired state.
+        :param int deployment_timeout: Timeout for deploying new servers,
+            in seconds.
+        """
+        self._facade = api_facade
+        self._project_id = project_id
+        self._prune = prune
+        self._deployment_timeout = deployment_timeout
+
+    def plan(self, desired: DesiredState) -> Plan:
+        """Plan the changes needed to reach a desired state.
+
+        :param DesiredState desired: Desired state.
+        """
+        snapshot = inventory.ProjectSnapshot.fetch(self._facade, self._project_id)
+        return _Planner(
+            self._facade,
+            snapshot,
+            desired,
+            prune=self._prune,
+            deployment_timeout=self._deployment_timeout,
+        ).plan()
+
+    def apply(self, desired: DesiredState, max_workers: int = 10) -> Plan:
+        """Plan and apply the changes needed to reach a desired state.
+
+        :param DesiredState desired: Desired state.
+        :param int max_workers: Maximum number of changes applied at once.
+
+        :returns Plan: Applied plan.
+
+        :raises ReconcileError: If any change failed.
+        """
+        plan = self.plan(desired)
+        plan.apply(max_workers)
+        return plan
+
+
+class _Planner:
+    """Comparison of a project snapshot with a desired state."""
+
+    def __init__(
+        self,
+        api_facade: facade.CherryApiFacade,
+        snapshot: inventory.ProjectSnapshot,
+        desired: DesiredState,
+        *,
+        prune: bool,
+        deployment_timeout: int,
+    ) -> None:
+        self._facade = api_facade
+        self._snapshot = snapshot
+        self._desired = desired
+        self._prune = prune
+        self._deployment_timeout = deployment_timeout
+        self._changes: list[Change] = []
+        self._drift: list[str] = []
+        self._tasks: dict[str, Callable[[], object]] = {}
+        # IDs of existing resources, and of new ones once they are created.
+        self._server_ids: dict[str, int] = {}
+        self._storage_ids: dict[str, int] = {}
+        self._ip_ids: dict[str, str] = {}
+        # Changes that must be applied before a server is deleted.
+        self._before_delete: dict[int, list[str]] = collections.defaultdict(list)
+
+    def plan(self) -> Plan:
+        self._plan_servers()
+        self._plan_volumes()
+        self._plan_ips()
+        if self._prune:
+            self._prune_servers()
+        return Plan(self._changes, self._drift, self._tasks)
+
+    def _add(self, change: Change, task: Callable[[], object]) -> str:
+        self._changes.append(change)
+        self._tasks[change.key] = task
+        return change.key
+
+    def _created(self, kind: Kind, name: str) -> tuple[str, ...]:
+        key = Change("create", kind, name).key
+        return (key,) if key in self._tasks else ()
+
+    def _plan_servers(self) -> None:
+        for spec in self._desired.servers:
+            existing = self._snapshot.servers_by_hostname(spec.hostname)
+            if not existing:
+                request = servers.CreationRequest(
+                    plan=spec.plan,
+                    region=spec.region,
+                    image=spec.image,
+                    hostname=spec.hostname,
+                    ssh_keys=spec.ssh_keys,
+                    user_data=spec.user_data,
+                    tags=spec.tags,
+                )
+                self._add(
+                    Change("create", "server", spec.hostname, request),
+                    functools.partial(self._create_server, spec.hostname, request),
+                )
+                continue
+
+            model = existing[0].get_model()
+            self._server_ids[spec.hostname] = model.id
+            self._check_server_drift(spec, model)
+            update = _base.changed_fields(
+                servers.UpdateRequest(tags=spec.tags), {"tags": model.tags or {}}
+            )
+            if update is not None:
+                self._add(
+                    Change("update", "server", spec.hostname, update),
+                    functools.partial(self._facade.servers.update, model.id, update),
+                )
+
+    def _check_server_drift(self, spec: ServerSpec, model: servers.ServerModel) -> None:
+        current = {
+            "plan": model.plan.slug if model.plan else None,
+            "region": model.region.slug if model.region else None,
+            "image": model.deployed_image.slug if model.deployed_image else None,
+        }
+        for field, value in current.items():
+            desired = getattr(spec, field)
+            if desired is not None and desired != value:
+                self._drift.append(
+                    f"server {spec.hostname}: {field} is {value}, not {desired}"
+                )
+
+    def _create_server(self, hostname: str, request: servers.CreationRequest) -> None:
+        server = self._facade.servers.create(
+            request,
+            self._snapshot.project_id,
+            deployment_timeout=self._deployment_timeout,
+        )
+        self._server_ids[hostname] = server.get_id()
+
+    def _hostname(self, server_id: int) -> str | None:
+        server = self._snapshot.get_server(server_id)
+        return server.get_model().hostname if server is not None else None
+
+    def _plan_volumes(self) -> None:
+        specs = {spec.server: spec for spec in self._desired.volumes}
+        regions = {spec.hostname: spec.region for spec in self._desired.servers}
+        for storage in self._snapshot.block_storages:
+            model = storage.get_model()
+            attached_to = model.attached_to
+            hostname = self._hostname(attached_to.id) if attached_to else None
+            spec = specs.get(hostname) if hostname is not None else None
+            if spec is None or hostname in self._storage_ids:
+                if self._prune:
+                    self._prune_storage(model)
+                continue
+
+            self._storage_ids[spec.server] = model.id
+            if spec.size < model.size:
+                self._drift.append(
+                    f"storage {spec.server}: size is {model.size}, not {spec.size}"
+                )
+            update = _base.changed_fields(
+                block_storages.UpdateRequest(size=max(spec.size, model.size)),
+                {"size": model.size},
+            )
+            if update is not None:
+                self._add(
+                    Change("update", "storage", spec.server, update),
+                    functools.partial(
+                        self._facade.block_storages.update, model.id, update
+                    ),
+                )
+
+        for spec in specs.values():
+            if spec.server in self._storage_ids:
+                continue
+            request = block_storages.CreationRequest(
+                region=regions[spec.server],
+                size=spec.size,
+                description=spec.description,
+            )
+            created = self._add(
+                Change("create", "storage", spec.server, request),
+                functools.partial(self._create_storage, spec.server, request),
+            )
+            self._add(
+                Change(
+                    "attach",
+                    "storage",
+                    spec.server,
+                    depends_on=(created, *self._created("server", spec.server)),
+                ),
+                functools.partial(self._attach_storage, spec.server),
+            )
+
+    def _create_storage(
+        self, hostname: str, request: block_storages.CreationRequest
+    ) -> None:
+        storage = self._facade.block_storages.create(request, self._snapshot.project_id)
+        self._storage_ids[hostname] = storage.get_id()
+
+    def _attach_storage(self, hostname: str) -> None:
+        self._facade.block_storages.attach(
+            self._storage_ids[hostname],
+            block_storages.AttachRequest(attach_to=self._server_ids[hostname]),
+        )
+
+    def _prune_storage(self, model: block_storages.BlockStorageModel) -> None:
+        name = str(model.id)
+        depends_on: tuple[str, ...] = ()
+        if model.attached_to is not None:
+            detached = self._add(
+                Change("detach", "storage", name),
+                functools.partial(self._facade.block_storages.detach, model.id),
+            )
+            self._before_delete[model.attached_to.id].append(detached)
+            depends_on = (detached,)
+        self._add(
+            Change("delete", "storage", name, depends_on=depends_on),
+            functools.partial(self._facade.block_storages.delete, model.id),
+        )
+
+    def _plan_ips(self) -> None:
+        specs = {spec.name: spec for spec in self._desired.ips}
+        for ip in self._snapshot.ips:
+            model = ip.get_model()
+            if model.type != "floating-ip":
+                continue
+            name = (model.tags or {}).get(NAME_TAG)
+            spec = specs.get(name) if name is not None else None
+            if spec is None or spec.name in self._ip_ids:
+                if self._prune:
+                    self._add(
+                        Change("delete", "ip", f"{name or ''} {model.id}".strip()),
+                        functools.partial(self._facade.ips.delete, model.id),
+                    )
+                continue
+            self._ip_ids[spec.name] = model.id
+            self._update_ip(spec, model)
+
+        for spec in specs.values():
+            if spec.name not in self._ip_ids:
+                self._create_ip(spec)
+
+    def _ip_tags(self, spec: IPSpec) -> dict[str, str]:
+        return {**spec.tags, NAME_TAG: spec.name}
+
+    def _target_id(self, spec: IPSpec) -> int | None:
+        """Get the ID to target an IP address to, `None` if not known yet."""
+        if spec.target is None:
+            return 0
+        return self._server_ids.get(spec.target)
+
+    def _update_ip(self, spec: IPSpec, model: ips.IPModel) -> None:
+        update = _base.changed_fields(
+            ips.UpdateRequest(
+                ptr_record=spec.ptr_record,
+                a_record=spec.a_record,
+                tags=self._ip_tags(spec),
+                targeted_to=self._target_id(spec),
+            ),
+            {
+                "ptr_record": model.ptr_record,
+                "a_record": model.a_record,
+                "tags": model.tags or {},
+                "targeted_to": model.targeted_to.id if model.targeted_to else 0,
+            },
+        )
+        if update is not None:
+            self._add(
+                Change("update", "ip", spec.name, update),
+                functools.partial(self._facade.ips.update, model.id, update),
+            )
+        self._target_new_server(spec)
+
+    def _create_ip(self, spec: IPSpec) -> None:
+        target_id = self._target_id(spec)
+        request = ips.CreationRequest(
+            region=spec.region,
+            targeted_to=target_id or None,
+            ptr_record=spec.ptr_record,
+            a_record=spec.a_record,
+            tags=self._ip_tags(spec),
+        )
+        self._add(
+            Change("create", "ip", spec.name, request),
+            functools.partial(self._create_ip_address, spec.name, request),
+        )
+        self._target_new_server(spec)
+
+    def _create_ip_address(self, name: str, request: ips.CreationRequest) -> None:
+        ip = self._facade.ips.create(request, self._snapshot.project_id)
+        self._ip_ids[name] = ip.get_id()
+
+    def _target_new_server(self, spec: IPSpec) -> None:
+        if spec.target is None or spec.target in self._server_ids:
+            return
+        self._add(
+            Change(
+                "target",
+                "ip",
+                spec.name,
+                depends_on=(
+                    *self._created("ip", spec.name),
+                    *self._created("server", spec.target),
+                ),
+            ),
+            functools.partial(self._target_ip, spec.name, spec.target),
+        )
+
+    def _target_ip(self, name: str, hostname: str) -> None:
+        self._facade.ips.update(
+            self._ip_ids[name],
+            ips.UpdateRequest(targeted_to=self._server_ids[hostname]),
+        )
+
+    def _prune_servers(self) -> None:
+        desired = {spec.hostname for spec in self._desired.servers}
+        for server in self._snapshot.servers:
+            model = server.get_model()
+            if (
+                model.hostname in desired
+                and self._server_ids[model.hostname] == model.id
+            ):
+                continue
+            self._untarget_kept_ips(model.id)
+            self._add(
+                Change(
+                    "delete",
+                    "server",
+                    f"{model.hostname or ''} {model.id}".strip(),
+                    depends_on=tuple(self._before_delete[model.id]),
+                ),
+                functools.partial(self._facade.servers.delete, model.id),
+            )
+
+    def _untarget_kept_ips(self, server_id: int) -> None:
+        """Move IP addresses that are kept off a server before it is deleted."""
+        names = {ip_id: name for name, ip_id in self._ip_ids.items()}
+        for ip in self._snapshot.ips_of(server_id):
+            name = names.get(ip.get_id())
+            if name is None:
+                continue
+            update = Change("update", "ip", name)
+            retargeted = next(
+                (
+                    c.key
+                    for c in self._changes
+                    if c.key == update.key
+                    and isinstance(c.request, ips.UpdateRequest)
+                    and c.request.targeted_to is not None
+                ),
+                None,
+            )
+            target = Change("target", "ip", name).key
+            if retargeted is None and target in self._tasks:
+                retargeted = target
+            if retargeted is None:
+                request = ips.UpdateRequest(targeted_to=0)
+                retargeted = self._add(
+                    Change("detach", "ip", name, request),
+                    functools.partial(self._facade.ips.update, ip.get_id(), request),
+                )
+            self._before_delete[server_id].append(retargeted)
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import TYPE_CHECKING
 
-from pydantic import Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from cherryservers_sdk_python import (
     _base,
     _resource_polling,
+    _rollout,
+    _tagging,
     block_storages,
+    bulk,
+    dryrun,
     ips,
     plans,
     projects,
@@ -18,8 +24,12 @@ from cherryservers_sdk_python import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable, Iterator, Mapping
+
     from requests import Response
 
+    from cherryservers_sdk_python import _client
+
 
 class NotBaremetalError(Exception):
     """Attempted baremetal only operation on VPS."""
@@ -388,6 +398,49 @@ class RebuildRequest(_base.RequestSchema):
     )
 
 
+class StatusChange(BaseModel):
+    """Observed server status change.
+
+    Attributes:
+        server_id (int): Server ID.
+        previous_status (str | None): Previously observed status,
+         `None` for the first observation.
+        status (str): Current status.
+        observed_at (float): Time of the observation, as a UNIX timestamp.
+        elapsed (float): Seconds since the watch started.
+        model (ServerModel): Current server model.
+
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    server_id: int = Field(description="Server ID.")
+    previous_status: str | None = Field(
+        description="Previously observed status, None for the first observation."
+    )
+    status: str = Field(description="Current status.")
+    observed_at: float = Field(
+        description="Time of the observation, as a UNIX timestamp."
+    )
+    elapsed: float = Field(description="Seconds since the watch started.")
+    model: ServerModel = Field(description="Current server model.")
+
+
+class _StatusWatch:
+    """State of a server status watch."""
+
+    def __init__(
+        self,
+        server_ids: Iterable[int],
+        target_status: str | None,
+        timeout: float | None,
+    ) -> None:
+        self.target_status = target_status
+        self.schedule = _resource_polling.PollSchedule(server_ids, timeout)
+        self.statuses: dict[int, str] = {}
+        self.started = time.monotonic()
+
+
 class ServerClient(_base.ResourceClient):
     """Cherry Servers server client.
 
@@ -427,16 +480,142 @@ class ServerClient(_base.ResourceClient):
 
     DEFAULT_DEPLOYMENT_TIMEOUT = 1800
 
+    def __init__(
+        self,
+        api_client: _client.CherryApiClient,
+        request_timeout: int = 120,
+        *,
+        record_transitions: bool = True,
+    ) -> None:
+        """Initialize a Cherry Servers server client.
+
+        :param bool record_transitions: Whether transitions waited for
+            are recorded in the transition history. Disabled in dry-run mode,
+            where transitions complete instantly.
+        """
+        super().__init__(api_client, request_timeout)
+        self._record_transitions = record_transitions
+        self._transition_history = self._guarded(_resource_polling.TransitionHistory())
+
+    @property
+    def transition_history(self) -> _resource_polling.TransitionHistory:
+        """Recorded server transition durations.
+
+        Replace it with a history that has a path to persist it between sessions.
+        """
+        return self._transition_history
+
+    @transition_history.setter
+    def transition_history(self, value: _resource_polling.TransitionHistory) -> None:
+        """Set recorded server transition durations."""
+        self._transition_history = self._guarded(value)
+
+    def _guarded(
+        self, history: _resource_polling.TransitionHistory
+    ) -> _resource_polling.TransitionHistory:
+        if self._record_transitions or isinstance(
+            history, dryrun.ReadOnlyTransitionHistory
+        ):
+            return history
+        return dryrun.ReadOnlyTransitionHistory(history)
+
+    def estimate_ready_time(self, plan: str, region: str, action: str) -> float | None:
+        """Estimate how long a server transition takes, in seconds.
+
+        Based on the durations of previously waited for transitions.
+
+        :param str plan: Plan slug.
+        :param str region: Region slug.
+        :param str action: Action, such as `create`, `rebuild` or `reboot`.
+
+        :returns float | None: Estimated duration, `None` if nothing is recorded.
+        """
+        return self._transition_history.estimate(plan, region, action)
+
     def _wait_for_status(
-        self, response: Response, target_status: str, timeout: float
+        self, response: Response, target_status: str, timeout: float, action: str
     ) -> Server:
+        started = time.monotonic()
         resp_json = response.json()
         server = Server(self, ServerModel.model_validate(resp_json))
+        key = (server.get_plan_slug(), server.get_region_slug(), action)
         _resource_polling.wait_for_resource_condition(
-            server, timeout, lambda: server.get_status() == target_status
+            server,
+            timeout,
+            lambda: server.get_status() == target_status,
+            self._transition_history.first_check_after(*key),
         )
+        self._transition_history.record(time.monotonic() - started, *key)
         return server
 
+    def _observe(self, watch: _StatusWatch, server_id: int) -> StatusChange | None:
+        model = self.get_by_id(server_id).get_model()
+        previous_status = watch.statuses.get(server_id)
+        watch.statuses[server_id] = model.status
+        changed = previous_status != model.status
+        if model.status != watch.target_status:
+            watch.schedule.reschedule(server_id, changed=changed)
+        if not changed:
+            return None
+        return StatusChange(
+            server_id=server_id,
+            previous_status=previous_status,
+            status=model.status,
+            observed_at=time.time(),
+            elapsed=time.monotonic() - watch.started,
+            model=model,
+        )
+
+    def watch(
+        self,
+        server_ids: Iterable[int],
+        *,
+        target_status: str | None = "deployed",
+        timeout: float | None = DEFAULT_DEPLOYMENT_TIMEOUT,
+    ) -> Iterator[StatusChange]:
+        """Watch servers, yielding each observed status change.
+
+        The first observation of each server is yielded as well.
+        Servers are polled independently, backing off while their status
+        stays the same.
+
+        :param Iterable[int] server_ids: IDs of servers to watch.
+        :param str | None target_status: Status at which a server is no longer
+            watched. The watch ends once all servers reach it.
+            If `None`, servers are watched until the timeout.
+        :param float | None timeout: Timeout in seconds, or `None` for no timeout.
+
+        :raises cherryservers_sdk_python._resource_polling.ResourceTimeoutError:
+            If the timeout occurs.
+        """
+        watch = _StatusWatch(server_ids, target_status, timeout)
+        while watch.schedule:
+            server_id, delay = watch.schedule.pop()
+            time.sleep(delay)
+            change = self._observe(watch, server_id)
+            if change is not None:
+                yield change
+
+    async def watch_async(
+        self,
+        server_ids: Iterable[int],
+        *,
+        target_status: str | None = "deployed",
+        timeout: float | None = DEFAULT_DEPLOYMENT_TIMEOUT,
+    ) -> AsyncIterator[StatusChange]:
+        """Watch servers asynchronously, yielding each observed status change.
+
+        Same as :meth:`watch`, but waits with :func:`asyncio.sleep`
+        and sends requests from a worker thread.
+        """
+        watch = _StatusWatch(server_ids, target_status, timeout)
+        while watch.schedule:
+            server_id, delay = watch.schedule.pop()
+            await asyncio.sleep(delay)
+            change = await asyncio.to_thread(self._observe, watch, server_id)
+            if change is not None:
+                yield change
+
     def get_by_id(self, server_id: int) -> Server:
         """Retrieve a server by ID."""
         response = self._api_client.get(
@@ -477,12 +656,15 @@ class ServerClient(_base.ResourceClient):
             self.request_timeout,
         )
         if wait_for_active:
-            return self._wait_for_status(response, "deployed", deployment_timeout)
+            return self._wait_for_status(
+                response, "deployed", deployment_timeout, "create"
+            )
         return self.get_by_id(response.json()["id"])
 
     def delete(self, server_id: int) -> None:
         """Delete server by ID."""
         self._api_client.delete(f"servers/{server_id}", None, self.request_timeout)
+        self._notify_deleted(server_id)
 
     def update(
         self,
@@ -495,6 +677,39 @@ class ServerClient(_base.ResourceClient):
         )
         return self.get_by_id(response.json()["id"])
 
+    def bulk_update_tags(
+        self,
+        servers: Iterable[Server],
+        tags: Mapping[str, str],
+        mode: bulk.TagMode = "merge",
+        *,
+        max_workers: int = 10,
+    ) -> bulk.TagUpdateResult[Server]:
+        """Update the tags of many servers at once.
+
+        Servers whose current tags already match are skipped,
+        and the rest are updated concurrently, with one request each.
+
+        :param Iterable[Server] servers: Servers to tag.
+        :param Mapping[str, str] tags: Tags to set.
+        :param bulk.TagMode mode: Whether to merge the tags with the current ones,
+            or replace them.
+        :param int max_workers: Maximum number of concurrent requests.
+
+        :returns bulk.TagUpdateResult[Server]: Updated, unchanged
+            and failed servers.
+        """
+        return _tagging.update_tags(servers, tags, mode, self._update_tags, max_workers)
+
+    def _update_tags(self, server: Server, tags: dict[str, str]) -> Server:
+        response = self._api_client.put(
+            f"servers/{server.get_id()}",
+            UpdateRequest(tags=tags),
+            None,
+            self.request_timeout,
+        )
+        return Server(self, ServerModel.model_validate(response.json()))
+
     def power_off(
         self,
         server_id: int,
@@ -510,7 +725,9 @@ class ServerClient(_base.ResourceClient):
             self.request_timeout,
         )
         if wait_for_active:
-            return self._wait_for_status(response, "deployed", deployment_timeout)
+            return self._wait_for_status(
+                response, "deployed", deployment_timeout, "power_off"
+            )
         return self.get_by_id(response.json()["id"])
 
     def power_on(
@@ -528,7 +745,9 @@ class ServerClient(_base.ResourceClient):
             self.request_timeout,
         )
         if wait_for_active:
-            return self._wait_for_status(response, "deployed", deployment_timeout)
+            return self._wait_for_status(
+                response, "deployed", deployment_timeout, "power_on"
+            )
         return self.get_by_id(response.json()["id"])
 
     def reboot(
@@ -546,9 +765,134 @@ class ServerClient(_base.ResourceClient):
             self.request_timeout,
         )
         if wait_for_active:
-            return self._wait_for_status(response, "deployed", deployment_timeout)
+            return self._wait_for_status(
+                response, "deployed", deployment_timeout, "reboot"
+            )
         return self.get_by_id(response.json()["id"])
 
+    def _start_action(
+        self, server_id: int, action_schema: _base.RequestSchema
+    ) -> Server:
+        response = self._api_client.post(
+            f"servers/{server_id}/actions",
+            action_schema,
+            None,
+            self.request_timeout,
+        )
+        return Server(self, ServerModel.model_validate(response.json()))
+
+    def _run_many(
+        self,
+        server_ids: Iterable[int],
+        action_schema: _base.RequestSchema,
+        action: str,
+        policy: bulk.RolloutPolicy | None,
+        deployment_timeout: float,
+    ) -> bulk.BulkResult:
+        return _rollout.Rollout(
+            self,
+            action,
+            lambda server_id: self._start_action(server_id, action_schema),
+            policy=bulk.RolloutPolicy() if policy is None else policy,
+            timeout=deployment_timeout,
+        ).run(server_ids)
+
+    def power_off_many(
+        self,
+        server_ids: Iterable[int],
+        policy: bulk.RolloutPolicy | None = None,
+        *,
+        deployment_timeout: int = DEFAULT_DEPLOYMENT_TIMEOUT,
+    ) -> bulk.BulkResult:
+        """Power off servers by ID and wait for all of them.
+
+        :param Iterable[int] server_ids: IDs of servers to power off.
+        :param bulk.RolloutPolicy | None policy: How many servers are powered off
+            at a time. By default, all of them at once.
+        :param int deployment_timeout: Timeout for each server in seconds.
+
+        :returns bulk.BulkResult: Outcome for each server.
+        """
+        return self._run_many(
+            server_ids, PowerOffRequest(), "power_off", policy, deployment_timeout
+        )
+
+    def power_on_many(
+        self,
+        server_ids: Iterable[int],
+        policy: bulk.RolloutPolicy | None = None,
+        *,
+        deployment_timeout: int = DEFAULT_DEPLOYMENT_TIMEOUT,
+    ) -> bulk.BulkResult:
+        """Power on servers by ID and wait for all of them.
+
+        Same as :meth:`power_off_many`, but powers servers on.
+        """
+        return self._run_many(
+            server_ids, PowerOnRequest(), "power_on", policy, deployment_timeout
+        )
+
+    def reboot_many(
+        self,
+        server_ids: Iterable[int],
+        policy: bulk.RolloutPolicy | None = None,
+        *,
+        deployment_timeout: int = DEFAULT_DEPLOYMENT_TIMEOUT,
+    ) -> bulk.BulkResult:
+        """Reboot servers by ID and wait for all of them.
+
+        Same as :meth:`power_off_many`, but reboots servers.
+        """
+        return self._run_many(
+            server_ids, RebootRequest(), "reboot", policy, deployment_timeout
+        )
+
+    def rebuild_many(
+        self,
+        servers: Iterable[Server],
+        rebuild_template: RebuildRequest,
+        policy: bulk.RolloutPolicy | None = None,
+        *,
+        hostnames: Mapping[int, str] | None = None,
+        deployment_timeout: int = DEFAULT_DEPLOYMENT_TIMEOUT,
+    ) -> bulk.BulkResult:
+        """Rebuild servers in waves and wait for all of them.
+
+        WARNING: this a destructive action that will delete all of your data.
+
+        Each server is rebuilt with the image, password, SSH keys
+        and user data of the template, and keeps its current hostname,
+        unless another one is given.
+        Use a policy to limit the servers being rebuilt at once,
+        stop after too many failures, or check the health of each wave
+        before rebuilding the next one.
+
+        :param Iterable[Server] servers: Servers to rebuild.
+        :param RebuildRequest rebuild_template: Rebuild request
+            shared by all servers. Its hostname is used for servers
+            that have none.
+        :param bulk.RolloutPolicy | None policy: Rollout policy.
+            By default, all servers are rebuilt at once.
+        :param Mapping[int, str] | None hostnames: New hostnames by server ID.
+        :param int deployment_timeout: Timeout for each server in seconds.
+
+        :returns bulk.BulkResult: Outcome for each server.
+        """
+        schemas: dict[int, RebuildRequest] = {}
+        for server in servers:
+            model = server.get_model()
+            hostname = (hostnames or {}).get(model.id) or model.hostname
+            schemas[model.id] = rebuild_template.model_copy(
+                update={"hostname": hostname or rebuild_template.hostname}
+            )
+        return _rollout.Rollout(
+            self,
+            "rebuild",
+            lambda server_id: self._start_action(server_id, schemas[server_id]),
+            policy=bulk.RolloutPolicy() if policy is None else policy,
+            timeout=deployment_timeout,
+        ).run(schemas)
+
     def enter_rescue_mode(
         self,
         server_id: int,
@@ -575,7 +919,9 @@ class ServerClient(_base.ResourceClient):
         )
 
         if wait_for_active:
-            return self._wait_for_status(response, "rescue mode", deployment_timeout)
+            return self._wait_for_status(
+                response, "rescue mode", deployment_timeout, "enter_rescue_mode"
+            )
         return self.get_by_id(response.json()["id"])
 
     def exit_rescue_mode(
@@ -594,7 +940,9 @@ class ServerClient(_base.ResourceClient):
         )
 
         if wait_for_active:
-            return self._wait_for_status(response, "deployed", deployment_timeout)
+            return self._wait_for_status(
+                response, "deployed", deployment_timeout, "exit_rescue_mode"
+            )
         return self.get_by_id(response.json()["id"])
 
     def rebuild(
@@ -616,7 +964,9 @@ class ServerClient(_base.ResourceClient):
             self.request_timeout,
         )
         if wait_for_active:
-            return self._wait_for_status(response, "deployed", deployment_timeout)
+            return self._wait_for_status(
+                response, "deployed", deployment_timeout, "rebuild"
+            )
         return self.get_by_id(response.json()["id"])
 
     def reset_bmc_password(self, server_id: int) -> Server:
@@ -665,9 +1015,25 @@ class Server(
         self._deployment_timeout = value
 
     def update(self, update_schema: UpdateRequest) -> None:
-        """Update Cherry Servers server resource."""
-        updated = self._client.update(self._model.id, update_schema)
-        self._model = updated.get_model()
+        """Update Cherry Servers server resource.
+
+        Only fields that differ from the current model are sent,
+        and no request is sent if none do.
+        """
+        model = self.get_model()
+        changes = _base.changed_fields(
+            update_schema,
+            {
+                "name": model.name,
+                "hostname": model.hostname,
+                "tags": model.tags,
+                "bgp": model.bgp.enabled if model.bgp else None,
+            },
+        )
+        if changes is None:
+            return
+        updated = self._client.update(model.id, changes)
+        self._set_model(updated.get_model())
 
     def delete(self) -> None:
         """Delete Cherry Servers server resource."""
@@ -678,21 +1044,21 @@ class Server(
         serv = self._client.power_off(
             self._model.id, deployment_timeout=self.deployment_timeout
         )
-        self._model = serv.get_model()
+        self._set_model(serv.get_model())
 
     def power_on(self) -> None:
         """Power on Cherry Servers server."""
         serv = self._client.power_on(
             self._model.id, deployment_timeout=self.deployment_timeout
         )
-        self._model = serv.get_model()
+        self._set_model(serv.get_model())
 
     def reboot(self) -> None:
         """Reboot a Cherry Servers server."""
         serv = self._client.reboot(
             self._model.id, deployment_timeout=self.deployment_timeout
         )
-        self._model = serv.get_model()
+        self._set_model(serv.get_model())
 
     def enter_rescue_mode(self, rescue_mode_schema: EnterRescueModeRequest) -> None:
         """Put a Cherry Servers server into rescue mode.
@@ -704,14 +1070,14 @@ class Server(
             rescue_mode_schema,
             deployment_timeout=self.deployment_timeout,
         )
-        self._model = serv.get_model()
+        self._set_model(serv.get_model())
 
     def exit_rescue_mode(self) -> None:
         """Put a Cherry Servers server out of rescue mode."""
         serv = self._client.exit_rescue_mode(
             self._model.id, deployment_timeout=self.deployment_timeout
         )
-        self._model = serv.get_model()
+        self._set_model(serv.get_model())
 
     def rebuild(self, rebuild_schema: RebuildRequest) -> None:
         """Rebuild a Cherry Servers server.
@@ -721,7 +1087,7 @@ class Server(
         serv = self._client.rebuild(
             self._model.id, rebuild_schema, deployment_timeout=self.deployment_timeout
         )
-        self._model = serv.get_model()
+        self._set_model(serv.get_model())
 
     def reset_bmc_password(self) -> None:
         """Reset server BMC password.
@@ -729,14 +1095,49 @@ class Server(
         Only for baremetal servers!
         """
         serv = self._client.reset_bmc_password(self._model.id)
-        self._model = serv.get_model()
+        self._set_model(serv.get_model())
+
+    def watch(
+        self, *, target_status: str | None = "deployed", timeout: float | None = None
+    ) -> Iterator[StatusChange]:
+        """Watch the server, yielding each observed status change.
+
+        The server model is updated on every change.
+        See :meth:`ServerClient.watch`.
+
+        :param str | None target_status: Status at which the watch ends.
+        :param float | None timeout: Timeout in seconds.
+            Defaults to the deployment timeout.
+        """
+        for change in self._client.watch(
+            [self._model.id],
+            target_status=target_status,
+            timeout=self.deployment_timeout if timeout is None else timeout,
+        ):
+            self._set_model(change.model)
+            yield change
+
+    async def watch_async(
+        self, *, target_status: str | None = "deployed", timeout: float | None = None
+    ) -> AsyncIterator[StatusChange]:
+        """Watch the server asynchronously, yielding each observed status change.
+
+        See :meth:`watch`.
+        """
+        async for change in self._client.watch_async(
+            [self._model.id],
+            target_status=target_status,
+            timeout=self.deployment_timeout if timeout is None else timeout,
+        ):
+            self._set_model(change.model)
+            yield change
 
     def refresh(self) -> None:
         """Refresh the server.
 
         Refreshes server model to match the actual state.
         """
-        self._model = self._client.get_by_id(self._model.id).get_model()
+        self._set_model(self._client.get_by_id(self._model.id).get_model())
 
     def get_status(self) -> str:
         """Get server status."""
@@ -751,6 +1152,15 @@ class Server(
             return self._model.plan.slug
         return ""
 
+    def get_region_slug(self) -> str:
+        """Get server region slug.
+
+        :returns str: Server region slug. If non-existent, returns an empty string.
+        """
+        if self._model.region is not None and self._model.region.slug is not None:
+            return self._model.region.slug
+        return ""
+
     def get_id(self) -> int:
         """Get server ID."""
         return self._model.id
@@ -126,6 +126,7 @@ class SSHKeyClient(_base.ResourceClient):
     def delete(self, sshkey_id: int) -> None:
         """Delete SSH key by ID."""
         self._api_client.delete(f"ssh-keys/{sshkey_id}", None, self.request_timeout)
+        self._notify_deleted(sshkey_id)
 
     def update(
         self,
@@ -151,9 +152,19 @@ class SSHKey(_base.Resource[SSHKeyClient, SSHKeyModel]):
         self._client.delete(self._model.id)
 
     def update(self, update_schema: UpdateRequest) -> None:
-        """Update Cherry Servers SSH key resource."""
-        updated = self._client.update(self._model.id, update_schema)
-        self._model = updated.get_model()
+        """Update Cherry Servers SSH key resource.
+
+        Only fields that differ from the current model are sent,
+        and no request is sent if none do.
+        """
+        model = self.get_model()
+        changes = _base.changed_fields(
+            update_schema, {"label": model.label, "key": model.key}
+        )
+        if changes is None:
+            return
+        updated = self._client.update(model.id, changes)
+        self._set_model(updated.get_model())
 
     def get_id(self) -> int:
         """Get resource ID."""
@@ -279,6 +279,7 @@ class TeamClient(_base.ResourceClient):
     def delete(self, team_id: int) -> None:
         """Delete a team by ID."""
         self._api_client.delete(f"teams/{team_id}", None, self.request_timeout)
+        self._notify_deleted(team_id)
 
     def update(self, team_id: int, update_schema: UpdateRequest) -> Team:
         """Update a team by ID."""
@@ -300,9 +301,18 @@ class Team(_base.Resource[TeamClient, TeamModel]):
         self._client.delete(self._model.id)
 
     def update(self, update_schema: UpdateRequest) -> None:
-        """Update Cherry Servers team resource."""
-        updated = self._client.update(self._model.id, update_schema)
-        self._model = updated.get_model()
+        """Update Cherry Servers team resource.
+
+        Only fields that differ from the current model are sent,
+        and no request is sent if none do.
+        Team type and currency are always sent, if set.
+        """
+        model = self.get_model()
+        changes = _base.changed_fields(update_schema, {"name": model.name})
+        if changes is None:
+            return
+        updated = self._client.update(model.id, changes)
+        self._set_model(updated.get_model())
 
     def get_id(self) -> int:
         """Get resource ID."""
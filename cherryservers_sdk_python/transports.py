@@ -0,0 +1,461 @@
+"""Cherry Servers API HTTP transports.
+
+A transport sends a single HTTP request and returns its response.
+:class:`cherryservers_sdk_python.facade.CherryApiFacade` uses
+:class:`RequestsTransport` by default, but any other transport can be supplied,
+e.g. :class:`HttpxTransport` to multiplex requests over a single HTTP/2 connection,
+or :class:`InMemoryTransport` for tests and benchmarks.
+:class:`RecordingTransport` and :class:`ReplayTransport` capture real API traffic
+into cassettes and replay it deterministically without network access.
+"""
+
+from __future__ import annotations
+
+import abc
+import collections
+import gzip
+import json
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Callable, Mapping
+
+Timeout = float | tuple[float, float]
+"""Request timeout in seconds, or a `(connect, read)` tuple of timeouts."""
+
+
+class CassetteMismatchError(Exception):
+    """Replayed request was not recorded in the cassette."""
+
+    def __init__(self, method: str, url: str) -> None:
+        """Initialize error."""
+        super().__init__(f"No recorded response for {method} {url}")
+
+
+def build_response(
+    status_code: int,
+    content: bytes,
+    url: str,
+    headers: Mapping[str, str] | None = None,
+    reason: str | None = None,
+) -> requests.Response:
+    """Build a `requests.Response` from raw response data.
+
+    Transports must return `requests.Response` objects,
+    this helper is meant for transports that are not backed by `requests`.
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content  # noqa: SLF001
+    response.url = url
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.reason = reason or ""
+    response.encoding = "utf-8"
+    return response
+
+
+class Transport(abc.ABC):
+    """Cherry Servers API HTTP transport base."""
+
+    @abc.abstractmethod
+    def send(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None,
+        data: str | None,
+        headers: Mapping[str, str],
+        timeout: Timeout,
+    ) -> requests.Response:
+        """Send an HTTP request.
+
+        Redirects must not be followed, the API client handles them.
+
+        :param str method: HTTP method, such as `GET` or `POST`.
+        :param str url: Full request URL.
+        :param dict[str, Any] | None params: Query parameters.
+        :param str | None data: Request body.
+        :param Mapping[str, str] headers: Request headers.
+        :param Timeout timeout: Request timeout in seconds,
+            or a `(connect, read)` tuple of timeouts.
+        """
+
+    def close(self) -> None:  # noqa: B027
+        """Release any resources held by the transport."""
+
+
+class RequestsTransport(Transport):
+    """HTTP transport backed by `requests`.
+
+    :param bool thread_safe: Whether each thread should use its own
+        `requests.Session`, since `requests.Session` is not guaranteed
+        to be thread-safe.
+    """
+
+    def __init__(self, *, thread_safe: bool = False) -> None:
+        """Initialize a `requests` transport."""
+        self._session = self._new_session()
+        self._thread_local = threading.local() if thread_safe else None
+        # Per-thread sessions, kept alive only by their threads,
+        # so that the sessions of live threads can be closed.
+        self._lock = threading.Lock()
+        self._thread_sessions: weakref.WeakSet[requests.Session] = weakref.WeakSet()
+
+    @property
+    def thread_safe(self) -> bool:
+        """Whether the transport uses a separate session for each thread."""
+        return self._thread_local is not None
+
+    def _new_session(self) -> requests.Session:
+        return requests.Session()
+
+    def _get_session(self) -> requests.Session:
+        if self._thread_local is None:
+            return self._session
+        session: requests.Session | None = getattr(self._thread_local, "session", None)
+        if session is None:
+            session = self._new_session()
+            self._thread_local.session = session
+            with self._lock:
+                self._thread_sessions.add(session)
+        return session
+
+    def send(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None,
+        data: str | None,
+        headers: Mapping[str, str],
+        timeout: Timeout,
+    ) -> requests.Response:
+        """Send an HTTP request with `requests`."""
+        return self._get_session().request(
+            method,
+            url,
+            params=params,
+            data=data,
+            headers=headers,
+            timeout=timeout,
+            allow_redirects=False,
+        )
+
+    def close(self) -> None:
+        """Close the shared session and the sessions of live threads.
+
+        The sessions of threads that have exited are already released.
+        """
+        self._session.close()
+        with self._lock:
+            sessions = list(self._thread_sessions)
+        for session in sessions:
+            session.close()
+
+
+class HttpxTransport(Transport):
+    """HTTP transport backed by `httpx`, with HTTP/2 support.
+
+    With HTTP/2 enabled, concurrent requests from many threads are multiplexed
+    over a single connection, instead of each holding its own socket.
+    `httpx.Client` is thread-safe, so this transport can be shared between threads.
+
+    Requires `httpx`, with the `http2` extra for HTTP/2:
+    `pip install cherryservers-sdk-python[http2]`.
+
+    :param bool http2: Whether to use HTTP/2. Defaults to True.
+    :param int max_connections: Maximum number of open connections.
+    """
+
+    def __init__(self, *, http2: bool = True, max_connections: int = 10) -> None:
+        """Initialize an `httpx` transport."""
+        try:
+            import httpx  # noqa: PLC0415
+        except ImportError as e:
+            msg = (
+                "HttpxTransport requires httpx: "
+                "pip install cherryservers-sdk-python[http2]"
+            )
+            raise ImportError(msg) from e
+
+        self._httpx = httpx
+        self._client = httpx.Client(
+            http2=http2,
+            follow_redirects=False,
+            limits=httpx.Limits(max_connections=max_connections),
+        )
+
+    def send(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None,
+        data: str | None,
+        headers: Mapping[str, str],
+        timeout: Timeout,
+    ) -> requests.Response:
+        """Send an HTTP request with `httpx`."""
+        request_timeout: Any = timeout
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            request_timeout = self._httpx.Timeout(read_timeout, connect=connect_timeout)
+        try:
+            r = self._client.request(
+                method,
+                url,
+                params=params,
+                content=data,
+                headers=dict(headers),
+                timeout=request_timeout,
+            )
+        except self._httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        return build_response(
+            r.status_code, r.content, str(r.url), dict(r.headers), r.reason_phrase
+        )
+
+    def close(self) -> None:
+        """Close the `httpx` client and its connections."""
+        self._client.close()
+
+
+class InMemoryTransport(Transport):
+    """In-memory HTTP transport for tests and benchmarks.
+
+    Responses are either registered in advance with :meth:`add_response`,
+    or produced by a handler that receives the method, URL, query parameters
+    and request body, and returns a status code and a JSON-serializable body.
+    Registered responses take precedence over the handler.
+
+    All sent requests are recorded in :attr:`requests`.
+
+    Example:
+        .. code-block:: python
+
+            transport = cherryservers_sdk_python.transports.InMemoryTransport()
+            transport.add_response(
+                "GET",
+                "https://api.cherryservers.com/v1/regions",
+                [{"id": 1, "slug": "LT-Siauliai"}],
+            )
+            facade = cherryservers_sdk_python.facade.CherryApiFacade(
+                "token", transport=transport
+            )
+            regions = facade.regions.get_all()
+
+    """
+
+    def __init__(
+        self,
+        handler: Callable[
+            [str, str, dict[str, Any] | None, str | None], tuple[int, Any]
+        ]
+        | None = None,
+    ) -> None:
+        """Initialize an in-memory transport."""
+        self._handler = handler
+        self._responses: dict[tuple[str, str], tuple[int, bytes]] = {}
+        self._lock = threading.Lock()
+        self.requests: list[tuple[str, str, dict[str, Any] | None, str | None]] = []
+
+    def add_response(
+        self, method: str, url: str, body: object, status_code: int = 200
+    ) -> None:
+        """Register a response for a method and URL."""
+        self._responses[method, url] = (status_code, json.dumps(body).encode())
+
+    def send(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None,
+        data: str | None,
+        headers: Mapping[str, str],  # noqa: ARG002
+        timeout: Timeout,  # noqa: ARG002
+    ) -> requests.Response:
+        """Return the registered or handler-produced response."""
+        with self._lock:
+            self.requests.append((method, url, params, data))
+
+        registered = self._responses.get((method, url))
+        if registered is not None:
+            return build_response(registered[0], registered[1], url)
+        if self._handler is None:
+            return build_response(404, b'{"message": "Not found"}', url)
+
+        status_code, body = self._handler(method, url, params, data)
+        return build_response(status_code, json.dumps(body).encode(), url)
+
+
+# Response headers that affect SDK behaviour and are kept in cassettes.
+_RECORDED_HEADERS = ("Content-Type", "Location", "Retry-After", "X-Request-Id")
+
+
+def _open_cassette(path: Path, *, write: bool) -> IO[str]:
+    if path.suffix == ".gz":
+        if write:
+            return gzip.open(path, "wt", encoding="utf-8")
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open("w" if write else "r", encoding="utf-8")
+
+
+def _interaction_key(
+    method: str, url: str, params: dict[str, Any] | None
+) -> tuple[str, str, str]:
+    return method, url, json.dumps(params, sort_keys=True)
+
+
+class RecordingTransport(Transport):
+    """HTTP transport that records API interactions into a cassette.
+
+    Every request is sent through the wrapped transport,
+    and the interaction is appended to the cassette file as a single JSON line:
+    method, URL, query parameters, request body, response status,
+    a few relevant response headers, response body and elapsed time.
+    Request headers, including the API token, are never recorded.
+    Cassettes with a `.gz` suffix are gzip-compressed.
+
+    :param Transport transport: Transport that sends the actual requests.
+    :param str | os.PathLike[str] path: Cassette file path. Overwritten if it exists.
+
+    Example:
+        .. code-block:: python
+
+            transport = cherryservers_sdk_python.transports.RecordingTransport(
+                cherryservers_sdk_python.transports.RequestsTransport(),
+                "create-server.jsonl.gz",
+            )
+            facade = cherryservers_sdk_python.facade.CherryApiFacade(
+                token, transport=transport
+            )
+            facade.servers.create(creation_req, project_id=123456)
+            transport.close()
+
+    """
+
+    def __init__(self, transport: Transport, path: str | os.PathLike[str]) -> None:
+        """Initialize a recording transport."""
+        self._transport = transport
+        self._lock = threading.Lock()
+        self._file = _open_cassette(Path(path), write=True)
+
+    def send(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None,
+        data: str | None,
+        headers: Mapping[str, str],
+        timeout: Timeout,
+    ) -> requests.Response:
+        """Send an HTTP request and record the interaction."""
+        start = time.perf_counter()
+        r = self._transport.send(
+            method, url, params=params, data=data, headers=headers, timeout=timeout
+        )
+        interaction = {
+            "method": method,
+            "url": url,
+            "params": params,
+            "data": data,
+            "status": r.status_code,
+            "headers": {h: r.headers[h] for h in _RECORDED_HEADERS if h in r.headers},
+            "body": r.text,
+            "elapsed": round(time.perf_counter() - start, 4),
+        }
+        line = json.dumps(interaction, separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+        return r
+
+    def close(self) -> None:
+        """Flush the cassette and close the wrapped transport."""
+        with self._lock:
+            self._file.close()
+        self._transport.close()
+
+
+class ReplayTransport(Transport):
+    """HTTP transport that replays API interactions from a cassette.
+
+    Interactions are matched by method, URL and query parameters,
+    and repeated requests, such as polling ticks, receive the recorded responses
+    in their original order. Request bodies are not matched, since they may
+    contain generated values, such as passwords.
+
+    :param str | os.PathLike[str] path: Cassette file path,
+        as written by :class:`RecordingTransport`.
+    :param bool simulate_latency: Whether to sleep for the recorded response time.
+    :param float latency_scale: Multiplier for simulated latency.
+    :param bool repeat_last: Whether to keep replaying the last recorded response
+        when a request is repeated more times than it was recorded.
+        Otherwise, :class:`CassetteMismatchError` is raised.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        simulate_latency: bool = False,
+        latency_scale: float = 1.0,
+        repeat_last: bool = True,
+    ) -> None:
+        """Initialize a replay transport."""
+        self._simulate_latency = simulate_latency
+        self._latency_scale = latency_scale
+        self._repeat_last = repeat_last
+        self._lock = threading.Lock()
+        self._interactions: dict[
+            tuple[str, str, str], collections.deque[dict[str, Any]]
+        ] = collections.defaultdict(collections.deque)
+        with _open_cassette(Path(path), write=False) as f:
+            for line in f:
+                if line.strip():
+                    interaction = json.loads(line)
+                    key = _interaction_key(
+                        interaction["method"],
+                        interaction["url"],
+                        interaction["params"],
+                    )
+                    self._interactions[key].append(interaction)
+
+    def send(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None,
+        data: str | None,  # noqa: ARG002
+        headers: Mapping[str, str],  # noqa: ARG002
+        timeout: Timeout,  # noqa: ARG002
+    ) -> requests.Response:
+        """Return the next recorded response for the request."""
+        with self._lock:
+            queue = self._interactions.get(_interaction_key(method, url, params))
+            if not queue:
+                raise CassetteMismatchError(method, url)
+            if len(queue) > 1 or not self._repeat_last:
+                interaction = queue.popleft()
+            else:
+                interaction = queue[0]
+
+        if self._simulate_latency:
+            time.sleep(interaction["elapsed"] * self._latency_scale)
+        return build_response(
+            interaction["status"],
+            interaction["body"].encode(),
+            url,
+            interaction["headers"],
+        )
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
+from concurrent import futures
 from typing import TYPE_CHECKING, cast
 from unittest import mock
 
@@ -10,10 +13,10 @@ import pytest
 import requests
 from pydantic import Field
 
-from cherryservers_sdk_python import _base, _client
+from cherryservers_sdk_python import _base, _client, errors
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
 
 
 class RequestSchema(_base.RequestSchema):
@@ -37,7 +40,7 @@ class TestCherryClient:
     def client(self) -> Generator[_client.CherryApiClient]:
         """Initialize default Cherry API client."""
         client = _client.CherryApiClient("test_token", user_agent_prefix="test")
-        patcher = mock.patch.object(client, "_requests_session")
+        patcher = mock.patch.object(client, "_transport")
         patcher.start()
         yield client
         patcher.stop()
@@ -46,73 +49,211 @@ class TestCherryClient:
         self, client: _client.CherryApiClient, response: requests.Response
     ) -> None:
         """Test GET request."""
-        cast("mock.Mock", client._requests_session.get).return_value = response
+        cast("mock.Mock", client._transport.send).return_value = response
         resp = client.get(path="test_url", params=None)
-        cast("mock.Mock", client._requests_session.get).assert_called_with(
+        cast("mock.Mock", client._transport.send).assert_called_with(
+            "GET",
             "https://api.cherryservers.com/v1/test_url",
             params=None,
+            data=None,
+            headers=client._headers,
             timeout=120,
-            allow_redirects=False,
         )
         assert resp == response
 
-    def test_delete(
+    def test_get_redirect(
         self, client: _client.CherryApiClient, response: requests.Response
     ) -> None:
-        """Test DELETE request."""
-        cast("mock.Mock", client._requests_session.delete).return_value = response
-        resp = client.delete(path="test_url", params=None)
-        cast("mock.Mock", client._requests_session.delete).assert_called_with(
-            "https://api.cherryservers.com/v1/test_url",
+        """Test that GET redirects are followed with authentication headers."""
+        redirect = requests.Response()
+        redirect.status_code = 301
+        redirect.headers["Location"] = "http://api.cherryservers.com/v1/moved"
+        cast("mock.Mock", client._transport.send).side_effect = [redirect, response]
+        resp = client.get(path="test_url", params=None)
+        cast("mock.Mock", client._transport.send).assert_called_with(
+            "GET",
+            "http://api.cherryservers.com/v1/moved",
             params=None,
+            data=None,
+            headers=client._headers,
             timeout=120,
         )
         assert resp == response
 
-    def test_post(
+    def test_delete(
         self, client: _client.CherryApiClient, response: requests.Response
     ) -> None:
-        """Test POST request."""
-        response.status_code = 201
-        cast("mock.Mock", client._requests_session.post).return_value = response
-        req = RequestSchema()
-        resp = client.post(path="test_url", data=req)
-        cast("mock.Mock", client._requests_session.post).assert_called_with(
+        """Test DELETE request."""
+        cast("mock.Mock", client._transport.send).return_value = response
+        resp = client.delete(path="test_url", params=None)
+        cast("mock.Mock", client._transport.send).assert_called_with(
+            "DELETE",
             "https://api.cherryservers.com/v1/test_url",
             params=None,
+            data=None,
+            headers=client._headers,
             timeout=120,
-            data=req.model_dump_json(),
         )
         assert resp == response
 
-    def test_put(
-        self, client: _client.CherryApiClient, response: requests.Response
+    @pytest.mark.parametrize("method", ["post", "put", "patch"])
+    def test_request_with_body(
+        self,
+        client: _client.CherryApiClient,
+        response: requests.Response,
+        method: str,
     ) -> None:
-        """Test PUT request."""
+        """Test POST, PUT and PATCH requests."""
         response.status_code = 201
-        cast("mock.Mock", client._requests_session.put).return_value = response
+        cast("mock.Mock", client._transport.send).return_value = response
         req = RequestSchema()
-        resp = client.put(path="test_url", data=req)
-        cast("mock.Mock", client._requests_session.put).assert_called_with(
+        resp = getattr(client, method)(path="test_url", data=req)
+        cast("mock.Mock", client._transport.send).assert_called_with(
+            method.upper(),
             "https://api.cherryservers.com/v1/test_url",
             params=None,
-            timeout=120,
             data=req.model_dump_json(),
+            headers=client._headers,
+            timeout=120,
         )
         assert resp == response
 
-    def test_patch(
+    def test_invalid_method(self, client: _client.CherryApiClient) -> None:
+        """Test that unsupported methods are rejected."""
+        with pytest.raises(_client.InvalidMethodError):
+            client._send_request("TRACE", "test_url")
+        cast("mock.Mock", client._transport.send).assert_not_called()
+
+    def test_http_error(
         self, client: _client.CherryApiClient, response: requests.Response
     ) -> None:
-        """Test PATCH request."""
-        response.status_code = 201
-        cast("mock.Mock", client._requests_session.patch).return_value = response
-        req = RequestSchema()
-        resp = client.patch(path="test_url", data=req)
-        cast("mock.Mock", client._requests_session.patch).assert_called_with(
-            "https://api.cherryservers.com/v1/test_url",
-            params=None,
-            timeout=120,
-            data=req.model_dump_json(),
-        )
-        assert resp == response
+        """Test that HTTP errors are raised with the response text."""
+        response.status_code = 400
+        cast("mock.Mock", client._transport.send).return_value = response
+        with pytest.raises(requests.exceptions.HTTPError, match="result"):
+            client.get(path="test_url")
+
+    def test_not_found(
+        self, client: _client.CherryApiClient, response: requests.Response
+    ) -> None:
+        """Test that missing resources raise a typed error."""
+        response.status_code = 404
+        cast("mock.Mock", client._transport.send).return_value = response
+        with pytest.raises(errors.NotFoundError, match="result") as e:
+            client.get(path="servers/1")
+        assert e.value.endpoint == "servers/1"
+        assert e.value.response is response
+
+    @pytest.mark.parametrize(
+        ("status_code", "error_type", "retryable"),
+        [
+            (400, errors.ApiError, False),
+            (409, errors.ConflictError, False),
+            (429, errors.RateLimitedError, True),
+            (502, errors.ServerError, True),
+        ],
+    )
+    def test_api_errors(
+        self,
+        client: _client.CherryApiClient,
+        response: requests.Response,
+        status_code: int,
+        error_type: type[errors.ApiError],
+        retryable: bool,  # noqa: FBT001
+    ) -> None:
+        """Test that unsuccessful responses raise typed errors with metadata."""
+        response.status_code = status_code
+        response.headers["X-Request-Id"] = "abc"
+        response.headers["Retry-After"] = "7"
+        cast("mock.Mock", client._transport.send).return_value = response
+        with pytest.raises(error_type) as e:
+            client.delete("servers/1")
+        assert type(e.value) is error_type
+        assert (e.value.method, e.value.endpoint) == ("DELETE", "servers/1")
+        assert (e.value.status_code, e.value.request_id) == (status_code, "abc")
+        assert e.value.retryable is retryable
+        if isinstance(e.value, errors.RateLimitedError):
+            assert e.value.retry_after == 7  # noqa: PLR2004
+
+    def test_timeout(self, client: _client.CherryApiClient) -> None:
+        """Test that transport timeouts raise a typed error."""
+        cast(
+            "mock.Mock", client._transport.send
+        ).side_effect = requests.exceptions.ReadTimeout("read timed out")
+        with pytest.raises(requests.exceptions.Timeout) as e:
+            client.get("servers/1")
+        assert isinstance(e.value, errors.RequestTimeoutError)
+        assert e.value.status_code is None
+
+    def test_negative_cache(self, response: requests.Response) -> None:
+        """Test that recently missing resources fail without a request."""
+        client = _client.CherryApiClient("test_token", negative_cache_ttl=30)
+        response.status_code = 404
+        with (
+            mock.patch.object(client, "_transport") as transport,
+            mock.patch("time.monotonic", return_value=0) as monotonic,
+        ):
+            transport.send.return_value = response
+            for _ in range(3):
+                with pytest.raises(errors.NotFoundError):
+                    client.get("servers/1")
+            assert transport.send.call_count == 1
+
+            monotonic.return_value = 30
+            with pytest.raises(errors.NotFoundError):
+                client.get("servers/1")
+            assert transport.send.call_count == 2  # noqa: PLR2004
+
+            calls: tuple[Callable[[], object], ...] = (
+                lambda: client.put("servers/1", RequestSchema()),
+                lambda: client.get("servers/1"),
+            )
+            for request in calls:
+                with pytest.raises(errors.NotFoundError):
+                    request()
+            assert transport.send.call_count == 4  # noqa: PLR2004
+
+    def test_coalesced_get(self, response: requests.Response) -> None:
+        """Test that concurrent identical GET requests share one request."""
+        client = _client.CherryApiClient("test_token", coalesce_gets=True)
+        release = threading.Event()
+        calls = 0
+
+        def slow_get(*_: object, **__: object) -> requests.Response:
+            nonlocal calls
+            calls += 1
+            release.wait(5)
+            return response
+
+        with (
+            mock.patch.object(client, "_transport") as transport,
+            futures.ThreadPoolExecutor(max_workers=8) as pool,
+        ):
+            transport.send.side_effect = slow_get
+            results = [
+                pool.submit(client.get, "test_url", {"fields": "id"}) for _ in range(8)
+            ]
+            time.sleep(0.2)
+            release.set()
+            responses = [r.result() for r in results]
+
+        assert calls == 1
+        assert all(r is response for r in responses)
+
+    def test_coalesced_get_list_params(self, response: requests.Response) -> None:
+        """Test that GET requests with list params can be coalesced."""
+        client = _client.CherryApiClient("test_token", coalesce_gets=True)
+        with mock.patch.object(client, "_transport") as transport:
+            transport.send.return_value = response
+            assert client.get("test_url", {"fields": ["id", "name"]}) is response
+            transport.send.assert_called_once()
+
+    def test_coalesced_get_error(self) -> None:
+        """Test that the in-flight request error is raised and not cached."""
+        client = _client.CherryApiClient("test_token", coalesce_gets=True)
+        with mock.patch.object(client, "_transport") as transport:
+            transport.send.side_effect = requests.exceptions.ConnectionError
+            for expected_calls in (1, 2):
+                with pytest.raises(requests.exceptions.ConnectionError):
+                    client.get("test_url")
+                assert transport.send.call_count == expected_calls
@@ -66,6 +66,23 @@ def test_update(
     )
 
 
+def test_update_unchanged_description(
+    block_storage_resource: cherryservers_sdk_python.block_storages.BlockStorage,
+    simple_block_storage: dict[str, Any],
+) -> None:
+    """Test that an unchanged description is not sent."""
+    block_storage_resource.update(
+        cherryservers_sdk_python.block_storages.UpdateRequest(
+            size=simple_block_storage["size"],
+            description=simple_block_storage["description"],
+        )
+    )
+
+    cast(
+        "mock.Mock", block_storage_resource._client._api_client.put
+    ).assert_not_called()
+
+
 def test_attach(
     block_storage_resource: cherryservers_sdk_python.block_storages.BlockStorage,
     attached_block_storage: dict[str, Any],
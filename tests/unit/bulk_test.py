@@ -0,0 +1,325 @@
+"""Unit tests for Cherry Servers Python SDK bulk server operations."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+import cherryservers_sdk_python
+from cherryservers_sdk_python import bulk, deadlines, errors
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from tests.unit import helpers
+
+_REBUILD = cherryservers_sdk_python.servers.RebuildRequest(
+    image="ubuntu_24_04_64bit",
+    hostname="node",
+    password="secret",  # noqa: S106
+)
+
+
+@pytest.fixture
+def server_ids(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_project: cherryservers_sdk_python.projects.Project,
+    clock: helpers.Clock,
+) -> list[int]:
+    """Initialize four deployed fake servers."""
+    ids = [
+        fake_facade.servers.create(
+            cherryservers_sdk_python.servers.CreationRequest(
+                region="LT-Siauliai", plan="e3_1240v3", hostname=f"node-{i}"
+            ),
+            fake_project.get_id(),
+            wait_for_active=False,
+        ).get_id()
+        for i in range(4)
+    ]
+    clock.now += 300
+    return ids
+
+
+@pytest.mark.usefixtures("sleep")
+def test_reboot_many(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    server_ids: list[int],
+    clock: helpers.Clock,
+) -> None:
+    """Test rebooting servers at once, waiting for them with a shared poller."""
+    started = clock.now
+    result = fake_facade.servers.reboot_many(server_ids)
+
+    assert result.ok
+    assert [r.server_id for r in result.succeeded] == server_ids
+    assert all(
+        r.model is not None and r.model.status == "deployed" for r in result.results
+    )
+    # All servers reboot in parallel, the 60 second reboot is waited for once.
+    assert clock.now - started < 120  # noqa: PLR2004
+    assert (
+        fake_facade.servers.estimate_ready_time("e3_1240v3", "LT-Siauliai", "reboot")
+        is not None
+    )
+
+
+@pytest.mark.usefixtures("sleep")
+def test_rolling_power_off(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_api: cherryservers_sdk_python.fake_api.FakeCherryApi,
+    server_ids: list[int],
+    clock: helpers.Clock,
+) -> None:
+    """Test that rolling operations keep few servers unavailable at a time."""
+    started = clock.now
+    result = fake_facade.servers.power_off_many(
+        [*server_ids, 999],
+        bulk.RolloutPolicy(batch_size=2, max_unavailable=1),
+    )
+
+    assert [r.outcome for r in result.results] == [
+        "succeeded",
+        "succeeded",
+        "succeeded",
+        "succeeded",
+        "failed",
+    ]
+    assert isinstance(result.failed[0].error, errors.NotFoundError)
+    # One server at a time, each taking 60 seconds to power off.
+    assert clock.now - started >= 240  # noqa: PLR2004
+    assert {fake_api.servers[i]["state"] for i in server_ids} == {"off"}
+    with pytest.raises(bulk.BulkOperationError):
+        result.raise_for_failures()
+
+
+@pytest.mark.usefixtures("sleep")
+def test_bulk_deadline(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    server_ids: list[int],
+    clock: helpers.Clock,
+) -> None:
+    """Test that servers are skipped once the deadline has passed."""
+    with deadlines.Deadline(90, clock=clock):
+        result = fake_facade.servers.power_on_many(
+            server_ids, bulk.RolloutPolicy(max_unavailable=1)
+        )
+
+    assert [r.outcome for r in result.results] == [
+        "succeeded",
+        "failed",
+        "skipped",
+        "skipped",
+    ]
+    assert isinstance(result.failed[0].error, errors.DeadlineExceededError)
+
+
+@pytest.mark.usefixtures("sleep")
+def test_rolling_rebuild(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_api: cherryservers_sdk_python.fake_api.FakeCherryApi,
+    server_ids: list[int],
+) -> None:
+    """Test rebuilding servers in waves gated by a health check."""
+    waves: list[list[int]] = []
+
+    def health_check(results: Sequence[bulk.ServerResult]) -> bool:
+        waves.append([r.server_id for r in results])
+        return len(waves) < 2  # noqa: PLR2004
+
+    result = fake_facade.servers.rebuild_many(
+        [fake_facade.servers.get_by_id(server_id) for server_id in server_ids[:3]],
+        _REBUILD,
+        bulk.RolloutPolicy(batch_size=1, health_check=health_check),
+        hostnames={server_ids[0]: "rebuilt-0"},
+    )
+
+    assert waves == [[server_ids[0]], [server_ids[1]]]
+    assert [r.outcome for r in result.results] == [
+        "succeeded",
+        "succeeded",
+        "skipped",
+    ]
+    assert result.stop_reason == "health check failed after wave 2"
+    assert [fake_api.servers[i]["hostname"] for i in server_ids[:3]] == [
+        "rebuilt-0",
+        "node-1",
+        "node-2",
+    ]
+    assert (
+        fake_api.servers[server_ids[2]]["deployed_image"]
+        != fake_api.servers[server_ids[0]]["deployed_image"]
+    )
+
+
+@pytest.mark.usefixtures("sleep")
+def test_max_failures(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    server_ids: list[int],
+) -> None:
+    """Test that no more servers are started after too many failures."""
+    servers = [fake_facade.servers.get_by_id(server_id) for server_id in server_ids]
+    servers[1].delete()
+
+    result = fake_facade.servers.rebuild_many(
+        servers,
+        _REBUILD,
+        bulk.RolloutPolicy(max_unavailable=1, max_failures=0),
+    )
+
+    assert [r.outcome for r in result.results] == [
+        "succeeded",
+        "failed",
+        "skipped",
+        "skipped",
+    ]
+    assert result.stop_reason == "more than 0 servers failed"
+
+
+@pytest.mark.usefixtures("sleep")
+def test_action_reported_at_target_status(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    server_ids: list[int],
+    clock: helpers.Clock,
+) -> None:
+    """Test that servers are waited for even if the action response is stale."""
+    start_action = fake_facade.servers._start_action
+
+    def stale_start_action(
+        server_id: int, schema: cherryservers_sdk_python._base.RequestSchema
+    ) -> cherryservers_sdk_python.servers.Server:
+        server = start_action(server_id, schema)
+        server._model = server.get_model().model_copy(update={"status": "deployed"})
+        return server
+
+    started = clock.now
+    with mock.patch.object(
+        fake_facade.servers, "_start_action", side_effect=stale_start_action
+    ):
+        result = fake_facade.servers.reboot_many(
+            server_ids, bulk.RolloutPolicy(max_unavailable=1)
+        )
+
+    assert result.ok
+    # One server at a time, each taking 60 seconds to reboot.
+    assert clock.now - started >= 240  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("sleep")
+def test_unexpected_errors_fail_servers(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    server_ids: list[int],
+) -> None:
+    """Test that errors other than request errors are reported per server."""
+    get_by_id = fake_facade.servers.get_by_id
+
+    def invalid_get_by_id(server_id: int) -> cherryservers_sdk_python.servers.Server:
+        if server_id == server_ids[1]:
+            msg = "invalid server model"
+            raise ValueError(msg)
+        return get_by_id(server_id)
+
+    def health_check(_: Sequence[bulk.ServerResult]) -> bool:
+        msg = "health check crashed"
+        raise RuntimeError(msg)
+
+    with mock.patch.object(
+        fake_facade.servers, "get_by_id", side_effect=invalid_get_by_id
+    ):
+        result = fake_facade.servers.reboot_many(
+            server_ids, bulk.RolloutPolicy(batch_size=2, health_check=health_check)
+        )
+
+    assert [r.outcome for r in result.results] == [
+        "failed",
+        "failed",
+        "skipped",
+        "skipped",
+    ]
+    assert isinstance(result.results[0].error, RuntimeError)
+    assert isinstance(result.results[1].error, ValueError)
+    assert result.stop_reason == "health check failed after wave 1"
+
+
+def test_bulk_update_server_tags(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_api: cherryservers_sdk_python.fake_api.FakeCherryApi,
+    server_ids: list[int],
+) -> None:
+    """Test that only servers whose tags change are updated."""
+    servers = [fake_facade.servers.get_by_id(server_id) for server_id in server_ids]
+    servers[0].update(cherryservers_sdk_python.servers.UpdateRequest(tags={"a": "1"}))
+    servers[1].update(
+        cherryservers_sdk_python.servers.UpdateRequest(tags={"a": "1", "b": "2"})
+    )
+    fake_api.request_counts.clear()
+
+    result = fake_facade.servers.bulk_update_tags([*servers, servers[0]], {"b": "2"})
+
+    assert result.ok
+    assert [s.get_id() for s in result.unchanged] == [server_ids[1]]
+    assert [s.get_id() for s in result.updated] == [
+        server_ids[0],
+        server_ids[2],
+        server_ids[3],
+    ]
+    assert result.updated == [servers[0], servers[2], servers[3]]
+    assert servers[0].get_model().tags == {"a": "1", "b": "2"}
+    assert fake_api.servers[server_ids[2]]["tags"] == {"b": "2"}
+    assert fake_api.request_counts == {("PUT", r"^servers/(\d+)$"): 3}
+
+
+def test_bulk_update_tags_unexpected_error(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    server_ids: list[int],
+) -> None:
+    """Test that any update error is reported without losing other results."""
+    servers = [fake_facade.servers.get_by_id(server_id) for server_id in server_ids]
+    update_tags = fake_facade.servers._update_tags
+    invalid = ValueError("invalid response")
+
+    def fail_second(
+        server: cherryservers_sdk_python.servers.Server, tags: dict[str, str]
+    ) -> cherryservers_sdk_python.servers.Server:
+        if server is servers[1]:
+            raise invalid
+        return update_tags(server, tags)
+
+    with mock.patch.object(
+        fake_facade.servers, "_update_tags", side_effect=fail_second
+    ):
+        result = fake_facade.servers.bulk_update_tags(servers, {"a": "1"})
+
+    assert result.failed == [(servers[1], invalid)]
+    assert result.updated == [servers[0], servers[2], servers[3]]
+    assert servers[1].get_model().tags != {"a": "1"}
+
+
+def test_bulk_update_ip_tags(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_api: cherryservers_sdk_python.fake_api.FakeCherryApi,
+    fake_project: cherryservers_sdk_python.projects.Project,
+) -> None:
+    """Test replacing IP tags, with failed updates reported."""
+    ips = [
+        fake_facade.ips.create(
+            cherryservers_sdk_python.ips.CreationRequest(
+                region="LT-Siauliai", tags=tags
+            ),
+            fake_project.get_id(),
+        )
+        for tags in ({"env": "prod"}, {"env": "test", "team": "a"}, {})
+    ]
+    ips[2].delete()
+
+    result = fake_facade.ips.bulk_update_tags(ips, {"env": "prod"}, "replace")
+
+    assert [ip.get_id() for ip in result.unchanged] == [ips[0].get_id()]
+    assert [ip.get_model().tags for ip in result.updated] == [{"env": "prod"}]
+    assert fake_api.ips[ips[1].get_id()]["tags"] == {"env": "prod"}
+    assert [ip.get_id() for ip, _ in result.failed] == [ips[2].get_id()]
+    assert isinstance(result.failed[0][1], errors.NotFoundError)
+    with pytest.raises(bulk.BulkOperationError, match="1 tag updates failed"):
+        result.raise_for_failures()
@@ -0,0 +1,255 @@
+"""Unit tests for Cherry Servers Python SDK response caches."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+import pytest
+
+import cherryservers_sdk_python
+from cherryservers_sdk_python import cache, transports
+
+if TYPE_CHECKING:
+    import pathlib
+
+    import requests
+
+REGIONS_URL = "https://api.cherryservers.com/v1/regions"
+
+
+@pytest.fixture
+def transport() -> transports.InMemoryTransport:
+    """Initialize in-memory transport with a region catalog."""
+    transport = transports.InMemoryTransport()
+    transport.add_response("GET", REGIONS_URL, [{"id": 1, "slug": "LT-Siauliai"}])
+    return transport
+
+
+def _facade(
+    transport: transports.Transport, response_cache: cache.Cache
+) -> cherryservers_sdk_python.facade.CherryApiFacade:
+    return cherryservers_sdk_python.facade.CherryApiFacade(
+        "token", transport=transport, response_cache=response_cache
+    )
+
+
+def test_sqlite_cache_persists(
+    tmp_path: pathlib.Path, transport: transports.InMemoryTransport
+) -> None:
+    """Test that a new process answers catalog queries from disk."""
+    path = tmp_path / "cache.sqlite3"
+    facade = _facade(transport, cache.SQLiteCache(path))
+    facade.regions.get_all()
+    facade.regions.get_all()
+    assert len(transport.requests) == 1
+
+    offline = transports.InMemoryTransport()
+    regions = _facade(offline, cache.SQLiteCache(path)).regions.get_all()
+    assert [r.get_model().slug for r in regions] == ["LT-Siauliai"]
+    assert offline.requests == []
+
+
+def test_sqlite_cache_schema_version(tmp_path: pathlib.Path) -> None:
+    """Test that entries stored by another SDK version are ignored."""
+    path = tmp_path / "cache.sqlite3"
+    now = time.time()
+    entry = cache.CacheEntry(200, b"[]", "application/json", now, now + 60)
+    with mock.patch.object(cache, "SCHEMA_VERSION", "0.0.0"):
+        cache.SQLiteCache(path).set("regions", entry)
+        assert cache.SQLiteCache(path).get("regions") == entry
+
+    assert cache.SQLiteCache(path).get("regions") is None
+
+
+def test_stale_while_revalidate(
+    tmp_path: pathlib.Path, transport: transports.InMemoryTransport
+) -> None:
+    """Test that stale entries are served while revalidated in the background."""
+    facade = _facade(
+        transport, cache.SQLiteCache(tmp_path / "cache.sqlite3", ttls={"regions": 0})
+    )
+    facade.regions.get_all()
+    transport.add_response("GET", REGIONS_URL, [{"id": 2, "slug": "NL-Amsterdam"}])
+
+    stale = facade.regions.get_all()
+    assert [r.get_id() for r in stale] == [1]
+    for thread in list(facade._api_client._revalidations.values()):
+        thread.join()
+
+    assert [r.get_id() for r in facade.regions.get_all()] == [2]
+
+
+def test_failed_revalidation_logged(
+    tmp_path: pathlib.Path,
+    transport: transports.InMemoryTransport,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that any revalidation error is logged and keeps the stale entry."""
+    facade = _facade(
+        transport, cache.SQLiteCache(tmp_path / "cache.sqlite3", ttls={"regions": 0})
+    )
+    facade.regions.get_all()
+
+    with mock.patch.object(
+        facade._api_client, "_get", side_effect=ValueError("invalid JSON")
+    ):
+        facade.regions.get_all()
+        for thread in list(facade._api_client._revalidations.values()):
+            thread.join()
+
+    assert "Failed to revalidate cached regions" in caplog.text
+    assert facade._api_client._revalidations == {}
+    assert [r.get_id() for r in facade.regions.get_all()] == [1]
+
+
+def test_response_fetched_before_mutation_not_stored(
+    transport: transports.InMemoryTransport,
+) -> None:
+    """Test that a response racing a mutation is not stored after invalidation."""
+    response_cache = cache.MemoryCache()
+    facade = _facade(transport, response_cache)
+    client = facade._api_client
+    get = client._get
+
+    def get_racing_mutation(*args: Any) -> requests.Response:  # noqa: ANN401
+        response = get(*args)
+        transport.add_response("DELETE", REGIONS_URL, None, status_code=204)
+        client.delete("regions")
+        return response
+
+    with mock.patch.object(client, "_get", side_effect=get_racing_mutation):
+        facade.regions.get_all()
+
+    facade.regions.get_all()
+    assert [r[0] for r in transport.requests].count("GET") == 2  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    ("path", "data", "expected"),
+    [
+        ("servers/1", None, {"servers/1"}),
+        ("servers/1/actions", '{"type": "reboot"}', {"servers/1/actions", "servers/1"}),
+        (
+            "projects/2/servers",
+            '{"ip_addresses": ["a"]}',
+            {"projects/2/servers", "projects/2/ips", "ips/a"},
+        ),
+        (
+            "storages/3/attachments",
+            '{"attach_to": 1}',
+            {"storages/3/attachments", "storages/3", "servers/1"},
+        ),
+        (
+            "servers/1/backup-storages",
+            "{}",
+            {
+                "servers/1/backup-storages",
+                "servers/1",
+                "projects/*/backup-storages",
+            },
+        ),
+    ],
+)
+def test_mutation_tokens(path: str, data: str | None, expected: set[str]) -> None:
+    """Test entries invalidated by mutating requests."""
+    assert cache.mutation_tokens(path, data) == expected
+
+
+def test_response_tokens() -> None:
+    """Test that responses are invalidated by the resources they contain."""
+    content = b'[{"id": 1, "href": "/servers/1", "ip_addresses": [{"href": "/ips/a"}]}]'
+    assert cache.response_tokens("projects/2/servers", content) == {
+        "projects/2/servers",
+        "projects/*/servers",
+        "servers/1",
+        "ips/a",
+    }
+
+
+def test_memory_cache_invalidation(
+    fake_api: cherryservers_sdk_python.fake_api.FakeCherryApi,
+    fake_project: cherryservers_sdk_python.projects.Project,
+) -> None:
+    """Test that mutations invalidate exactly the affected entries."""
+    facade = _facade(fake_api, cache.MemoryCache())
+    project_id = fake_project.get_id()
+
+    def gets() -> int:
+        return sum(
+            n for (method, _), n in fake_api.request_counts.items() if method == "GET"
+        )
+
+    db, web = (
+        facade.servers.create(
+            cherryservers_sdk_python.servers.CreationRequest(
+                region="LT-Siauliai", plan="e3_1240v3", hostname=hostname
+            ),
+            project_id,
+            wait_for_active=False,
+        )
+        for hostname in ("db-1", "web-1")
+    )
+    facade.servers.list_by_project(project_id)
+    facade.ips.list_by_project(project_id)
+    before = gets()
+    facade.servers.list_by_project(project_id)
+    facade.servers.get_by_id(web.get_id())
+    assert gets() == before
+
+    db.update(cherryservers_sdk_python.servers.UpdateRequest(tags={"role": "db"}))
+    listed = {s.get_id(): s for s in facade.servers.list_by_project(project_id)}
+    assert listed[db.get_id()].get_model().tags == {"role": "db"}
+    before = gets()
+    facade.servers.get_by_id(web.get_id())
+    assert gets() == before
+
+    storage = facade.block_storages.create(
+        cherryservers_sdk_python.block_storages.CreationRequest(
+            region="LT-Siauliai", size=10
+        ),
+        project_id,
+    )
+    storage.attach(
+        cherryservers_sdk_python.block_storages.AttachRequest(attach_to=web.get_id())
+    )
+    attached = facade.block_storages.list_by_project(project_id)[0]
+    assert attached.get_model().attached_to is not None
+    assert facade.servers.get_by_id(web.get_id()).get_model().storage is not None
+
+    web.delete()
+    assert [s.get_id() for s in facade.servers.list_by_project(project_id)] == [
+        db.get_id()
+    ]
+    for ip in facade.ips.list_by_project(project_id):
+        targeted_to = ip.get_model().targeted_to
+        assert targeted_to is None or targeted_to.id != web.get_id()
+
+
+def test_memory_cache_backup_storage_creation(
+    fake_api: cherryservers_sdk_python.fake_api.FakeCherryApi,
+    fake_project: cherryservers_sdk_python.projects.Project,
+) -> None:
+    """Test that creating a backup storage for a server invalidates project lists."""
+    facade = _facade(fake_api, cache.MemoryCache())
+    project_id = fake_project.get_id()
+    server = facade.servers.create(
+        cherryservers_sdk_python.servers.CreationRequest(
+            region="LT-Siauliai", plan="e3_1240v3", hostname="db-1"
+        ),
+        project_id,
+        wait_for_active=False,
+    )
+    assert facade.backup_storages.list_by_project(project_id) == []
+
+    backup = facade.backup_storages.create(
+        cherryservers_sdk_python.backup_storages.CreationRequest(
+            region="LT-Siauliai", slug="backup_50"
+        ),
+        server.get_id(),
+        wait_for_active=False,
+    )
+    assert [b.get_id() for b in facade.backup_storages.list_by_project(project_id)] == [
+        backup.get_id()
+    ]
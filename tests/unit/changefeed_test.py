@@ -0,0 +1,56 @@
+"""Unit tests for Cherry Servers Python SDK project change feed."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import cherryservers_sdk_python
+from cherryservers_sdk_python import changefeed
+
+if TYPE_CHECKING:
+    from tests.unit import helpers
+
+
+def test_project_watcher(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_project: cherryservers_sdk_python.projects.Project,
+    fake_api: cherryservers_sdk_python.fake_api.FakeCherryApi,
+    clock: helpers.Clock,
+) -> None:
+    """Test project watcher events between polls."""
+    watcher = changefeed.ProjectWatcher(fake_facade, fake_project.get_id())
+    assert watcher.poll() == []
+
+    server = fake_facade.servers.create(
+        cherryservers_sdk_python.servers.CreationRequest(
+            region="LT-Siauliai", plan="B1-1-1gb-20s-shared", hostname="web-1"
+        ),
+        fake_project.get_id(),
+        wait_for_active=False,
+    )
+    added = watcher.poll()
+    assert {(type(e), e.resource_type) for e in added} == {
+        (changefeed.ResourceAdded, "server"),
+        (changefeed.ResourceAdded, "ip"),
+    }
+    assert watcher.poll() == []
+
+    clock.now += 300
+    changed = watcher.poll()
+    assert [(type(e), e.resource_id) for e in changed] == [
+        (changefeed.ResourceChanged, server.get_id())
+    ]
+    event = changed[0]
+    assert isinstance(event, changefeed.ResourceChanged)
+    assert event.changes["status"] == changefeed.FieldChange(
+        old="pending", new="deployed"
+    )
+    assert "hostname" not in event.changes
+
+    server.delete()
+    removed = watcher.poll()
+    assert {(type(e), e.resource_type) for e in removed} == {
+        (changefeed.ResourceRemoved, "server"),
+        (changefeed.ResourceRemoved, "ip"),
+    }
+    assert fake_api.request_counts["GET", r"^projects/(\d+)/backup-storages$"] == 0
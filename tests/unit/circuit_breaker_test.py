@@ -0,0 +1,62 @@
+"""Unit tests for Cherry Servers Python SDK circuit breaker."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from cherryservers_sdk_python import _client, circuit_breaker, errors, transports
+from tests.unit import helpers
+
+
+def test_endpoint_template() -> None:
+    """Test replacing resource IDs in API paths."""
+    assert (
+        circuit_breaker.endpoint_template("servers/123/actions")
+        == "servers/{id}/actions"
+    )
+    assert circuit_breaker.endpoint_template("regions") == "regions"
+
+
+def test_circuit_breaker() -> None:
+    """Test opening, half-open probing and closing of a failing endpoint."""
+    clock = helpers.Clock()
+    healthy = False
+
+    def handler(
+        _method: str, url: str, _params: object, _data: object
+    ) -> tuple[int, Any]:
+        if "backup-storages" in url and not healthy:
+            return 503, {"message": "Service unavailable"}
+        return 200, {"id": 1}
+
+    transport = transports.InMemoryTransport(handler)
+    breaker = circuit_breaker.CircuitBreaker(
+        minimum_calls=4, window_size=4, open_duration=30, clock=clock
+    )
+    client = _client.CherryApiClient("token", transport=transport, breaker=breaker)
+
+    for backup_id in range(4):
+        with pytest.raises(errors.ServerError):
+            client.get(f"backup-storages/{backup_id}")
+    assert breaker.states()["backup-storages/{id}"].state == "open"
+
+    sent = len(transport.requests)
+    with pytest.raises(errors.CircuitOpenError) as e:
+        client.get("backup-storages/1")
+    assert e.value.retry_after == 30  # noqa: PLR2004
+    assert len(transport.requests) == sent
+    client.get("regions/1")
+
+    clock.now += 30
+    with pytest.raises(errors.ServerError):
+        client.get("backup-storages/1")
+    assert breaker.states()["backup-storages/{id}"].state == "open"
+
+    clock.now += 30
+    healthy = True
+    client.get("backup-storages/1")
+    client.get("backup-storages/2")
+    assert breaker.states()["backup-storages/{id}"].state == "closed"
+    assert breaker.states()["regions/{id}"].failures == 0
@@ -0,0 +1,64 @@
+"""Cherry Servers Python SDK shared unit test fixtures."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+import cherryservers_sdk_python
+from tests.unit import helpers
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+@pytest.fixture
+def clock() -> helpers.Clock:
+    """Initialize manual clock fixture."""
+    return helpers.Clock()
+
+
+@pytest.fixture
+def fake_api(clock: helpers.Clock) -> cherryservers_sdk_python.fake_api.FakeCherryApi:
+    """Initialize fake API fixture."""
+    return cherryservers_sdk_python.fake_api.FakeCherryApi(
+        deploy_time=300, action_time=60, resize_time=30, seed=1, clock=clock
+    )
+
+
+@pytest.fixture
+def fake_facade(
+    fake_api: cherryservers_sdk_python.fake_api.FakeCherryApi,
+) -> cherryservers_sdk_python.facade.CherryApiFacade:
+    """Initialize facade backed by the fake API."""
+    return cherryservers_sdk_python.facade.CherryApiFacade(
+        "token", transport=fake_api, thread_safe=True
+    )
+
+
+@pytest.fixture
+def fake_project(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_api: cherryservers_sdk_python.fake_api.FakeCherryApi,
+) -> cherryservers_sdk_python.projects.Project:
+    """Initialize a fake project."""
+    return fake_facade.projects.create(
+        cherryservers_sdk_python.projects.CreationRequest(name="fake"),
+        fake_api.team_id,
+    )
+
+
+@pytest.fixture
+def sleep(clock: helpers.Clock) -> Generator[mock.Mock]:
+    """Patch sleeping to advance the fake API clock, which is also monotonic."""
+
+    def advance(seconds: float) -> None:
+        clock.now += seconds
+
+    with (
+        mock.patch("time.sleep", side_effect=advance) as sleep,
+        mock.patch("time.monotonic", clock),
+    ):
+        yield sleep
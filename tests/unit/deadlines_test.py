@@ -0,0 +1,167 @@
+"""Unit tests for Cherry Servers Python SDK operation deadlines."""
+
+from __future__ import annotations
+
+import contextvars
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+import pytest
+import requests
+
+import cherryservers_sdk_python
+from cherryservers_sdk_python import _client, deadlines, errors, hedging, transports
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from tests.unit import helpers
+
+
+class _TimeoutRecordingTransport(transports.Transport):
+    def __init__(self, on_send: Callable[[], None] | None = None) -> None:
+        self.timeouts: list[transports.Timeout] = []
+        self.deadlines: list[deadlines.Deadline | None] = []
+        self._on_send = on_send
+
+    def send(  # noqa: PLR0913
+        self,
+        method: str,  # noqa: ARG002
+        url: str,
+        *,
+        params: dict[str, Any] | None,  # noqa: ARG002
+        data: str | None,  # noqa: ARG002
+        headers: Mapping[str, str],  # noqa: ARG002
+        timeout: transports.Timeout,
+    ) -> requests.Response:
+        self.timeouts.append(timeout)
+        self.deadlines.append(deadlines.current())
+        if self._on_send is not None:
+            self._on_send()
+        return transports.build_response(200, b"{}", url)
+
+
+def test_request_timeout(clock: helpers.Clock) -> None:
+    """Test request timeouts under nested deadlines."""
+    outer = deadlines.Deadline(100, connect_timeout=5, clock=clock)
+    with outer:
+        assert deadlines.current() is outer
+        assert outer.request_timeout(120) == (5, 100)
+
+        clock.now = 40
+        with deadlines.Deadline(read_timeout=30, clock=clock) as inner:
+            assert inner.remaining() == 60  # noqa: PLR2004
+            assert inner.request_timeout(120) == (5, 30)
+
+        with deadlines.Deadline(200, clock=clock) as inner:
+            assert inner.remaining() == 60  # noqa: PLR2004
+            clock.now = 98
+            assert inner.request_timeout(120) == 2  # noqa: PLR2004
+            assert deadlines.cap(10) == 2  # noqa: PLR2004
+
+        assert deadlines.current() is outer
+        clock.now = 100
+        assert outer.expired
+
+    assert deadlines.current() is None
+    assert deadlines.cap(10) == 10  # noqa: PLR2004
+
+
+def test_copied_context_keeps_parent(clock: helpers.Clock) -> None:
+    """Test that work started under a nested deadline outlives its block."""
+    with deadlines.Deadline(10, clock=clock):
+        with deadlines.Deadline(100, clock=clock) as inner:
+            context = contextvars.copy_context()
+        with pytest.raises(RuntimeError):
+            inner.__enter__()
+
+    assert context.run(deadlines.cap, 60) == 10  # noqa: PLR2004
+
+
+def test_client_requests(clock: helpers.Clock) -> None:
+    """Test that requests use the remaining time and fail once it is spent."""
+    transport = _TimeoutRecordingTransport()
+    client = _client.CherryApiClient("token", transport=transport)
+
+    client.get("regions", timeout=30)
+    with deadlines.Deadline(60, connect_timeout=3, clock=clock):
+        client.get("regions", timeout=30)
+        clock.now = 50
+        client.post(
+            "projects/1/servers", cherryservers_sdk_python._base.RequestSchema()
+        )
+        clock.now = 60
+        with pytest.raises(errors.DeadlineExceededError) as e:
+            client.get("regions")
+
+    assert transport.timeouts == [30, (3, 30), (3, 10)]
+    assert e.value.endpoint == "regions"
+    assert not e.value.retryable
+
+
+def test_timeout_at_deadline(clock: helpers.Clock) -> None:
+    """Test that a request timing out at the deadline fails as exceeding it."""
+
+    def time_out() -> None:
+        clock.now += 10
+        raise requests.exceptions.Timeout
+
+    breaker = cherryservers_sdk_python.circuit_breaker.CircuitBreaker(minimum_calls=1)
+    client = _client.CherryApiClient(
+        "token", transport=_TimeoutRecordingTransport(time_out), breaker=breaker
+    )
+
+    with (
+        deadlines.Deadline(10, clock=clock),
+        pytest.raises(errors.DeadlineExceededError),
+    ):
+        client.get("regions")
+    assert breaker.states()["regions"].state == "closed"
+
+    with (
+        deadlines.Deadline(60, clock=clock),
+        pytest.raises(errors.RequestTimeoutError) as e,
+    ):
+        client.get("regions")
+    assert type(e.value) is errors.RequestTimeoutError
+    assert breaker.states()["regions"].state == "open"
+
+
+def test_hedged_requests_keep_deadline(clock: helpers.Clock) -> None:
+    """Test that hedged requests are sent under the caller's deadline."""
+    transport = _TimeoutRecordingTransport()
+    policy = hedging.HedgingPolicy()
+    client = _client.CherryApiClient("token", transport=transport, hedging=policy)
+    try:
+        with deadlines.Deadline(10, clock=clock) as deadline:
+            client.get("regions")
+    finally:
+        policy.close()
+
+    assert transport.deadlines == [deadline]
+    assert transport.timeouts == [10]
+
+
+def test_server_create_deadline(
+    clock: helpers.Clock,
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_project: cherryservers_sdk_python.projects.Project,
+) -> None:
+    """Test that waiting for a server to deploy ends at the deadline."""
+
+    def sleep(seconds: float) -> None:
+        clock.now += seconds
+
+    with (
+        mock.patch("time.sleep", side_effect=sleep),
+        deadlines.Deadline(120, clock=clock),
+        pytest.raises(errors.DeadlineExceededError),
+    ):
+        fake_facade.servers.create(
+            cherryservers_sdk_python.servers.CreationRequest(
+                region="LT-Siauliai", plan="e3_1240v3"
+            ),
+            fake_project.get_id(),
+        )
+
+    assert clock.now == 120  # noqa: PLR2004
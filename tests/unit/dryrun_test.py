@@ -0,0 +1,120 @@
+"""Unit tests for Cherry Servers Python SDK dry runs."""
+
+from __future__ import annotations
+
+import pytest
+
+import cherryservers_sdk_python
+from cherryservers_sdk_python import _resource_polling, cache, dryrun
+
+
+@pytest.fixture
+def dry_facade(
+    fake_api: cherryservers_sdk_python.fake_api.FakeCherryApi,
+) -> cherryservers_sdk_python.facade.CherryApiFacade:
+    """Initialize a dry-run facade backed by the fake API."""
+    return cherryservers_sdk_python.facade.CherryApiFacade(
+        "token", transport=fake_api, thread_safe=True, dry_run=True
+    )
+
+
+@pytest.mark.usefixtures("sleep")
+def test_dry_run(
+    dry_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_project: cherryservers_sdk_python.projects.Project,
+    fake_api: cherryservers_sdk_python.fake_api.FakeCherryApi,
+) -> None:
+    """Test that mutations are recorded, not sent, and estimated."""
+    server = fake_facade.servers.create(
+        cherryservers_sdk_python.servers.CreationRequest(
+            region="LT-Siauliai", plan="e3_1240v3", hostname="node"
+        ),
+        fake_project.get_id(),
+    )
+    history = _resource_polling.TransitionHistory()
+    history.record(300, "e3_1240v3", "LT-Siauliai", "create")
+    history.record(60, "e3_1240v3", "LT-Siauliai", "reboot")
+    # Replaced histories are not recorded to in dry-run mode either.
+    dry_facade.servers.transition_history = history
+    fake_api.request_counts.clear()
+
+    created = dry_facade.servers.create(
+        cherryservers_sdk_python.servers.CreationRequest(
+            region="LT-Siauliai", plan="e3_1240v3", hostname="new", tags={"a": "1"}
+        ),
+        fake_project.get_id(),
+    )
+    rebooted = dry_facade.servers.reboot(server.get_id())
+    dry_facade.servers.update(
+        server.get_id(),
+        cherryservers_sdk_python.servers.UpdateRequest(hostname="renamed"),
+    )
+    dry_facade.servers.delete(server.get_id())
+
+    assert created.get_model().hostname == "new"
+    assert created.get_model().tags == {"a": "1"}
+    assert rebooted.get_status() == "deployed"
+    assert fake_api.servers[server.get_id()]["hostname"] == "node"
+    assert {method for method, _ in fake_api.request_counts} == {"GET"}
+    assert history.estimate("e3_1240v3", "LT-Siauliai", "create") == 300  # noqa: PLR2004
+
+    plan = dry_facade.dry_run_plan()
+    assert [call.template for call in plan.mutations] == [
+        "POST projects/{id}/servers",
+        "POST servers/{id}/actions",
+        "PUT servers/{id}",
+        "DELETE servers/{id}",
+    ]
+    # Servers are already deployed in responses, only the update re-fetches.
+    assert plan.counts["GET servers/{id}"] == 1
+    assert plan.transition_time == 360  # noqa: PLR2004
+    assert plan.estimate() >= 360  # noqa: PLR2004
+    # The longest call, creating the server, bounds concurrent runs.
+    assert plan.estimate(concurrency=100) == 300.5  # noqa: PLR2004
+    assert not any(call.sent for call in plan.mutations)
+    assert plan.mutations[0].latency == 0.5  # noqa: PLR2004
+
+    with pytest.raises(cherryservers_sdk_python.errors.NotFoundError):
+        dry_facade.servers.get_by_id(server.get_id())
+
+
+def test_dry_run_keeps_cache(
+    fake_api: cherryservers_sdk_python.fake_api.FakeCherryApi,
+    fake_project: cherryservers_sdk_python.projects.Project,
+) -> None:
+    """Test that dry-run mutations do not change a shared response cache."""
+    response_cache = cache.MemoryCache()
+    real = cherryservers_sdk_python.facade.CherryApiFacade(
+        "token", transport=fake_api, response_cache=response_cache
+    )
+    server = real.servers.create(
+        cherryservers_sdk_python.servers.CreationRequest(
+            region="LT-Siauliai", plan="e3_1240v3", hostname="node"
+        ),
+        fake_project.get_id(),
+        wait_for_active=False,
+    )
+    real.servers.get_by_id(server.get_id())
+    dry = cherryservers_sdk_python.facade.CherryApiFacade(
+        "token", transport=fake_api, response_cache=response_cache, dry_run=True
+    )
+
+    dry.servers.update(
+        server.get_id(),
+        cherryservers_sdk_python.servers.UpdateRequest(hostname="renamed"),
+    )
+    fake_api.request_counts.clear()
+    real.servers.get_by_id(server.get_id())
+
+    assert not fake_api.request_counts
+    assert isinstance(dry.servers.transition_history, dryrun.ReadOnlyTransitionHistory)
+
+
+def test_not_in_dry_run(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+) -> None:
+    """Test that plans are only available in dry-run mode."""
+    assert fake_facade.dry_run is None
+    with pytest.raises(RuntimeError):
+        fake_facade.dry_run_plan()
@@ -0,0 +1,205 @@
+"""Fake Cherry Servers API tests."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+import requests
+
+import cherryservers_sdk_python
+from cherryservers_sdk_python import fake_api as fake_api_module
+
+if TYPE_CHECKING:
+    from tests.unit import helpers
+
+
+@pytest.fixture
+def server(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_project: cherryservers_sdk_python.projects.Project,
+    clock: helpers.Clock,
+) -> cherryservers_sdk_python.servers.Server:
+    """Initialize a deployed fake server."""
+    server = fake_facade.servers.create(
+        cherryservers_sdk_python.servers.CreationRequest(
+            region="LT-Siauliai",
+            plan="e3_1240v3",
+            image="ubuntu_24_04_64bit",
+            hostname="db-1",
+            tags={"role": "db"},
+        ),
+        fake_project.get_id(),
+        wait_for_active=False,
+    )
+    clock.now += 300
+    server.refresh()
+    return server
+
+
+def test_catalog(fake_facade: cherryservers_sdk_python.facade.CherryApiFacade) -> None:
+    """Test catalog endpoints."""
+    assert fake_facade.regions.get_all()
+    assert fake_facade.plans.list_by_team(1)
+    assert (
+        fake_facade.plans.get_by_id_or_slug("e3_1240v3").get_model().type == "baremetal"
+    )
+    assert fake_facade.images.list_by_plan("e3_1240v3")
+    assert fake_facade.backup_storages.list_backup_plans()
+
+
+def test_server_deployment(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_project: cherryservers_sdk_python.projects.Project,
+    clock: helpers.Clock,
+) -> None:
+    """Test server status transitions from pending to deployed."""
+    server = fake_facade.servers.create(
+        cherryservers_sdk_python.servers.CreationRequest(
+            region="LT-Siauliai", plan="B1-1-1gb-20s-shared"
+        ),
+        fake_project.get_id(),
+        wait_for_active=False,
+    )
+    assert server.get_status() == "pending"
+
+    clock.now += 100
+    server.refresh()
+    assert server.get_status() == "deploying"
+
+    clock.now += 200
+    server.refresh()
+    assert server.get_status() == "deployed"
+
+    model = server.get_model()
+    assert model.ip_addresses
+    assert model.ip_addresses[0].type == "primary-ip"
+    assert [
+        s.get_id() for s in fake_facade.servers.list_by_project(fake_project.get_id())
+    ] == [server.get_id()]
+
+
+def test_rescue_mode(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    server: cherryservers_sdk_python.servers.Server,
+    clock: helpers.Clock,
+) -> None:
+    """Test server rescue mode transitions."""
+    rescued = fake_facade.servers.enter_rescue_mode(
+        server.get_id(),
+        cherryservers_sdk_python.servers.EnterRescueModeRequest(
+            password="test"  # noqa: S106
+        ),
+        wait_for_active=False,
+    )
+    assert rescued.get_status() == "entering rescue mode"
+
+    clock.now += 60
+    rescued.refresh()
+    assert rescued.get_status() == "rescue mode"
+
+
+def test_storage_lifecycle(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_project: cherryservers_sdk_python.projects.Project,
+    server: cherryservers_sdk_python.servers.Server,
+    clock: helpers.Clock,
+    fake_api: fake_api_module.FakeCherryApi,
+) -> None:
+    """Test block storage attachment and resize."""
+    initial_size, resized_size = 10, 20
+    storage = fake_facade.block_storages.create(
+        cherryservers_sdk_python.block_storages.CreationRequest(
+            region="LT-Siauliai", size=initial_size
+        ),
+        fake_project.get_id(),
+    )
+    storage.attach(
+        cherryservers_sdk_python.block_storages.AttachRequest(attach_to=server.get_id())
+    )
+    attached_to = storage.get_model().attached_to
+    assert attached_to is not None
+    assert attached_to.id == server.get_id()
+
+    fake_api._update_storage(str(storage.get_id()), body={"size": resized_size})
+    assert storage.get_size() == initial_size
+    clock.now += 30
+    storage.refresh()
+    assert storage.get_size() == resized_size
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        storage.delete()
+    storage.detach()
+    storage.delete()
+    assert not fake_facade.block_storages.list_by_project(fake_project.get_id())
+
+
+def test_floating_ip_targeting(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_project: cherryservers_sdk_python.projects.Project,
+    server: cherryservers_sdk_python.servers.Server,
+) -> None:
+    """Test floating IP targeting to a server."""
+    ip = fake_facade.ips.create(
+        cherryservers_sdk_python.ips.CreationRequest(
+            region="LT-Siauliai", targeted_to=server.get_id()
+        ),
+        fake_project.get_id(),
+    )
+    targeted_to = ip.get_model().targeted_to
+    assert targeted_to is not None
+    assert targeted_to.id == server.get_id()
+
+    server.refresh()
+    assert ip.get_id() in [a.id for a in server.get_model().ip_addresses or []]
+
+    server.delete()
+    ip = fake_facade.ips.get_by_id(ip.get_id())
+    assert ip.get_model().targeted_to is None
+    assert [
+        i.get_id() for i in fake_facade.ips.list_by_project(fake_project.get_id())
+    ] == [ip.get_id()]
+
+
+def test_backup_storage(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    server: cherryservers_sdk_python.servers.Server,
+    clock: helpers.Clock,
+) -> None:
+    """Test backup storage deployment."""
+    backup = fake_facade.backup_storages.create(
+        cherryservers_sdk_python.backup_storages.CreationRequest(
+            region="LT-Siauliai", slug="backup_50"
+        ),
+        server.get_id(),
+        wait_for_active=False,
+    )
+    assert backup.get_status() == "pending"
+    clock.now += 300
+    backup.refresh()
+    assert backup.get_status() == "deployed"
+
+
+def test_injected_failures(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_api: fake_api_module.FakeCherryApi,
+) -> None:
+    """Test rate limiting and server error injection."""
+    fake_api.rate_limit_rate = 1.0
+    with pytest.raises(requests.exceptions.HTTPError, match="Too many requests"):
+        fake_facade.regions.get_all()
+
+    fake_api.rate_limit_rate = 0.0
+    fake_api.error_rate = 1.0
+    with pytest.raises(requests.exceptions.HTTPError, match="Internal server error"):
+        fake_facade.regions.get_all()
+
+    assert fake_api.request_counts["GET", "^regions$"] == 2  # noqa: PLR2004
+
+
+def test_not_found(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+) -> None:
+    """Test requesting a missing resource."""
+    with pytest.raises(requests.exceptions.HTTPError, match="not found"):
+        fake_facade.servers.get_by_id(1)
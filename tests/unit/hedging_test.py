@@ -0,0 +1,156 @@
+"""Unit tests for Cherry Servers Python SDK request hedging."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent import futures
+from typing import Any
+
+import requests
+
+from cherryservers_sdk_python import _client, hedging, transports
+
+
+def test_hedged_get() -> None:
+    """Test that a slow GET is hedged within the budget."""
+    slow = threading.Event()
+    calls = 0
+    lock = threading.Lock()
+
+    def handler(*_: object) -> tuple[int, Any]:
+        nonlocal calls
+        with lock:
+            calls += 1
+            first = calls % 2 == 1
+        if first:
+            slow.wait(2)
+        return 200, {"id": 1}
+
+    policy = hedging.HedgingPolicy(initial_delay=0.05, budget=0, max_tokens=1)
+    client = _client.CherryApiClient(
+        "token", transport=transports.InMemoryTransport(handler), hedging=policy
+    )
+    try:
+        started = time.monotonic()
+        assert client.get("servers/1").json() == {"id": 1}
+        assert time.monotonic() - started < 1
+        assert (policy.requests, policy.hedged) == (1, 1)
+
+        # The budget is spent, so the next slow request is not hedged.
+        threading.Timer(0.2, slow.set).start()
+        client.get("servers/1")
+        assert (policy.requests, policy.hedged) == (2, 1)
+    finally:
+        slow.set()
+        policy.close()
+
+
+def test_concurrency_not_capped_by_pool() -> None:
+    """Test that more GETs than pool workers are sent concurrently."""
+    concurrency = 8
+    in_flight = threading.Barrier(concurrency, timeout=2)
+
+    def handler(*_: object) -> tuple[int, Any]:
+        in_flight.wait()
+        return 200, {"id": 1}
+
+    policy = hedging.HedgingPolicy(initial_delay=5, max_workers=2)
+    client = _client.CherryApiClient(
+        "token",
+        transport=transports.InMemoryTransport(handler),
+        hedging=policy,
+    )
+    try:
+        with futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = [pool.submit(client.get, "servers/1") for _ in range(concurrency)]
+            assert all(r.result().json() == {"id": 1} for r in results)
+        assert (policy.requests, policy.hedged) == (concurrency, 0)
+    finally:
+        policy.close()
+
+
+def test_requests_reuse_threads() -> None:
+    """Test that requests are sent from the same threads, reusing sessions."""
+    threads: set[int] = set()
+
+    def handler(*_: object) -> tuple[int, Any]:
+        threads.add(threading.get_ident())
+        return 200, {"id": 1}
+
+    policy = hedging.HedgingPolicy()
+    client = _client.CherryApiClient(
+        "token", transport=transports.InMemoryTransport(handler), hedging=policy
+    )
+    try:
+        for _ in range(20):
+            client.get("servers/1")
+        assert len(threads) == 1
+        assert threading.get_ident() not in threads
+    finally:
+        policy.close()
+
+
+def test_busy_workers_send_from_caller() -> None:
+    """Test that requests beyond the worker limit are sent unhedged."""
+    release = threading.Event()
+    threads: list[int] = []
+
+    def handler(*_: object) -> tuple[int, Any]:
+        threads.append(threading.get_ident())
+        release.wait(2)
+        return 200, {"id": 1}
+
+    policy = hedging.HedgingPolicy(initial_delay=5, max_requests=1)
+    client = _client.CherryApiClient(
+        "token", transport=transports.InMemoryTransport(handler), hedging=policy
+    )
+    try:
+        with futures.ThreadPoolExecutor(max_workers=1) as pool:
+            first = pool.submit(client.get, "servers/1")
+            while not threads:
+                time.sleep(0.01)
+            threading.Timer(0.1, release.set).start()
+            client.get("servers/1")
+            first.result()
+        assert threads[1] == threading.get_ident()
+    finally:
+        release.set()
+        policy.close()
+
+
+def test_failed_attempt_hedge_succeeds() -> None:
+    """Test that a failed attempt does not hide a successful hedge."""
+    both_sent = threading.Barrier(2, timeout=2)
+    calls = 0
+    lock = threading.Lock()
+
+    def handler(*_: object) -> tuple[int, Any]:
+        nonlocal calls
+        with lock:
+            calls += 1
+            first = calls == 1
+        both_sent.wait()
+        if first:
+            raise requests.ConnectionError
+        return 200, {"id": 1}
+
+    policy = hedging.HedgingPolicy(initial_delay=0.05, max_tokens=1)
+    client = _client.CherryApiClient(
+        "token", transport=transports.InMemoryTransport(handler), hedging=policy
+    )
+    try:
+        assert client.get("servers/1").json() == {"id": 1}
+        assert policy.hedged == 1
+    finally:
+        policy.close()
+
+
+def test_delay_percentile() -> None:
+    """Test that the hedging delay follows recent endpoint latencies."""
+    policy = hedging.HedgingPolicy(percentile=90, min_delay=0.01)
+    for latency in range(1, 101):
+        policy._record("servers/{id}", latency / 100)
+    assert policy.delay("servers/{id}") == 0.9  # noqa: PLR2004
+    assert policy.delay("regions") == 1
+    policy.close()
@@ -16,3 +16,15 @@ def build_api_response(
     response.status_code = status_code
     response._content = json.dumps(resp_content).encode("utf-8")
     return response
+
+
+class Clock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        """Initialize clock at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Get current time."""
+        return self.now
@@ -0,0 +1,153 @@
+"""Unit tests for Cherry Servers Python SDK project inventory."""
+
+from __future__ import annotations
+
+import pytest
+
+import cherryservers_sdk_python
+
+
+@pytest.fixture
+def populated_project(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_project: cherryservers_sdk_python.projects.Project,
+) -> list[cherryservers_sdk_python.servers.Server]:
+    """Initialize a project with servers, IPs and storages."""
+    project_id = fake_project.get_id()
+    db, web = (
+        fake_facade.servers.create(
+            cherryservers_sdk_python.servers.CreationRequest(
+                region="LT-Siauliai",
+                plan="e3_1240v3",
+                hostname=hostname,
+                tags={"role": role, "env": "prod"},
+            ),
+            project_id,
+            wait_for_active=False,
+        )
+        for hostname, role in (("db-1", "db"), ("web-1", "web"))
+    )
+    fake_facade.ips.create(
+        cherryservers_sdk_python.ips.CreationRequest(
+            region="LT-Siauliai", targeted_to=db.get_id(), tags={"role": "vip"}
+        ),
+        project_id,
+    )
+    storage = fake_facade.block_storages.create(
+        cherryservers_sdk_python.block_storages.CreationRequest(
+            region="LT-Siauliai", size=10
+        ),
+        project_id,
+    )
+    storage.attach(
+        cherryservers_sdk_python.block_storages.AttachRequest(attach_to=db.get_id())
+    )
+    fake_facade.backup_storages.create(
+        cherryservers_sdk_python.backup_storages.CreationRequest(
+            region="LT-Siauliai", slug="backup_50"
+        ),
+        web.get_id(),
+        wait_for_active=False,
+    )
+    return [db, web]
+
+
+def test_fetch_snapshot(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_project: cherryservers_sdk_python.projects.Project,
+    populated_project: list[cherryservers_sdk_python.servers.Server],
+) -> None:
+    """Test fetching a project snapshot and querying its indexes."""
+    db, web = populated_project
+
+    snapshot = cherryservers_sdk_python.inventory.ProjectSnapshot.fetch(
+        fake_facade, fake_project.get_id()
+    )
+
+    assert {s.get_id() for s in snapshot.servers} == {db.get_id(), web.get_id()}
+    snapshot_db = snapshot.get_server(db.get_id())
+    assert snapshot_db is not None
+    assert snapshot.servers_by_hostname("db-1") == [snapshot_db]
+    assert snapshot.servers_with_tag("role", "db") == [snapshot_db]
+    assert len(snapshot.servers_with_tag("env")) == len(populated_project)
+
+    assert sorted(ip.get_model().type or "" for ip in snapshot.ips_of(db)) == [
+        "floating-ip",
+        "primary-ip",
+    ]
+    assert [ip.get_model().type for ip in snapshot.ips_with_tag("role")] == [
+        "floating-ip"
+    ]
+    assert len(snapshot.block_storages_of(db.get_id())) == 1
+    assert snapshot.block_storages_of(web) == []
+
+    backup = snapshot.backup_storage_of(web)
+    assert backup is not None
+    assert snapshot.backup_storage_of(db) is None
+
+
+def test_inventory_store(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_project: cherryservers_sdk_python.projects.Project,
+    populated_project: list[cherryservers_sdk_python.servers.Server],
+) -> None:
+    """Test querying an inventory store and keeping it up to date."""
+    db, web = populated_project
+    store = cherryservers_sdk_python.inventory.InventoryStore(fake_facade)
+    store.load_project(fake_project.get_id())
+
+    assert len(store.servers) == len(populated_project)
+    assert [m.id for m in store.servers.find(tags={"env": "prod"})] == [
+        db.get_id(),
+        web.get_id(),
+    ]
+    assert [
+        m.hostname
+        for m in store.servers.find(
+            tags={"role": "db"}, region="LT-Siauliai", plan="e3_1240v3"
+        )
+    ] == ["db-1"]
+    assert store.servers.find(status="deployed") == []
+    assert [m.type for m in store.ips.find(tags={"role": "vip"})] == ["floating-ip"]
+    assert len(store.ips.find(targeted_to=db.get_id())) == 2  # noqa: PLR2004
+
+    fake_facade.servers.update(
+        web.get_id(),
+        cherryservers_sdk_python.servers.UpdateRequest(tags={"role": "db"}),
+    )
+    assert [m.id for m in store.servers.find(tags={"role": "db"})] == [
+        db.get_id(),
+        web.get_id(),
+    ]
+    assert store.servers.find(tags={"env": "prod", "role": "web"}) == []
+
+    web.delete()
+    assert store.servers.get(web.get_id()) is None
+    assert [m.id for m in store.servers.find(tags={"role": "db"})] == [db.get_id()]
+
+    store.close()
+    fake_facade.servers.update(
+        db.get_id(),
+        cherryservers_sdk_python.servers.UpdateRequest(tags={"role": "cache"}),
+    )
+    assert [m.id for m in store.servers.find(tags={"role": "db"})] == [db.get_id()]
+
+
+def test_inventory_store_reload_prunes(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_project: cherryservers_sdk_python.projects.Project,
+    populated_project: list[cherryservers_sdk_python.servers.Server],
+) -> None:
+    """Test that reloading a project drops resources deleted elsewhere."""
+    db, web = populated_project
+    store = cherryservers_sdk_python.inventory.InventoryStore(fake_facade)
+    store.load_project(fake_project.get_id())
+    store.close()
+
+    web.delete()
+    assert store.servers.get(web.get_id()) is not None
+
+    store.load_project(fake_project.get_id())
+    assert store.servers.get(web.get_id()) is None
+    assert [m.id for m in store.servers.find(tags={"env": "prod"})] == [db.get_id()]
+    assert store.ips.find(targeted_to=web.get_id()) == []
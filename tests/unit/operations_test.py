@@ -0,0 +1,129 @@
+"""Unit tests for Cherry Servers Python SDK operation graphs."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+import cherryservers_sdk_python
+from cherryservers_sdk_python import operations
+
+if TYPE_CHECKING:
+    from unittest import mock
+
+
+@pytest.mark.usefixtures("sleep")
+def test_server_with_ip_and_volume(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_project: cherryservers_sdk_python.projects.Project,
+    fake_api: cherryservers_sdk_python.fake_api.FakeCherryApi,
+) -> None:
+    """Test passing created resources to the operations that depend on them."""
+    project_id = fake_project.get_id()
+    graph = fake_facade.operation_graph(max_workers=4)
+    server = graph.add(
+        "server",
+        lambda: fake_facade.servers.create(
+            cherryservers_sdk_python.servers.CreationRequest(
+                region="LT-Siauliai", plan="e3_1240v3"
+            ),
+            project_id,
+        ),
+    )
+    ip = graph.add(
+        "ip",
+        lambda server: fake_facade.ips.create(
+            cherryservers_sdk_python.ips.CreationRequest(
+                region="LT-Siauliai", targeted_to=server.get_id()
+            ),
+            project_id,
+        ),
+        server,
+    )
+    volume = graph.add(
+        "volume",
+        lambda: fake_facade.block_storages.create(
+            cherryservers_sdk_python.block_storages.CreationRequest(
+                region="LT-Siauliai", size=50
+            ),
+            project_id,
+        ),
+    )
+    graph.add(
+        "attach",
+        lambda volume, server: volume.attach(
+            cherryservers_sdk_python.block_storages.AttachRequest(
+                attach_to=server.get_id()
+            )
+        ),
+        volume,
+        server,
+        after=[ip],
+    )
+
+    result = graph.run()
+
+    assert result.ok
+    server_id = result.value(server).get_id()
+    assert fake_api.ips[result.value(ip).get_id()]["targeted_to"]["id"] == server_id
+    assert fake_api.storages[result.value(volume).get_id()]["attached_to"]["id"] == (
+        server_id
+    )
+
+
+def test_partial_failure() -> None:
+    """Test that dependents of failed operations are skipped."""
+
+    def fail() -> None:
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    graph = operations.OperationGraph()
+    failed = graph.add("failed", fail)
+    graph.add("dependent", lambda value: value, failed)
+    independent = graph.add("independent", lambda: 1)
+
+    result = graph.run()
+
+    assert [(r.name, r.outcome) for r in result.results.values()] == [
+        ("failed", "failed"),
+        ("dependent", "skipped"),
+        ("independent", "succeeded"),
+    ]
+    assert result.value(independent) == 1
+    assert isinstance(result.failed[0].error, RuntimeError)
+    with pytest.raises(operations.OperationGraphError, match="1 operations failed"):
+        result.raise_for_failures()
+    with pytest.raises(ValueError, match="duplicate operation name"):
+        graph.add("failed", lambda: None)
+
+
+def test_cancel() -> None:
+    """Test that no operations are started once the graph is cancelled."""
+    graph = operations.OperationGraph(max_workers=1)
+    started = threading.Event()
+
+    def cancel() -> None:
+        started.set()
+        graph.cancel()
+
+    graph.add("cancel", cancel)
+    graph.add("pending", lambda: None)
+
+    result = graph.run()
+
+    assert started.is_set()
+    assert graph.cancelled
+    assert [r.outcome for r in result.results.values()] == ["succeeded", "cancelled"]
+
+
+def test_rate_limit(sleep: mock.Mock) -> None:
+    """Test that operations are started at most at the given rate."""
+    graph = operations.OperationGraph(max_workers=4, rate=2)
+    for i in range(4):
+        graph.add(str(i), lambda: None)
+
+    assert graph.run().ok
+    assert sum(call.args[0] for call in sleep.call_args_list) == pytest.approx(1.5)
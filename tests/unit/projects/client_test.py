@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, cast
+from typing import Any, cast
+from unittest import mock
+
+import pytest
 
 import cherryservers_sdk_python.projects
 from tests.unit import helpers
 
-if TYPE_CHECKING:
-    from unittest import mock
-
 
 def test_get_by_id_success(
     simple_project: dict[str, Any],
@@ -142,3 +142,121 @@ def test_delete_success(
     cast("mock.Mock", projects_client._api_client.delete).assert_called_once_with(
         f"projects/{simple_project['id']}", None, projects_client._request_timeout
     )
+
+
+@pytest.fixture
+def populated_project(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_project: cherryservers_sdk_python.projects.Project,
+) -> cherryservers_sdk_python.projects.Project:
+    """Initialize a project with attached storages and floating IPs."""
+    project_id = fake_project.get_id()
+    for _ in range(2):
+        server = fake_facade.servers.create(
+            cherryservers_sdk_python.servers.CreationRequest(
+                region="LT-Siauliai", plan="e3_1240v3"
+            ),
+            project_id,
+            wait_for_active=False,
+        )
+        storage = fake_facade.block_storages.create(
+            cherryservers_sdk_python.block_storages.CreationRequest(
+                region="LT-Siauliai", size=10
+            ),
+            project_id,
+        )
+        storage.attach(
+            cherryservers_sdk_python.block_storages.AttachRequest(
+                attach_to=server.get_id()
+            )
+        )
+        fake_facade.ips.create(
+            cherryservers_sdk_python.ips.CreationRequest(
+                region="LT-Siauliai", targeted_to=server.get_id()
+            ),
+            project_id,
+        )
+        fake_facade.backup_storages.create(
+            cherryservers_sdk_python.backup_storages.CreationRequest(
+                region="LT-Siauliai", slug="backup_50"
+            ),
+            server.get_id(),
+            wait_for_active=False,
+        )
+    return fake_project
+
+
+def test_teardown(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_api: cherryservers_sdk_python.fake_api.FakeCherryApi,
+    populated_project: cherryservers_sdk_python.projects.Project,
+) -> None:
+    """Test deleting a project with all of its resources."""
+    fake_facade.projects.teardown(populated_project.get_id())
+
+    assert not fake_api.projects
+    assert not fake_api.servers
+    assert not fake_api.ips
+    assert not fake_api.storages
+    assert fake_api.request_counts["DELETE", r"^storages/(\d+)/attachments$"] == 2  # noqa: PLR2004
+
+
+def test_teardown_routed_ips(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_api: cherryservers_sdk_python.fake_api.FakeCherryApi,
+    populated_project: cherryservers_sdk_python.projects.Project,
+) -> None:
+    """Test that routed IPs are unrouted first and observers see deletions."""
+    project_id = populated_project.get_id()
+    floating = fake_facade.ips.list_by_project(project_id)
+    target = next(ip for ip in floating if ip.get_model().type == "floating-ip")
+    routed = fake_facade.ips.create(
+        cherryservers_sdk_python.ips.CreationRequest(
+            region="LT-Siauliai", routed_to=target.get_id()
+        ),
+        project_id,
+    )
+    store = cherryservers_sdk_python.inventory.InventoryStore(fake_facade)
+    store.load_project(project_id)
+    assert store.ips.get(routed.get_id()) is not None
+
+    fake_facade.projects.teardown(project_id)
+
+    assert not fake_api.ips
+    assert not fake_api.projects
+    assert len(store.servers) == 0
+    # Primary IP addresses are released by the API along with their servers.
+    assert store.ips.find(type="floating-ip") == []
+
+
+def test_teardown_requires_facade(
+    projects_client: cherryservers_sdk_python.projects.ProjectClient,
+) -> None:
+    """Test that a client created outside of a facade cannot tear down."""
+    with pytest.raises(RuntimeError):
+        projects_client.teardown(1)
+
+
+def test_teardown_failure(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_api: cherryservers_sdk_python.fake_api.FakeCherryApi,
+    populated_project: cherryservers_sdk_python.projects.Project,
+) -> None:
+    """Test that the project is kept if a teardown step fails."""
+    with (
+        mock.patch.object(
+            cherryservers_sdk_python.servers.ServerClient,
+            "delete",
+            side_effect=cherryservers_sdk_python.errors.ConflictError(
+                "busy", method="DELETE", endpoint="servers/1"
+            ),
+        ),
+        pytest.raises(cherryservers_sdk_python.projects.TeardownError) as e,
+    ):
+        fake_facade.projects.teardown(populated_project.get_id())
+
+    assert sorted(e.value.failures) == sorted(
+        f"delete server {server_id}" for server_id in fake_api.servers
+    )
+    assert not fake_api.storages
+    assert populated_project.get_id() in fake_api.projects
@@ -0,0 +1,176 @@
+"""Unit tests for Cherry Servers Python SDK desired-state reconciliation."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pydantic
+import pytest
+
+import cherryservers_sdk_python
+from cherryservers_sdk_python import reconcile
+
+_DESIRED: dict[str, list[dict[str, Any]]] = {
+    "servers": [
+        {
+            "hostname": "web-1",
+            "plan": "e3_1240v3",
+            "region": "LT-Siauliai",
+            "image": "ubuntu_24_04_64bit",
+            "tags": {"role": "web"},
+        },
+        {"hostname": "db-1", "plan": "e3_1240v3", "region": "LT-Siauliai"},
+    ],
+    "ips": [{"name": "lb", "region": "LT-Siauliai", "target": "web-1"}],
+    "volumes": [{"server": "db-1", "size": 100}],
+}
+
+
+@pytest.fixture
+def reconciler(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_project: cherryservers_sdk_python.projects.Project,
+) -> reconcile.Reconciler:
+    """Initialize a reconciler of the fake project."""
+    return reconcile.Reconciler(fake_facade, fake_project.get_id())
+
+
+@pytest.mark.usefixtures("sleep")
+def test_apply(
+    reconciler: reconcile.Reconciler,
+    fake_api: cherryservers_sdk_python.fake_api.FakeCherryApi,
+) -> None:
+    """Test reaching a desired state, then re-applying it for free."""
+    desired = reconcile.DesiredState.model_validate(_DESIRED)
+
+    plan = reconciler.apply(desired)
+
+    assert [change.key for change in plan.changes] == [
+        "create server web-1",
+        "create server db-1",
+        "create storage db-1",
+        "attach storage db-1",
+        "create ip lb",
+        "target ip lb",
+    ]
+    assert plan.changes[3].depends_on == ("create storage db-1", "create server db-1")
+    servers = {s["hostname"]: s for s in fake_api.servers.values()}
+    assert servers["web-1"]["tags"] == {"role": "web"}
+    assert servers["db-1"]["storage"]["size"] == 100  # noqa: PLR2004
+    floating = [ip for ip in fake_api.ips.values() if ip["type"] == "floating-ip"]
+    assert [ip["targeted_to"]["id"] for ip in floating] == [servers["web-1"]["id"]]
+    assert floating[0]["tags"] == {reconcile.NAME_TAG: "lb"}
+
+    fake_api.request_counts.clear()
+    plan = reconciler.plan(desired)
+    assert not plan
+    assert not plan.drift
+    assert sum(fake_api.request_counts.values()) == 4  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("sleep")
+def test_update_and_prune(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_project: cherryservers_sdk_python.projects.Project,
+    reconciler: reconcile.Reconciler,
+    fake_api: cherryservers_sdk_python.fake_api.FakeCherryApi,
+) -> None:
+    """Test updating resources in place and pruning the rest."""
+    reconciler.apply(reconcile.DesiredState.model_validate(_DESIRED))
+    desired = reconcile.DesiredState.model_validate(
+        {
+            "servers": [
+                {**_DESIRED["servers"][0], "tags": {"role": "api"}},
+                {
+                    "hostname": "db-1",
+                    "plan": "B1-1-1gb-20s-shared",
+                    "region": "LT-Siauliai",
+                },
+            ],
+            "ips": [{"name": "lb", "region": "LT-Siauliai", "target": "db-1"}],
+        }
+    )
+    extra = fake_facade.servers.create(
+        cherryservers_sdk_python.servers.CreationRequest(
+            region="LT-Siauliai", plan="e3_1240v3", hostname="old"
+        ),
+        fake_project.get_id(),
+    )
+
+    plan = reconcile.Reconciler(fake_facade, fake_project.get_id(), prune=True).plan(
+        desired
+    )
+    storage_id = next(iter(fake_api.storages))
+    assert [change.key for change in plan.changes] == [
+        "update server web-1",
+        f"detach storage {storage_id}",
+        f"delete storage {storage_id}",
+        "update ip lb",
+        f"delete server old {extra.get_id()}",
+    ]
+    assert plan.drift == ["server db-1: plan is e3_1240v3, not B1-1-1gb-20s-shared"]
+
+    plan.apply()
+
+    assert {s["hostname"]: s["tags"] for s in fake_api.servers.values()} == {
+        "web-1": {"role": "api"},
+        "db-1": {},
+    }
+    assert not fake_api.storages
+    assert not reconciler.plan(desired).changes
+
+
+@pytest.mark.usefixtures("sleep")
+def test_prune_server_with_kept_ip(
+    fake_facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    fake_project: cherryservers_sdk_python.projects.Project,
+    reconciler: reconcile.Reconciler,
+    fake_api: cherryservers_sdk_python.fake_api.FakeCherryApi,
+) -> None:
+    """Test that kept IPs are moved off pruned servers before they are deleted."""
+    reconciler.apply(reconcile.DesiredState.model_validate(_DESIRED))
+    web_id = next(
+        s["id"] for s in fake_api.servers.values() if s["hostname"] == "web-1"
+    )
+    desired = reconcile.DesiredState.model_validate(
+        {
+            "servers": [
+                {**_DESIRED["servers"][0], "hostname": "web-2"},
+                _DESIRED["servers"][1],
+            ],
+            "ips": [{"name": "lb", "region": "LT-Siauliai", "target": "web-2"}],
+            "volumes": _DESIRED["volumes"],
+        }
+    )
+
+    plan = reconcile.Reconciler(fake_facade, fake_project.get_id(), prune=True).plan(
+        desired
+    )
+
+    delete = plan.changes[-1]
+    assert delete.key == f"delete server web-1 {web_id}"
+    assert delete.depends_on == ("target ip lb",)
+
+    plan.apply()
+
+    floating = [ip for ip in fake_api.ips.values() if ip["type"] == "floating-ip"]
+    web_2 = next(s for s in fake_api.servers.values() if s["hostname"] == "web-2")
+    assert [ip["targeted_to"]["id"] for ip in floating] == [web_2["id"]]
+    assert web_id not in fake_api.servers
+
+
+def test_invalid_state() -> None:
+    """Test that references to unknown servers are rejected."""
+    with pytest.raises(pydantic.ValidationError, match="unknown server hostname: x"):
+        reconcile.DesiredState.model_validate(
+            {"volumes": [{"server": "x", "size": 10}]}
+        )
+    with pytest.raises(pydantic.ValidationError, match="duplicate IP address name"):
+        reconcile.DesiredState.model_validate(
+            {
+                "ips": [
+                    {"name": "lb", "region": "LT-Siauliai"},
+                    {"name": "lb", "region": "LT-Siauliai"},
+                ]
+            }
+        )
@@ -0,0 +1,30 @@
+"""Unit tests for Cherry Servers Python SDK resource polling."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from cherryservers_sdk_python import _resource_polling
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+def test_transition_history(tmp_path: pathlib.Path) -> None:
+    """Test estimating transition durations from recorded ones."""
+    path = tmp_path / "history.json"
+    history = _resource_polling.TransitionHistory(path, max_samples=3)
+    key = ("cloud_vps_1", "eu_nord_1", "create")
+
+    assert history.estimate(*key) is None
+    assert history.first_check_after(*key) == 0
+
+    for duration in (500, 100, 110, 120):
+        history.record(duration, *key)
+
+    assert history.estimate(*key) == 110  # noqa: PLR2004
+    assert history.first_check_after(*key) == 88  # noqa: PLR2004
+    assert history.estimate("cloud_vps_1", "eu_nord_1", "reboot") is None
+
+    reloaded = _resource_polling.TransitionHistory(path)
+    assert reloaded.estimate(*key) == 110  # noqa: PLR2004
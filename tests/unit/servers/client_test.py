@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import copy
 from operator import methodcaller
 from typing import TYPE_CHECKING, Any, cast
+from unittest import mock
 
 import pytest
 
@@ -13,7 +15,7 @@ from cherryservers_sdk_python import _base
 from tests.unit import helpers
 
 if TYPE_CHECKING:
-    from unittest import mock
+    from collections.abc import AsyncIterator
 
 
 def test_get_by_id_success(
@@ -101,6 +103,12 @@ def test_create_success(
 
     server = servers_client.create(creation_request, simple_server["project"]["id"])
 
+    assert (
+        servers_client.estimate_ready_time(
+            server.get_plan_slug(), server.get_region_slug(), "create"
+        )
+        is not None
+    )
     assert (
         server.get_model()
         == cherryservers_sdk_python.servers.ServerModel.model_validate(simple_server)
@@ -270,3 +278,70 @@ def test_actions(
         None,
         servers_client.request_timeout,
     )
+
+
+def _status_responses(server: dict[str, Any], statuses: list[str]) -> list[Any]:
+    return [
+        helpers.build_api_response(server | {"status": status}, 200)
+        for status in statuses
+    ]
+
+
+def test_watch(
+    simple_server: dict[str, Any],
+    servers_client: cherryservers_sdk_python.servers.ServerClient,
+) -> None:
+    """Test watching server status transitions."""
+    cast("mock.Mock", servers_client._api_client.get).side_effect = _status_responses(
+        simple_server, ["pending", "pending", "deploying", "deployed"]
+    )
+
+    with mock.patch("time.sleep") as sleep:
+        changes = list(servers_client.watch([simple_server["id"]]))
+
+    assert [(c.previous_status, c.status) for c in changes] == [
+        (None, "pending"),
+        ("pending", "deploying"),
+        ("deploying", "deployed"),
+    ]
+    assert all(c.server_id == simple_server["id"] for c in changes)
+    assert sleep.call_count == 4  # noqa: PLR2004
+
+
+def test_watch_timeout(
+    simple_server: dict[str, Any],
+    servers_client: cherryservers_sdk_python.servers.ServerClient,
+) -> None:
+    """Test watch timeout when the target status is not reached."""
+    cast(
+        "mock.Mock", servers_client._api_client.get
+    ).return_value = helpers.build_api_response(
+        simple_server | {"status": "pending"}, 200
+    )
+
+    watch = servers_client.watch([simple_server["id"]], timeout=1)
+    assert next(watch).status == "pending"
+    with pytest.raises(cherryservers_sdk_python._resource_polling.ResourceTimeoutError):
+        next(watch)
+
+
+def test_watch_async(
+    simple_server: dict[str, Any],
+    servers_client: cherryservers_sdk_python.servers.ServerClient,
+) -> None:
+    """Test watching server status transitions asynchronously."""
+    cast("mock.Mock", servers_client._api_client.get).side_effect = _status_responses(
+        simple_server, ["pending", "deployed"]
+    )
+
+    async def collect(
+        changes: AsyncIterator[cherryservers_sdk_python.servers.StatusChange],
+    ) -> list[str]:
+        return [change.status async for change in changes]
+
+    with mock.patch("asyncio.sleep", new=mock.AsyncMock()):
+        statuses = asyncio.run(
+            collect(servers_client.watch_async([simple_server["id"]]))
+        )
+
+    assert statuses == ["pending", "deployed"]
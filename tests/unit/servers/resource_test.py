@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import copy
+import sys
+import threading
+import time
+from concurrent import futures
 from operator import methodcaller
 from typing import TYPE_CHECKING, Any, cast
 
@@ -66,6 +70,24 @@ def test_update(
     )
 
 
+def test_update_unchanged(
+    server_resource: cherryservers_sdk_python.servers.Server,
+    simple_server: dict[str, Any],
+) -> None:
+    """Test that updating a server to its current values sends no requests."""
+    server_resource.update(
+        cherryservers_sdk_python.servers.UpdateRequest(
+            hostname=simple_server["hostname"],
+            tags=simple_server["tags"],
+            bgp=simple_server["bgp"]["enabled"],
+        )
+    )
+    server_resource.update(cherryservers_sdk_python.servers.UpdateRequest())
+
+    cast("mock.Mock", server_resource._client._api_client.put).assert_not_called()
+    cast("mock.Mock", server_resource._client._api_client.get).assert_not_called()
+
+
 def test_delete(
     server_resource: cherryservers_sdk_python.servers.Server,
     simple_server: dict[str, Any],
@@ -171,3 +193,76 @@ def test_actions(
         None,
         server_resource._client._request_timeout,
     )
+
+
+def test_concurrent_refresh(
+    server_resource: cherryservers_sdk_python.servers.Server,
+    simple_server: dict[str, Any],
+) -> None:
+    """Test that concurrent refreshes always leave a complete model."""
+    statuses = [f"status-{i}" for i in range(8)]
+    responses = []
+    for status in statuses:
+        server = copy.deepcopy(simple_server)
+        server["status"] = status
+        server["hostname"] = status
+        responses.append(helpers.build_api_response(server, 200))
+
+    cast("mock.Mock", server_resource._client._api_client.get).side_effect = lambda *_: (
+        responses[threading.get_ident() % len(responses)]
+    )
+
+    def refresh_and_read(_: int) -> tuple[str, str | None]:
+        server_resource.refresh()
+        model = server_resource.get_model()
+        return model.status, model.hostname
+
+    with futures.ThreadPoolExecutor(max_workers=32) as pool:
+        observed = list(pool.map(refresh_and_read, range(2000)))
+
+    assert all(status == hostname for status, hostname in observed)
+    assert server_resource.get_status() in statuses
+
+
+class _LastModel(_base.ResourceObserver):
+    """Observer remembering the last model it received."""
+
+    def __init__(self) -> None:
+        self.last: _base.ResourceModel | None = None
+
+    def resource_updated(self, model: _base.ResourceModel) -> None:
+        time.sleep(0)
+        self.last = model
+
+    def resource_deleted(self, resource_id: int | str) -> None:
+        """Ignore deletions."""
+
+
+def test_concurrent_updates_notified_in_order(
+    server_resource: cherryservers_sdk_python.servers.Server,
+    simple_server: dict[str, Any],
+) -> None:
+    """Test that observers receive concurrent updates in the order stored."""
+    models = [
+        cherryservers_sdk_python.servers.ServerModel.model_validate(
+            {**simple_server, "status": f"status-{i}"}
+        )
+        for i in range(8)
+    ]
+    observer = _LastModel()
+    server_resource._client.subscribe(observer)
+    start = threading.Barrier(len(models))
+
+    def update(model: cherryservers_sdk_python.servers.ServerModel) -> None:
+        start.wait()
+        server_resource._set_model(model)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with futures.ThreadPoolExecutor(max_workers=len(models)) as pool:
+            for _ in range(200):
+                list(pool.map(update, models))
+                assert observer.last is server_resource.get_model()
+    finally:
+        sys.setswitchinterval(interval)
@@ -22,24 +22,25 @@ def test_update(
     sshkey_resource: cherryservers_sdk_python.sshkeys.SSHKey,
     simple_sshkey: dict[str, Any],
 ) -> None:
-    """Test updating an SSH key resource."""
+    """Test updating an SSH key resource, sending only changed fields."""
     update_req = cherryservers_sdk_python.sshkeys.UpdateRequest(
-        label=simple_sshkey["label"],
+        label="updated-label",
         key=simple_sshkey["key"],
     )
+    updated_sshkey = {**simple_sshkey, "label": "updated-label"}
 
     cast(
         "mock.Mock", sshkey_resource._client._api_client.get
-    ).return_value = helpers.build_api_response(simple_sshkey, 200)
+    ).return_value = helpers.build_api_response(updated_sshkey, 200)
     cast(
         "mock.Mock", sshkey_resource._client._api_client.put
-    ).return_value = helpers.build_api_response(simple_sshkey, 201)
+    ).return_value = helpers.build_api_response(updated_sshkey, 201)
 
     sshkey_resource.update(update_req)
 
     assert (
         sshkey_resource.get_model()
-        == cherryservers_sdk_python.sshkeys.SSHKeyModel.model_validate(simple_sshkey)
+        == cherryservers_sdk_python.sshkeys.SSHKeyModel.model_validate(updated_sshkey)
     )
 
     cast("mock.Mock", sshkey_resource._client._api_client.get).assert_called_once_with(
@@ -50,12 +51,27 @@ def test_update(
 
     cast("mock.Mock", sshkey_resource._client._api_client.put).assert_called_once_with(
         f"ssh-keys/{simple_sshkey['id']}",
-        update_req,
+        cherryservers_sdk_python.sshkeys.UpdateRequest(label="updated-label"),
         None,
         sshkey_resource._client._request_timeout,
     )
 
 
+def test_update_unchanged(
+    sshkey_resource: cherryservers_sdk_python.sshkeys.SSHKey,
+    simple_sshkey: dict[str, Any],
+) -> None:
+    """Test that updating an SSH key to its current values sends no requests."""
+    sshkey_resource.update(
+        cherryservers_sdk_python.sshkeys.UpdateRequest(
+            label=simple_sshkey["label"], key=simple_sshkey["key"]
+        )
+    )
+
+    cast("mock.Mock", sshkey_resource._client._api_client.put).assert_not_called()
+    cast("mock.Mock", sshkey_resource._client._api_client.get).assert_not_called()
+
+
 def test_delete(
     sshkey_resource: cherryservers_sdk_python.sshkeys.SSHKey,
     simple_sshkey: dict[str, Any],
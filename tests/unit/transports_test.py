@@ -0,0 +1,216 @@
+"""Cherry Servers API transport tests."""
+
+from __future__ import annotations
+
+import json
+import threading
+from concurrent import futures
+from typing import TYPE_CHECKING, cast
+from unittest import mock
+
+import pytest
+import requests
+
+import cherryservers_sdk_python
+from cherryservers_sdk_python import _client, fake_api, transports
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestRequestsTransport:
+    """Test `requests` based transport."""
+
+    @pytest.fixture
+    def response(self) -> requests.Response:
+        """Initialize default response."""
+        return transports.build_response(200, b'{"result": "test"}', "test_url")
+
+    def test_send(self, response: requests.Response) -> None:
+        """Test sending a request through the shared session."""
+        transport = transports.RequestsTransport()
+        with mock.patch.object(transport, "_session") as session:
+            session.request.return_value = response
+            resp = transport.send(
+                "PUT",
+                "test_url",
+                params={"fields": "id"},
+                data="{}",
+                headers={"Authorization": "Bearer test"},
+                timeout=10,
+            )
+            session.request.assert_called_once_with(
+                "PUT",
+                "test_url",
+                params={"fields": "id"},
+                data="{}",
+                headers={"Authorization": "Bearer test"},
+                timeout=10,
+                allow_redirects=False,
+            )
+        assert resp is response
+
+    def test_thread_safe_sessions(self, response: requests.Response) -> None:
+        """Test that a thread-safe client uses one session per thread."""
+        client = _client.CherryApiClient("test_token", thread_safe=True)
+        sessions: dict[int, set[int]] = {}
+        lock = threading.Lock()
+
+        def new_session() -> mock.Mock:
+            session = mock.Mock()
+
+            def request(*_: object, **__: object) -> requests.Response:
+                with lock:
+                    sessions.setdefault(id(session), set()).add(threading.get_ident())
+                return response
+
+            session.request.side_effect = request
+            return session
+
+        workers = 16
+        with (
+            mock.patch.object(
+                client.transport, "_new_session", side_effect=new_session
+            ),
+            futures.ThreadPoolExecutor(max_workers=workers) as pool,
+        ):
+            results = list(
+                pool.map(lambda i: client.get(f"test_url/{i}"), range(workers * 100))
+            )
+
+        assert all(r is response for r in results)
+        assert len(sessions) <= workers
+        assert all(len(threads) == 1 for threads in sessions.values())
+
+    def test_close_thread_sessions(self) -> None:
+        """Test that closing closes the sessions of live threads."""
+        transport = transports.RequestsTransport(thread_safe=True)
+        with (
+            mock.patch.object(transport, "_session") as shared,
+            mock.patch.object(transport, "_new_session", side_effect=mock.Mock),
+            futures.ThreadPoolExecutor(max_workers=1) as pool,
+        ):
+            session = pool.submit(transport._get_session).result()
+            transport.close()
+        shared.close.assert_called_once_with()
+        cast("mock.Mock", session).close.assert_called_once_with()
+
+
+class TestInMemoryTransport:
+    """Test in-memory transport."""
+
+    def test_registered_response(self) -> None:
+        """Test that registered responses are served through the facade."""
+        transport = transports.InMemoryTransport()
+        transport.add_response(
+            "GET",
+            "https://api.cherryservers.com/v1/regions",
+            [{"id": 1, "slug": "LT-Siauliai"}],
+        )
+        facade = cherryservers_sdk_python.facade.CherryApiFacade(
+            "token", transport=transport
+        )
+
+        regions = facade.regions.get_all()
+
+        assert [r.get_model().slug for r in regions] == ["LT-Siauliai"]
+        assert transport.requests == [
+            ("GET", "https://api.cherryservers.com/v1/regions", None, None)
+        ]
+
+    def test_handler(self) -> None:
+        """Test that the handler produces responses for unregistered requests."""
+
+        def handler(
+            method: str, url: str, _: dict[str, str] | None, data: str | None
+        ) -> tuple[int, dict[str, object]]:
+            return 201, {"method": method, "url": url, "body": json.loads(data or "")}
+
+        transport = transports.InMemoryTransport(handler)
+        resp = transport.send(
+            "POST", "test_url", params=None, data='{"a": 1}', headers={}, timeout=1
+        )
+
+        assert resp.status_code == requests.codes.created
+        assert resp.json() == {"method": "POST", "url": "test_url", "body": {"a": 1}}
+
+    def test_not_found(self) -> None:
+        """Test that unknown requests result in an HTTP error."""
+        client = _client.CherryApiClient(
+            "token", transport=transports.InMemoryTransport()
+        )
+        with pytest.raises(requests.exceptions.HTTPError, match="Not found"):
+            client.get("servers/1")
+
+
+class TestRecordReplay:
+    """Test cassette recording and replay."""
+
+    @staticmethod
+    def _deploy_server(
+        facade: cherryservers_sdk_python.facade.CherryApiFacade,
+    ) -> list[str]:
+        project = facade.projects.create(
+            cherryservers_sdk_python.projects.CreationRequest(name="replay"), 1
+        )
+        server = facade.servers.create(
+            cherryservers_sdk_python.servers.CreationRequest(
+                region="LT-Siauliai", plan="B1-1-1gb-20s-shared"
+            ),
+            project.get_id(),
+            wait_for_active=False,
+        )
+        statuses = [server.get_status()]
+        while server.get_status() != "deployed":
+            server.refresh()
+            statuses.append(server.get_status())
+        return statuses
+
+    def test_replay(self, tmp_path: Path) -> None:
+        """Test that a recorded session replays identically offline."""
+        cassette = tmp_path / "deploy.jsonl.gz"
+        clock = iter(range(1000))
+        recorder = transports.RecordingTransport(
+            fake_api.FakeCherryApi(deploy_time=3, clock=lambda: next(clock)), cassette
+        )
+        recorded = self._deploy_server(
+            cherryservers_sdk_python.facade.CherryApiFacade("token", transport=recorder)
+        )
+        recorder.close()
+
+        replayed = self._deploy_server(
+            cherryservers_sdk_python.facade.CherryApiFacade(
+                "token", transport=transports.ReplayTransport(cassette)
+            )
+        )
+
+        assert recorded == replayed
+        assert recorded[0] != "deployed"
+
+    def test_replay_token_not_recorded(self, tmp_path: Path) -> None:
+        """Test that request headers are not written to the cassette."""
+        cassette = tmp_path / "regions.jsonl"
+        recorder = transports.RecordingTransport(fake_api.FakeCherryApi(), cassette)
+        cherryservers_sdk_python.facade.CherryApiFacade(
+            "secret-token", transport=recorder
+        ).regions.get_all()
+        recorder.close()
+
+        assert "secret-token" not in cassette.read_text()
+
+    def test_replay_mismatch(self, tmp_path: Path) -> None:
+        """Test that unrecorded and exhausted requests are rejected."""
+        cassette = tmp_path / "regions.jsonl"
+        recorder = transports.RecordingTransport(fake_api.FakeCherryApi(), cassette)
+        client = _client.CherryApiClient("token", transport=recorder)
+        client.get("regions")
+        recorder.close()
+
+        client = _client.CherryApiClient(
+            "token", transport=transports.ReplayTransport(cassette, repeat_last=False)
+        )
+        client.get("regions")
+        with pytest.raises(transports.CassetteMismatchError):
+            client.get("regions")
+        with pytest.raises(transports.CassetteMismatchError):
+            client.get("plans")